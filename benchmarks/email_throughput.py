@@ -0,0 +1,243 @@
+# benchmarks/email_throughput.py
+"""
+완결 알림 발송 경로(send_completion_notifications → send_many → SMTP 풀 / SendGrid)의 처리량 벤치마크.
+
+실제 공급자 대신 benchmarks/fake_email_servers.py의 로컬 대역 서버로 보내며,
+구독자 조회는 N개 작품 × 작품당 M명(서로 다른 사용자)의 합성 데이터로 대체합니다.
+
+사용 예:
+    python -m benchmarks.email_throughput --provider smtp --titles 20 --subscribers 200 --latency 0.005
+    python -m benchmarks.email_throughput --provider sendgrid --titles 5 --subscribers 2000 --min-throughput 500
+
+기준 미달 시 종료 코드 1로 끝나는 검사:
+- --max-connections / --min-pool-speedup: 실행 환경 속도와 무관한 상대 지표라 CI 게이트로 씁니다.
+  (pool speedup = 세션을 재사용하지 않는 순차 발송 대비 풀 발송의 소요 시간 비율, SMTP 전용)
+- --min-throughput / --max-p99-ms: 절대 수치라 공유 러너에서는 흔들리므로 참고용으로만 씁니다.
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import services.notification_service as notification_service
+from benchmarks.fake_email_servers import FakeSendGridServer, FakeSmtpServer
+from services.smtp_pool import SmtpConnectionPool
+
+
+class _LatencyRecorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = []
+
+    def add(self, seconds, count=1):
+        with self._lock:
+            self.samples.extend([seconds] * count)
+
+    def percentile(self, q):
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, max(0, int(round(q * len(ordered))) - 1))
+        return ordered[index]
+
+
+class _TimedPool:
+    """SMTP 풀의 sendmail 호출 시간을 메시지별 지연으로 기록합니다."""
+
+    def __init__(self, pool, recorder):
+        self._pool = pool
+        self._recorder = recorder
+
+    def __getattr__(self, name):
+        return getattr(self._pool, name)
+
+    def sendmail(self, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return self._pool.sendmail(*args, **kwargs)
+        finally:
+            self._recorder.add(time.perf_counter() - started)
+
+
+class _TimedSendGridClient:
+    """SendGrid 요청 시간을 요청에 포함된 personalization 수만큼의 메시지 지연으로 기록합니다."""
+
+    def __init__(self, client, recorder):
+        self._client = client
+        self._recorder = recorder
+
+    def send(self, mail):
+        count = max(1, len(mail.get().get("personalizations", [])))
+        started = time.perf_counter()
+        try:
+            return self._client.send(mail)
+        finally:
+            self._recorder.add(time.perf_counter() - started, count)
+
+
+def _synthetic_subscribers(subscribers_per_title):
+    def iter_subscribers(conn, content_keys):
+        keys = list(content_keys)
+        rows = []
+        for title_index, (content_id, source) in enumerate(keys):
+            for n in range(subscribers_per_title):
+                user_id = title_index * subscribers_per_title + n + 1
+                rows.append((user_id, content_id, source))
+        rows.sort()
+        for user_id, content_id, source in rows:
+            yield content_id, source, user_id, f"user{user_id}@example.com"
+
+    return iter_subscribers
+
+
+def _build_service(provider, server, pool_size, max_messages_per_session, recorder):
+    os.environ.setdefault("EMAIL_ADDRESS", "bench@example.com")
+    os.environ.setdefault("EMAIL_PASSWORD", "bench")
+    os.environ.setdefault("SENDGRID_API_KEY", "bench")
+
+    if provider == "smtp":
+        from services.smtp_service import SmtpService
+
+        pool = SmtpConnectionPool(
+            server.host,
+            server.port,
+            "bench@example.com",
+            "bench",
+            max_size=pool_size,
+            max_messages_per_session=max_messages_per_session,
+            use_tls=False,
+        )
+        return SmtpService(pool=_TimedPool(pool, recorder))
+
+    from sendgrid import SendGridAPIClient
+    from services.sendgrid_service import SendGridService
+
+    client = SendGridAPIClient(os.environ["SENDGRID_API_KEY"], host=server.url)
+    return SendGridService(client=_TimedSendGridClient(client, recorder))
+
+
+def run_benchmark(
+    provider="smtp",
+    titles=10,
+    subscribers=100,
+    latency=0.0,
+    failure_rate=0.0,
+    pool_size=4,
+    max_messages_per_session=100,
+    seed=1,
+):
+    """합성 완결 웨이브 하나를 발송하고 처리량/지연/연결 수를 dict로 반환합니다."""
+    if provider == "smtp":
+        server = FakeSmtpServer(latency=latency, failure_rate=failure_rate, seed=seed)
+    elif provider == "sendgrid":
+        server = FakeSendGridServer(latency=latency, failure_rate=failure_rate, seed=seed)
+    else:
+        raise ValueError(f"알 수 없는 provider: {provider}")
+
+    recorder = _LatencyRecorder()
+    items = [(f"bench-{i}", "benchmark", None, "crawler") for i in range(titles)]
+    all_content = {f"bench-{i}": {"title": f"벤치마크 작품 {i}"} for i in range(titles)}
+
+    original_iter = notification_service.iter_subscribers_for_contents
+    original_get_service = notification_service.get_email_service
+    with server:
+        service = _build_service(provider, server, pool_size, max_messages_per_session, recorder)
+        notification_service.iter_subscribers_for_contents = _synthetic_subscribers(subscribers)
+        notification_service.get_email_service = lambda: service
+        try:
+            started = time.perf_counter()
+            _, notified = notification_service.send_completion_notifications(None, items, all_content, "benchmark")
+            elapsed = time.perf_counter() - started
+        finally:
+            notification_service.iter_subscribers_for_contents = original_iter
+            notification_service.get_email_service = original_get_service
+            if hasattr(service, "close"):
+                service.close()
+
+        connections = server.connections if provider == "smtp" else len(server.requests) + server.failures
+        failures = server.failures
+
+    attempted = titles * subscribers
+    return {
+        "provider": provider,
+        "messages": attempted,
+        "delivered": notified,
+        "injected_failures": failures,
+        "elapsed_seconds": round(elapsed, 4),
+        "messages_per_second": round(attempted / elapsed, 1) if elapsed > 0 else None,
+        "p50_ms": round(recorder.percentile(0.50) * 1000, 2),
+        "p99_ms": round(recorder.percentile(0.99) * 1000, 2),
+        # SMTP: TCP 세션 수 / SendGrid: API 요청 수
+        "connections": connections,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="완결 알림 이메일 경로 처리량 벤치마크")
+    parser.add_argument("--provider", choices=["smtp", "sendgrid"], default="smtp")
+    parser.add_argument("--titles", type=int, default=10, help="완결 작품 수 (N)")
+    parser.add_argument("--subscribers", type=int, default=100, help="작품당 구독자 수 (M)")
+    parser.add_argument("--latency", type=float, default=0.0, help="대역 서버 응답 지연(초)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="대역 서버 실패 주입 확률")
+    parser.add_argument("--pool-size", type=int, default=4, help="SMTP 세션 풀 크기")
+    parser.add_argument("--max-messages-per-session", type=int, default=100)
+    parser.add_argument("--min-throughput", type=float, default=None, help="messages/sec 하한 (미달 시 실패)")
+    parser.add_argument("--max-p99-ms", type=float, default=None, help="메시지별 p99 지연 상한 (초과 시 실패)")
+    parser.add_argument(
+        "--max-connections", type=int, default=None,
+        help="SMTP 세션 수 / SendGrid 요청 수 상한 (초과 시 실패)",
+    )
+    parser.add_argument(
+        "--min-pool-speedup", type=float, default=None,
+        help="메시지마다 새 세션을 여는 순차 발송 대비 최소 속도 비율 (SMTP 전용, 미달 시 실패)",
+    )
+    args = parser.parse_args(argv)
+    if args.min_pool_speedup is not None and args.provider != "smtp":
+        parser.error("--min-pool-speedup은 smtp provider에서만 쓸 수 있습니다.")
+
+    result = run_benchmark(
+        provider=args.provider,
+        titles=args.titles,
+        subscribers=args.subscribers,
+        latency=args.latency,
+        failure_rate=args.failure_rate,
+        pool_size=args.pool_size,
+        max_messages_per_session=args.max_messages_per_session,
+    )
+    if args.min_pool_speedup is not None:
+        # 같은 러너·같은 웨이브에서 풀 없이(메시지마다 새 세션, 한 번에 하나씩) 보낸 기준선과 비교합니다.
+        baseline = run_benchmark(
+            provider=args.provider,
+            titles=args.titles,
+            subscribers=args.subscribers,
+            latency=args.latency,
+            failure_rate=args.failure_rate,
+            pool_size=1,
+            max_messages_per_session=1,
+        )
+        result["baseline_elapsed_seconds"] = baseline["elapsed_seconds"]
+        result["pool_speedup"] = round(baseline["elapsed_seconds"] / result["elapsed_seconds"], 2)
+    print(json.dumps(result, ensure_ascii=False))
+
+    failed = False
+    if args.max_connections is not None and result["connections"] > args.max_connections:
+        print(f"FAIL: 연결 {result['connections']}개 > {args.max_connections}개", file=sys.stderr)
+        failed = True
+    if args.min_pool_speedup is not None and result["pool_speedup"] < args.min_pool_speedup:
+        print(f"FAIL: 풀 속도 비율 {result['pool_speedup']}x < {args.min_pool_speedup}x", file=sys.stderr)
+        failed = True
+    if args.min_throughput is not None and (result["messages_per_second"] or 0) < args.min_throughput:
+        print(f"FAIL: 처리량 {result['messages_per_second']}/s < {args.min_throughput}/s", file=sys.stderr)
+        failed = True
+    if args.max_p99_ms is not None and result["p99_ms"] > args.max_p99_ms:
+        print(f"FAIL: p99 {result['p99_ms']}ms > {args.max_p99_ms}ms", file=sys.stderr)
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,265 @@
+# benchmarks/fake_email_servers.py
+"""
+이메일 경로 측정용 로컬 대역(stand-in) 서버.
+
+- FakeSmtpServer: EHLO/STARTTLS/AUTH PLAIN/MAIL/RCPT/DATA/RSET/NOOP/QUIT만 지원하는 최소 SMTP 서버
+- FakeSendGridServer: SendGrid v3 /v3/mail/send 엔드포인트 흉내
+
+둘 다 별도 스레드의 이벤트 루프에서 돌며, 받은 메시지를 기록하고
+지연(latency)과 실패(failure_rate)를 주입할 수 있습니다.
+"""
+import asyncio
+import random
+import threading
+import time
+
+from aiohttp import web
+
+
+class _BackgroundLoopServer:
+    """별도 스레드에서 asyncio 서버를 띄우고 내리는 공통 뼈대."""
+
+    def __init__(self, host, port, latency, failure_rate, seed):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._loop = None
+        self._thread = None
+        self._ready = threading.Event()
+        self._startup_error = None
+
+    async def _start(self):
+        raise NotImplementedError
+
+    async def _stop(self):
+        raise NotImplementedError
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_until_complete(self._start())
+        except Exception as e:
+            self._startup_error = e
+            self._ready.set()
+            return
+        self._ready.set()
+        self._loop.run_forever()
+        self._loop.run_until_complete(self._stop())
+        self._loop.close()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name=self.__class__.__name__, daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._startup_error is not None:
+            raise self._startup_error
+        return self
+
+    def stop(self):
+        if self._loop is not None and self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _should_fail(self):
+        with self._lock:
+            return self.failure_rate > 0 and self._random.random() < self.failure_rate
+
+
+class FakeSmtpServer(_BackgroundLoopServer):
+    """
+    기록용 최소 SMTP 서버.
+
+    Args:
+        latency: DATA 종료 후 응답 전 대기 시간(초).
+        failure_rate: DATA 종료 시 451(일시 오류)로 응답할 확률.
+        tls_context: 서버용 ssl.SSLContext. 지정하면 STARTTLS를 광고/지원합니다.
+        max_messages_per_session: 한 세션에서 이만큼 받은 뒤 421로 연결을 끊습니다 (None이면 무제한).
+    """
+
+    def __init__(
+        self,
+        host="127.0.0.1",
+        port=0,
+        *,
+        latency=0.0,
+        failure_rate=0.0,
+        tls_context=None,
+        max_messages_per_session=None,
+        seed=None,
+    ):
+        super().__init__(host, port, latency, failure_rate, seed)
+        self.tls_context = tls_context
+        self.max_messages_per_session = max_messages_per_session
+        self.messages = []  # [(mail_from, [rcpt], data)]
+        self.connections = 0
+        self.active_sessions = 0
+        self.max_active_sessions = 0
+        self.failures = 0
+        self._server = None
+
+    async def _start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def _stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        with self._lock:
+            self.connections += 1
+            self.active_sessions += 1
+            self.max_active_sessions = max(self.max_active_sessions, self.active_sessions)
+
+        async def reply(line):
+            writer.write(line.encode() + b"\r\n")
+            await writer.drain()
+
+        mail_from, rcpts, received = None, [], 0
+        try:
+            await reply("220 fake-smtp ready")
+            while True:
+                raw = await reader.readline()
+                if not raw:
+                    break
+                line = raw.decode("utf-8", "replace").rstrip("\r\n")
+                verb = line.split(" ", 1)[0].upper()
+
+                if verb in ("EHLO", "HELO"):
+                    extensions = ["250-fake-smtp", "250-8BITMIME", "250-AUTH PLAIN"]
+                    if self.tls_context is not None:
+                        extensions.append("250-STARTTLS")
+                    extensions.append("250 SMTPUTF8")
+                    for extension in extensions:
+                        writer.write(extension.encode() + b"\r\n")
+                    await writer.drain()
+                elif verb == "STARTTLS" and self.tls_context is not None:
+                    await reply("220 ready to start TLS")
+                    await writer.start_tls(self.tls_context)
+                elif verb == "AUTH":
+                    # 인증 정보는 검증하지 않습니다.
+                    await reply("235 2.7.0 authentication succeeded")
+                elif verb == "MAIL":
+                    mail_from, rcpts = line[10:].strip(), []
+                    await reply("250 OK")
+                elif verb == "RCPT":
+                    rcpts.append(line[8:].strip())
+                    await reply("250 OK")
+                elif verb == "DATA":
+                    await reply("354 end data with <CR><LF>.<CR><LF>")
+                    chunks = []
+                    while True:
+                        data_line = await reader.readline()
+                        if not data_line or data_line == b".\r\n":
+                            break
+                        chunks.append(data_line)
+                    if self.latency:
+                        await asyncio.sleep(self.latency)
+                    if self._should_fail():
+                        with self._lock:
+                            self.failures += 1
+                        await reply("451 4.3.0 injected failure")
+                    else:
+                        with self._lock:
+                            self.messages.append((mail_from, rcpts, b"".join(chunks)))
+                        await reply("250 OK queued")
+                    mail_from, rcpts = None, []
+                    received += 1
+                    if self.max_messages_per_session and received >= self.max_messages_per_session:
+                        await reply("421 4.7.0 too many messages, closing connection")
+                        break
+                elif verb == "RSET":
+                    mail_from, rcpts = None, []
+                    await reply("250 OK")
+                elif verb == "NOOP":
+                    await reply("250 OK")
+                elif verb == "QUIT":
+                    await reply("221 bye")
+                    break
+                else:
+                    await reply("502 command not implemented")
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            with self._lock:
+                self.active_sessions -= 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except Exception:
+                pass
+
+
+class FakeSendGridServer(_BackgroundLoopServer):
+    """
+    SendGrid v3 Mail Send API 흉내. 요청마다 personalization 수를 기록하고 202를 돌려줍니다.
+
+    Args:
+        latency: 요청당 응답 지연(초).
+        failure_rate: 500으로 응답할 확률.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, *, latency=0.0, failure_rate=0.0, seed=None):
+        super().__init__(host, port, latency, failure_rate, seed)
+        self.requests = []  # [payload dict]
+        self.failures = 0
+        self._runner = None
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def recipients(self):
+        with self._lock:
+            return [
+                to["email"]
+                for payload in self.requests
+                for personalization in payload.get("personalizations", [])
+                for to in personalization.get("to", [])
+            ]
+
+    async def _mail_send(self, request):
+        payload = await request.json()
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self._should_fail():
+            with self._lock:
+                self.failures += 1
+            return web.json_response({"errors": [{"message": "injected failure"}]}, status=500)
+        with self._lock:
+            self.requests.append(payload)
+        return web.Response(status=202)
+
+    async def _start(self):
+        app = web.Application(client_max_size=64 * 1024 * 1024)
+        app.router.add_post("/v3/mail/send", self._mail_send)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+
+    async def _stop(self):
+        await self._runner.cleanup()
+
+
+def wait_for(predicate, timeout=5.0, interval=0.01):
+    """조건이 참이 될 때까지 기다립니다 (서버 스레드 기록 반영 대기용)."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(interval)
+    return predicate()
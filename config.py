@@ -1,13 +1,65 @@
 # config.py
 import os
 
+# --- Database ---
+# 웹 서버 프로세스(gunicorn worker)마다 유지하는 연결 풀 설정
+DB_POOL_MIN_SIZE = int(os.getenv('DB_POOL_MIN_SIZE', 1))
+DB_POOL_MAX_SIZE = int(os.getenv('DB_POOL_MAX_SIZE', 10))
+DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', 5))  # 연결 대기 최대 시간(초)
+DB_POOL_HEALTHCHECK_INTERVAL = float(os.getenv('DB_POOL_HEALTHCHECK_INTERVAL', 30))  # 이 시간 이상 쉰 연결은 SELECT 1로 점검
+
 # --- Crawler ---
 CRAWLER_HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36'
 }
 
+# 크롤러 공용 HTTP 클라이언트 (crawlers/http_client.py)
+CRAWLER_HTTP_CONNECTION_LIMIT = int(os.getenv('CRAWLER_HTTP_CONNECTION_LIMIT', 20))
+CRAWLER_HTTP_LIMIT_PER_HOST = int(os.getenv('CRAWLER_HTTP_LIMIT_PER_HOST', 6))
+CRAWLER_HTTP_DNS_CACHE_TTL = int(os.getenv('CRAWLER_HTTP_DNS_CACHE_TTL', 300))
+CRAWLER_HTTP_KEEPALIVE_TIMEOUT = float(os.getenv('CRAWLER_HTTP_KEEPALIVE_TIMEOUT', 30))
+CRAWLER_HTTP_TIMEOUT = float(os.getenv('CRAWLER_HTTP_TIMEOUT', 30))
+CRAWLER_HTTP_MAX_ATTEMPTS = int(os.getenv('CRAWLER_HTTP_MAX_ATTEMPTS', 3))
+CRAWLER_HTTP_MAX_RETRY_AFTER = float(os.getenv('CRAWLER_HTTP_MAX_RETRY_AFTER', 60))  # Retry-After 상한(초)
+
+# 응답 캐시 모드: 'off' 또는 'revalidate'
+# revalidate: ETag/Last-Modified로 조건부 요청을 보내고, 304이거나 본문 해시가 같으면
+#             저장된 정규화 결과를 그대로 사용합니다 (JSON 파싱과 페이지 정규화 생략).
+CRAWLER_RESPONSE_CACHE_MODE = os.getenv('CRAWLER_RESPONSE_CACHE_MODE', 'off').lower()
+CRAWLER_RESPONSE_CACHE_DIR = os.getenv('CRAWLER_RESPONSE_CACHE_DIR', '.crawler_cache')
+
+# 수집 모드: 'full' 또는 'incremental'
+# incremental: 완결 목록을 훑다가 한 페이지 전체가 이미 '완결'로 기록된 작품이면 중단합니다.
+#              마지막 전체 수집 후 CRAWLER_FULL_SWEEP_INTERVAL_HOURS가 지나면 전체 수집으로 대사(reconcile)합니다.
+CRAWL_MODE = os.getenv('CRAWL_MODE', 'full').lower()
+CRAWLER_FULL_SWEEP_INTERVAL_HOURS = float(os.getenv('CRAWLER_FULL_SWEEP_INTERVAL_HOURS', 24 * 7))
+
+# run_all_crawlers.py 실행 방식: 'asyncio' (단일 이벤트 루프) 또는 'process' (크롤러별 프로세스 격리)
+CRAWLER_EXECUTOR = os.getenv('CRAWLER_EXECUTOR', 'asyncio').lower()
+CRAWLER_MAX_WORKERS = int(os.getenv('CRAWLER_MAX_WORKERS', 2))  # process 모드 동시 실행 크롤러 수
+CRAWLER_TIMEOUT_SECONDS = float(os.getenv('CRAWLER_TIMEOUT_SECONDS', 1800))  # process 모드 크롤러별 제한 시간
+
+# --- CDC ---
+# 신규 완결 감지 엔진: 'python' (스냅샷을 메모리에 로드) 또는 'sql' (스테이징 테이블 + 단일 SQL)
+CDC_ENGINE = os.getenv('CDC_ENGINE', 'python').lower()
+# 예약 완결(override_completed_at) 이벤트 발행 주체: 'crawler' (크롤러 실행 시 일괄 처리) 또는 'ticker' (scheduled_completion_ticker.py 상주 프로세스)
+SCHEDULED_COMPLETION_MODE = os.getenv('SCHEDULED_COMPLETION_MODE', 'crawler').lower()
+SCHEDULED_COMPLETION_CHANNEL = 'admin_override_changed'  # 관리자 override 변경 LISTEN/NOTIFY 채널
+SCHEDULED_COMPLETION_RESYNC_SECONDS = float(os.getenv('SCHEDULED_COMPLETION_RESYNC_SECONDS', 300))  # 알림 누락 대비 전체 재동기화 주기
+
 # --- Webtoon API ---
 NAVER_API_URL = "https://comic.naver.com/api/webtoon/titlelist"
+# 페이지네이션 동시 요청 수 및 초당 요청 수 (네이버 호스트 기준)
+NAVER_FETCH_CONCURRENCY = int(os.getenv('NAVER_FETCH_CONCURRENCY', 4))
+NAVER_RATE_LIMIT_PER_SEC = float(os.getenv('NAVER_RATE_LIMIT_PER_SEC', 10))
+KAKAO_RATE_LIMIT_PER_SEC = float(os.getenv('KAKAO_RATE_LIMIT_PER_SEC', 5))
+
+# 호스트별 초당 요청 수 (모든 크롤러가 공유하는 토큰 버킷)
+CRAWLER_DEFAULT_RATE_LIMIT_PER_SEC = float(os.getenv('CRAWLER_DEFAULT_RATE_LIMIT_PER_SEC', 5))
+CRAWLER_HOST_RATE_LIMITS = {
+    'comic.naver.com': NAVER_RATE_LIMIT_PER_SEC,
+    'gateway-kw.kakao.com': KAKAO_RATE_LIMIT_PER_SEC,
+}
 WEEKDAYS = {
     'mon': 'mon',
     'tue': 'tue',
@@ -27,3 +79,37 @@ EMAIL_PROVIDER = os.getenv('EMAIL_PROVIDER', 'smtp').lower()
 # [기존] SMTP 설정 (SmtpService가 사용)
 SMTP_SERVER = os.getenv('SMTP_SERVER', 'smtp.gmail.com')
 SMTP_PORT = int(os.getenv('SMTP_PORT', 587))
+SMTP_USE_TLS = os.getenv('SMTP_USE_TLS', 'true').lower() not in ('0', 'false', 'no')  # STARTTLS 사용 여부
+SMTP_TIMEOUT = float(os.getenv('SMTP_TIMEOUT', 30))
+SMTP_POOL_SIZE = int(os.getenv('SMTP_POOL_SIZE', 4))  # 동시에 유지할 인증된 SMTP 세션 수
+SMTP_MAX_MESSAGES_PER_SESSION = int(os.getenv('SMTP_MAX_MESSAGES_PER_SESSION', 100))  # 세션당 발송 상한 (도달 시 재접속)
+SMTP_IDLE_CHECK_SECONDS = float(os.getenv('SMTP_IDLE_CHECK_SECONDS', 30))  # 이보다 오래 쉰 세션은 NOOP으로 점검
+
+# SendGrid 일괄 발송 시 동시 API 요청 수
+SENDGRID_BULK_CONCURRENCY = int(os.getenv('SENDGRID_BULK_CONCURRENCY', 4))
+
+# --- Notification outbox ---
+NOTIFICATION_ENQUEUE_BATCH_SIZE = int(os.getenv('NOTIFICATION_ENQUEUE_BATCH_SIZE', 500))  # 한 번에 outbox로 적재할 cdc_events 수
+NOTIFICATION_DISPATCH_BATCH_SIZE = int(os.getenv('NOTIFICATION_DISPATCH_BATCH_SIZE', 200))  # 워커가 한 번에 선점할 outbox 행 수
+NOTIFICATION_DISPATCH_CONCURRENCY = int(os.getenv('NOTIFICATION_DISPATCH_CONCURRENCY', 8))  # 워커당 동시 발송 수
+NOTIFICATION_MAX_ATTEMPTS = int(os.getenv('NOTIFICATION_MAX_ATTEMPTS', 5))
+NOTIFICATION_RETRY_BASE_SECONDS = float(os.getenv('NOTIFICATION_RETRY_BASE_SECONDS', 60))
+NOTIFICATION_RETRY_MAX_SECONDS = float(os.getenv('NOTIFICATION_RETRY_MAX_SECONDS', 3600))
+NOTIFICATION_LEASE_SECONDS = float(os.getenv('NOTIFICATION_LEASE_SECONDS', 600))  # 'sending' 상태가 이보다 오래되면 다른 워커가 회수
+NOTIFICATION_POLL_INTERVAL_SECONDS = float(os.getenv('NOTIFICATION_POLL_INTERVAL_SECONDS', 10))
+
+# --- Reports ---
+REPORT_CLAIM_STALE_SECONDS = float(os.getenv('REPORT_CLAIM_STALE_SECONDS', 3600))  # 이보다 오래된 선점은 중단된 발송으로 보고 다시 선점
+
+# --- Contents API cache ---
+CONTENTS_CACHE_ENABLED = os.getenv('CONTENTS_CACHE_ENABLED', 'true').lower() not in ('0', 'false', 'no')
+CONTENTS_CACHE_MAX_ENTRIES = int(os.getenv('CONTENTS_CACHE_MAX_ENTRIES', 256))  # 프로세스 내 LRU 항목 수 (type × source × weekday × encoding)
+CONTENTS_CACHE_VERSION_TTL_SECONDS = float(os.getenv('CONTENTS_CACHE_VERSION_TTL_SECONDS', 5))  # 데이터 버전 재조회 주기
+CONTENTS_CACHE_SHARED_TTL_SECONDS = int(os.getenv('CONTENTS_CACHE_SHARED_TTL_SECONDS', 86400))  # 공유(Redis) 캐시 항목 만료
+REDIS_URL = os.getenv('REDIS_URL')  # 설정 시 프로세스 간 공유 캐시로 사용 (redis 패키지 필요)
+CONTENTS_SNAPSHOT_ENABLED = os.getenv('CONTENTS_SNAPSHOT_ENABLED', 'true').lower() not in ('0', 'false', 'no')  # 크롤 종료 시 응답 스냅샷 생성
+CONTENTS_SNAPSHOT_GZIP_LEVEL = int(os.getenv('CONTENTS_SNAPSHOT_GZIP_LEVEL', 9))
+CONTENTS_SNAPSHOT_BROTLI_QUALITY = int(os.getenv('CONTENTS_SNAPSHOT_BROTLI_QUALITY', 11))
+CONTENTS_DYNAMIC_COMPRESSION_LEVEL = int(os.getenv('CONTENTS_DYNAMIC_COMPRESSION_LEVEL', 5))  # 스냅샷이 없을 때 요청 경로 압축 수준
+CONTENTS_PAGE_SIZE_DEFAULT = int(os.getenv('CONTENTS_PAGE_SIZE_DEFAULT', 100))  # 휴재/완결 목록 기본 페이지 크기
+CONTENTS_PAGE_SIZE_MAX = int(os.getenv('CONTENTS_PAGE_SIZE_MAX', 500))  # per_page 상한
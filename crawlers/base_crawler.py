@@ -1,12 +1,24 @@
 #crawlers/base_crawler.py
+import csv
+import io
+import json
 from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
 
+import config
 from database import get_cursor
+from repositories.content_counts_repo import refresh_content_status_counts
+from repositories.content_versions_repo import bump_content_data_version
+from repositories.crawler_state_repo import load_crawler_state, save_crawler_state
+from services.cdc_sql_engine import detect_and_record_completions_sql
 from services.cdc_event_service import (
-    record_content_completed_event,
+    record_content_completed_events,
     record_due_scheduled_completions,
 )
-from services.final_state_resolver import resolve_final_state
+from services.final_state_resolver import resolve_completion_transitions
+from services.ongoing_contents_service import materialize_ongoing_snapshots
+from utils.content_hash import compute_content_hash
+from utils.record import read_field
 from utils.time import now_kst_naive
 
 
@@ -17,8 +29,21 @@ class ContentCrawler(ABC):
     데이터 수집, 동기화, 점검 로직을 구현해야 합니다.
     """
 
+    # 증분 수집(완결 목록 조기 종료)을 지원하는 크롤러는 True로 설정합니다.
+    supports_incremental = False
+
     def __init__(self, source_name):
         self.source_name = source_name
+        self.last_sync_stats = None
+        self.last_fetch_stats = None
+
+        # 증분 수집 계획 (run_daily_check에서 fetch_all_data 호출 전에 채워짐)
+        self.crawl_mode = "full"
+        self.known_completed_ids = set()
+        self.previous_high_water_mark = {}
+        self.high_water_mark = {}
+        self._hwm_reached = set()
+        self._crawl_state = {}
 
     @abstractmethod
     async def fetch_all_data(self):
@@ -35,13 +60,208 @@ class ContentCrawler(ABC):
         """
         raise NotImplementedError
 
+    def bulk_upsert_contents(self, conn, records):
+        """
+        콘텐츠 레코드를 집합 단위로 DB에 반영하는 공용 동기화 엔진입니다.
+
+        레코드를 COPY로 임시 스테이징 테이블에 흘려보낸 뒤, 단 한 번의
+        ``INSERT ... ON CONFLICT DO UPDATE``로 contents에 병합합니다.
+        각 행의 content_hash(제목/상태/정규화된 meta의 지문)가 DB와 같으면
+        병합 대상에서 제외하여 WAL, dead tuple, 인덱스 갱신을 만들지 않습니다.
+
+        Args:
+            conn: DB 연결 (commit은 run_daily_check에서 수행)
+            records: ``(content_id, content_type, title, status, meta_dict)`` 튜플의 iterable
+
+        Returns:
+            dict: {"inserted", "updated", "changed", "unchanged"} 건수
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        total = 0
+        for content_id, content_type, title, status, meta in records:
+            content_hash = compute_content_hash(content_type, title, status, meta)
+            writer.writerow((str(content_id), content_type, title, status, json.dumps(meta), content_hash))
+            total += 1
+
+        stats = {"inserted": 0, "updated": 0, "changed": 0, "unchanged": 0}
+        if total == 0:
+            return stats
+
+        cursor = get_cursor(conn)
+        try:
+            cursor.execute(
+                """
+                CREATE TEMP TABLE IF NOT EXISTS contents_sync_staging (
+                    content_id TEXT NOT NULL,
+                    content_type TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    meta JSONB,
+                    content_hash TEXT NOT NULL
+                ) ON COMMIT DROP
+                """
+            )
+            cursor.execute("TRUNCATE contents_sync_staging")
+
+            buffer.seek(0)
+            cursor.copy_expert(
+                "COPY contents_sync_staging (content_id, content_type, title, status, meta, content_hash) "
+                "FROM STDIN WITH (FORMAT csv)",
+                buffer,
+            )
+
+            cursor.execute(
+                """
+                WITH merged AS (
+                    INSERT INTO contents (content_id, source, content_type, title, status, meta, content_hash)
+                    SELECT s.content_id, %s, s.content_type, s.title, s.status, s.meta, s.content_hash
+                    FROM contents_sync_staging s
+                    LEFT JOIN contents c
+                        ON c.content_id = s.content_id AND c.source = %s
+                    WHERE c.content_hash IS DISTINCT FROM s.content_hash
+                    ON CONFLICT (content_id, source) DO UPDATE SET
+                        content_type = EXCLUDED.content_type,
+                        title = EXCLUDED.title,
+                        status = EXCLUDED.status,
+                        meta = EXCLUDED.meta,
+                        content_hash = EXCLUDED.content_hash
+                    WHERE contents.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+                    RETURNING (xmax = 0) AS inserted
+                )
+                SELECT
+                    COUNT(*) FILTER (WHERE inserted) AS inserted,
+                    COUNT(*) FILTER (WHERE NOT inserted) AS updated
+                FROM merged
+                """,
+                (self.source_name, self.source_name),
+            )
+            row = cursor.fetchone()
+        finally:
+            cursor.close()
+
+        stats["inserted"] = row["inserted"]
+        stats["updated"] = row["updated"]
+        stats["changed"] = stats["inserted"] + stats["updated"]
+        stats["unchanged"] = total - stats["changed"]
+        return stats
+
+    def _plan_crawl(self, conn, db_status_map, now):
+        """
+        증분 수집 여부를 결정하고, 조기 종료 판단에 필요한 정보를 준비합니다.
+
+        - 이미 '완결'로 기록된 content_id 집합 (known_completed_ids)
+        - 지난 실행의 high-water mark (목록 최상단 id 등)
+        - 마지막 전체 수집 후 일정 시간이 지났으면 전체 수집(full sweep)으로 전환
+        """
+        self._crawl_state = load_crawler_state(conn, self.source_name)
+        self.previous_high_water_mark = self._crawl_state.get("high_water_mark") or {}
+        self.high_water_mark = {}
+        self._hwm_reached = set()
+        self.known_completed_ids = {
+            str(content_id) for content_id, status in db_status_map.items() if status == "완결"
+        }
+
+        self.crawl_mode = "full"
+        if config.CRAWL_MODE == "incremental":
+            last_full_sweep_at = self._crawl_state.get("last_full_sweep_at")
+            if last_full_sweep_at:
+                elapsed = now - datetime.fromisoformat(last_full_sweep_at)
+                if elapsed < timedelta(hours=config.CRAWLER_FULL_SWEEP_INTERVAL_HOURS):
+                    self.crawl_mode = "incremental"
+        print(f"LOG: [{self.source_name}] 수집 모드: {self.crawl_mode}")
+
+    def should_stop_incremental(self, list_name, page_ids):
+        """
+        증분 모드에서 목록 페이지 수집을 멈춰도 되는지 판단합니다.
+
+        한 페이지 전체가 이미 '완결'로 기록된 작품이고, 지난 실행의 high-water mark
+        (목록 최상단 id)에 도달했거나 기록이 없으면 True를 반환합니다.
+        """
+        if self.crawl_mode != "incremental" or not page_ids:
+            return False
+        page_ids = [str(content_id) for content_id in page_ids]
+        if not all(content_id in self.known_completed_ids for content_id in page_ids):
+            return False
+        previous_top_ids = set(self.previous_high_water_mark.get(list_name) or [])
+        if previous_top_ids and list_name not in self._hwm_reached:
+            return False
+        return True
+
+    def record_high_water_mark(self, list_name, page_number, page_ids):
+        """목록 페이지를 처리하면서 high-water mark를 갱신하고 지난 mark 도달 여부를 기록합니다."""
+        page_ids = [str(content_id) for content_id in page_ids]
+        if page_number == 1:
+            self.high_water_mark[list_name] = page_ids[:20]
+        previous_top_ids = set(self.previous_high_water_mark.get(list_name) or [])
+        if previous_top_ids & set(page_ids):
+            self._hwm_reached.add(list_name)
+
+    def _next_crawl_state(self, now):
+        state = dict(self._crawl_state)
+        state["last_run_at"] = now.isoformat()
+        state["last_run_mode"] = self.crawl_mode
+        if self.high_water_mark:
+            state["high_water_mark"] = {**self.previous_high_water_mark, **self.high_water_mark}
+        if self.crawl_mode == "full":
+            state["last_full_sweep_at"] = now.isoformat()
+        return state
+
+    def _detect_completions_in_python(self, conn, db_status_map, override_map, current_status_map, now):
+        """
+        Python 엔진: 메모리에 올린 스냅샷으로 신규 완결을 판정하고 CDC 이벤트를 기록합니다.
+
+        Returns:
+            list[tuple]: ``(content_id, final_completed_at, resolved_by, inserted)``
+        """
+        # Ids missing from today's fetch keep their previous final status (stability for partial fetch).
+        content_ids = list(set(db_status_map) | set(override_map) | set(current_status_map))
+        overrides = [override_map.get(content_id) for content_id in content_ids]
+        transitions = resolve_completion_transitions(
+            content_ids,
+            [db_status_map.get(content_id) for content_id in content_ids],
+            [current_status_map.get(content_id) for content_id in content_ids],
+            [read_field(override, "override_status") for override in overrides],
+            [read_field(override, "override_completed_at") for override in overrides],
+            now=now,
+        )
+
+        inserted_keys = record_content_completed_events(
+            conn,
+            [
+                (content_id, self.source_name, final_completed_at, resolved_by)
+                for content_id, final_completed_at, resolved_by in transitions
+            ],
+        )
+        return [
+            (content_id, final_completed_at, resolved_by, (content_id, self.source_name) in inserted_keys)
+            for content_id, final_completed_at, resolved_by in transitions
+        ]
+
+    def _materialize_snapshots(self, conn):
+        """커밋된 데이터로 /api/contents/ongoing 스냅샷을 다시 만들고 별도로 커밋합니다."""
+        try:
+            written = materialize_ongoing_snapshots(conn, self.source_name)
+            conn.commit()
+            print(f"LOG: [{self.source_name}] 응답 스냅샷 {written}개를 저장했습니다.")
+            return written
+        except Exception as e:
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            print(f"WARN: [{self.source_name}] 응답 스냅샷 생성 실패 (요청 시 DB에서 직접 생성됩니다): {e}")
+            return 0
+
     async def run_daily_check(self, conn):
         """
         일일 데이터 점검 및 CDC 이벤트 기록 프로세스 실행.
 
-        1) DB 스냅샷 로드 (Final State)
+        1) DB 스냅샷 로드 (raw status + override) - python 엔진만
         2) 원격 데이터 수집(fetch_all_data)
         3) 신규 완결 감지 및 CDC 이벤트 기록 (Final-State CDC)
+           - python 엔진: resolve_completion_transitions로 일괄 판정
+           - sql 엔진: 오늘 수집분을 스테이징 테이블에 넣고 SQL 한 번으로 판정/기록 (config.CDC_ENGINE)
         4) DB 동기화(synchronize_database)
 
         트랜잭션 경계:
@@ -53,85 +273,78 @@ class ContentCrawler(ABC):
             cursor = get_cursor(conn)
 
             now = now_kst_naive()
+            use_sql_engine = config.CDC_ENGINE == "sql"
 
-            # 1) Load previous crawler status snapshot (raw)
-            cursor.execute("SELECT content_id, status FROM contents WHERE source = %s", (self.source_name,))
-            db_status_map = {row["content_id"]: row["status"] for row in cursor.fetchall()}
+            db_status_map, override_map = {}, {}
+            if use_sql_engine:
+                # The snapshot stays in the DB; only completed ids are needed for incremental crawling.
+                if self.supports_incremental:
+                    cursor.execute(
+                        "SELECT content_id FROM contents WHERE source = %s AND status = '완결'",
+                        (self.source_name,),
+                    )
+                    self._plan_crawl(conn, {row["content_id"]: "완결" for row in cursor.fetchall()}, now)
+            else:
+                # 1) Load previous crawler status snapshot (raw)
+                cursor.execute("SELECT content_id, status FROM contents WHERE source = %s", (self.source_name,))
+                db_status_map = {row["content_id"]: row["status"] for row in cursor.fetchall()}
 
-            # 2) Load overrides (overlay)
-            cursor.execute(
-                "SELECT content_id, override_status, override_completed_at "
-                "FROM admin_content_overrides WHERE source = %s",
-                (self.source_name,),
-            )
-            override_map = {row["content_id"]: row for row in cursor.fetchall()}
+                if self.supports_incremental:
+                    self._plan_crawl(conn, db_status_map, now)
 
-            # 3) Resolve previous final states
-            db_state_before_sync = {}
-            for content_id in set(db_status_map.keys()) | set(override_map.keys()):
-                db_state_before_sync[content_id] = resolve_final_state(
-                    db_status_map.get(content_id), override_map.get(content_id)
+                # Load overrides (overlay)
+                cursor.execute(
+                    "SELECT content_id, override_status, override_completed_at "
+                    "FROM admin_content_overrides WHERE source = %s",
+                    (self.source_name,),
                 )
+                override_map = {row["content_id"]: row for row in cursor.fetchall()}
 
-            # 4) Fetch today's data
+            # 2) Fetch today's data
             ongoing_today, hiatus_today, finished_today, all_content_today = await self.fetch_all_data()
 
-            # 5) Build current raw status map (from today's fetch)
+            # Build current raw status map (from today's fetch)
+            # content_id is stored as TEXT, so normalize ids coming from the API (e.g. Naver int titleId).
             current_status_map = {}
             for content_id in all_content_today.keys():
                 if content_id in finished_today:
-                    current_status_map[content_id] = "완결"
+                    current_status_map[str(content_id)] = "완결"
                 elif content_id in hiatus_today:
-                    current_status_map[content_id] = "휴재"
+                    current_status_map[str(content_id)] = "휴재"
                 elif content_id in ongoing_today:
-                    current_status_map[content_id] = "연재중"
-
-            # Fill missing ids with previous known final status (stability for partial fetch)
-            for content_id, previous_state in db_state_before_sync.items():
-                current_status_map.setdefault(content_id, previous_state["final_status"])
+                    current_status_map[str(content_id)] = "연재중"
 
-            # 6) Resolve current final states
-            current_final_state_map = {}
-            for content_id in set(current_status_map.keys()) | set(override_map.keys()):
-                current_final_state_map[content_id] = resolve_final_state(
-                    current_status_map.get(content_id), override_map.get(content_id)
+            # 3) Final-State CDC: newly completed + record events
+            if use_sql_engine:
+                completions = detect_and_record_completions_sql(conn, self.source_name, current_status_map, now)
+            else:
+                completions = self._detect_completions_in_python(
+                    conn, db_status_map, override_map, current_status_map, now
                 )
 
-            # 7) Final-State CDC: newly completed + record events
             newly_completed_items = []
             cdc_events_inserted_count = 0
             cdc_events_inserted_items = []
 
-            for content_id, current_final_state in current_final_state_map.items():
-                previous_final_state = db_state_before_sync.get(content_id, {"final_status": None})
-
-                if previous_final_state.get("final_status") != "완결" and current_final_state["final_status"] == "완결":
-                    final_completed_at = current_final_state.get("final_completed_at")
-                    display_completed_at = (
-                        final_completed_at.isoformat()
-                        if hasattr(final_completed_at, "isoformat")
-                        else final_completed_at
-                    )
+            for content_id, final_completed_at, resolved_by, inserted in completions:
+                display_completed_at = (
+                    final_completed_at.isoformat()
+                    if hasattr(final_completed_at, "isoformat")
+                    else final_completed_at
+                )
 
-                    newly_completed_items.append(
-                        (
-                            content_id,
-                            self.source_name,
-                            display_completed_at,
-                            current_final_state.get("resolved_by"),
-                        )
+                newly_completed_items.append(
+                    (
+                        content_id,
+                        self.source_name,
+                        display_completed_at,
+                        resolved_by,
                     )
+                )
 
-                    inserted = record_content_completed_event(
-                        conn,
-                        content_id=content_id,
-                        source=self.source_name,
-                        final_completed_at=final_completed_at,
-                        resolved_by=current_final_state.get("resolved_by"),
-                    )
-                    if inserted:
-                        cdc_events_inserted_count += 1
-                        cdc_events_inserted_items.append(content_id)
+                if inserted:
+                    cdc_events_inserted_count += 1
+                    cdc_events_inserted_items.append(content_id)
 
             resolved_by_counts = {}
             for _, _, _, resolved_by in newly_completed_items:
@@ -139,25 +352,41 @@ class ContentCrawler(ABC):
 
             cdc_info = {
                 "cdc_mode": "final_state",
+                "cdc_engine": "sql" if use_sql_engine else "python",
                 "newly_completed_count": len(newly_completed_items),
                 "resolved_by_counts": resolved_by_counts,
                 "cdc_events_inserted_count": cdc_events_inserted_count,
                 "cdc_events_inserted_items": cdc_events_inserted_items,
             }
 
-            scheduled_completion_cdc = record_due_scheduled_completions(conn, cursor, now)
-            cdc_info["scheduled_completion_due_count"] = scheduled_completion_cdc["due_count"]
-            cdc_info["scheduled_completion_events_inserted_count"] = scheduled_completion_cdc[
-                "inserted_count"
-            ]
-            cdc_info["cdc_events_inserted_count"] += scheduled_completion_cdc["inserted_count"]
+            # 예약 완결은 ticker 모드에서는 상주 프로세스가 담당하므로 건너뜁니다.
+            cdc_info["scheduled_completion_mode"] = config.SCHEDULED_COMPLETION_MODE
+            if config.SCHEDULED_COMPLETION_MODE != "ticker":
+                scheduled_completion_cdc = record_due_scheduled_completions(conn, cursor, now)
+                cdc_info["scheduled_completion_due_count"] = scheduled_completion_cdc["due_count"]
+                cdc_info["scheduled_completion_events_inserted_count"] = scheduled_completion_cdc[
+                    "inserted_count"
+                ]
+                cdc_info["cdc_events_inserted_count"] += scheduled_completion_cdc["inserted_count"]
 
-            # 8) DB sync (commit is enforced here, not in crawler implementations)
+            # 4) DB sync (commit is enforced here, not in crawler implementations)
             added = self.synchronize_database(conn, all_content_today, ongoing_today, hiatus_today, finished_today)
 
-            # 9) Single commit here (forced)
+            if self.supports_incremental:
+                save_crawler_state(conn, self.source_name, self._next_crawl_state(now))
+
+            # API 응답 캐시가 이 소스의 항목을 무효화하도록 데이터 버전을 같은 트랜잭션에서 올립니다.
+            bump_content_data_version(conn, self.source_name)
+            # 목록 API의 total은 COUNT(*) 대신 이 집계를 읽습니다.
+            refresh_content_status_counts(conn, self.source_name)
+
+            # 5) Single commit here (forced)
             conn.commit()
 
+            # 6) API 응답 스냅샷 (실패해도 크롤 결과는 이미 커밋됨)
+            if config.CONTENTS_SNAPSHOT_ENABLED:
+                cdc_info["snapshots_written"] = self._materialize_snapshots(conn)
+
             return added, newly_completed_items, cdc_info
 
         except Exception:
@@ -0,0 +1,204 @@
+# crawlers/http_client.py
+import asyncio
+import hashlib
+import json
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+
+import aiohttp
+
+import config
+from .rate_limit import get_host_limiter
+from .response_cache import ResponseCache
+
+try:  # aiohttp는 Brotli 패키지가 있을 때만 br 응답을 해제할 수 있습니다.
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+_VALIDATOR_HEADERS = ("If-None-Match", "If-Modified-Since")
+
+
+class UnexpectedNotModifiedError(RuntimeError):
+    """조건 없는 요청에도 서버가 304를 돌려줘 사용할 본문이 없을 때 발생합니다."""
+
+
+def _has_validators(headers):
+    return any(name.lower() in {h.lower() for h in _VALIDATOR_HEADERS} for name in headers)
+
+
+def _without_validators(headers):
+    validators = {h.lower() for h in _VALIDATOR_HEADERS}
+    return {name: value for name, value in headers.items() if name.lower() not in validators}
+
+
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+THROTTLE_STATUSES = {429, 503}
+
+
+def parse_retry_after(value):
+    """Retry-After 헤더(초 또는 HTTP-date)를 대기 초로 변환합니다. 해석할 수 없으면 None."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _backoff_seconds(attempt):
+    # 2초에서 시작해 최대 10초까지 늘어나는 지수 백오프
+    return min(10.0, max(2.0, 2.0 ** attempt))
+
+
+class CrawlerHttpClient:
+    """
+    모든 크롤러가 공유하는 HTTP 클라이언트 계층입니다.
+
+    - keep-alive, 호스트별 연결 수 제한, DNS 캐시가 설정된 TCPConnector
+    - 호스트별 토큰 버킷으로 요청 속도 제한 (프로세스 전역 공유)
+    - 429/503의 Retry-After를 존중하는 재시도, 그 외 일시 오류는 지수 백오프
+    - gzip/brotli 압축 응답 수신
+    - (선택) 디스크 응답 캐시를 이용한 조건부 요청 및 파싱/정규화 생략
+
+    사용 예::
+
+        async with CrawlerHttpClient(headers=HEADERS) as client:
+            data = await client.get_json(url, params={...})
+    """
+
+    def __init__(self, headers=None, cookies=None, cache=None):
+        self.headers = {"Accept-Encoding": ACCEPT_ENCODING, **(headers or {})}
+        self.cookies = cookies
+        self.max_attempts = max(1, config.CRAWLER_HTTP_MAX_ATTEMPTS)
+        if cache is None and config.CRAWLER_RESPONSE_CACHE_MODE == 'revalidate':
+            cache = ResponseCache(config.CRAWLER_RESPONSE_CACHE_DIR)
+        self.cache = cache
+        self.stats = {"requests": 0, "not_modified": 0, "unchanged_body": 0, "fetched": 0}
+        self._session = None
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(
+            limit=config.CRAWLER_HTTP_CONNECTION_LIMIT,
+            limit_per_host=config.CRAWLER_HTTP_LIMIT_PER_HOST,
+            ttl_dns_cache=config.CRAWLER_HTTP_DNS_CACHE_TTL,
+            keepalive_timeout=config.CRAWLER_HTTP_KEEPALIVE_TIMEOUT,
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            headers=self.headers,
+            cookies=self.cookies,
+            timeout=aiohttp.ClientTimeout(total=config.CRAWLER_HTTP_TIMEOUT),
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self._session.close()
+        self._session = None
+
+    async def get_json(self, url, params=None, headers=None, transform=None):
+        """
+        GET 요청을 보내고 JSON 본문(또는 ``transform(json)`` 결과)을 반환합니다.
+        재시도가 모두 실패하면 마지막 예외를 올립니다.
+
+        응답 캐시가 켜져 있으면 304 응답이나 본문 해시가 이전과 같은 응답에 대해
+        JSON 파싱과 ``transform``을 건너뛰고 저장된 결과를 반환합니다.
+        ``transform``의 결과는 JSON 직렬화가 가능해야 합니다.
+        """
+        limiter = get_host_limiter(urlsplit(url).hostname)
+
+        cache_key, cached = None, None
+        request_headers = dict(headers or {})
+        if self.cache is not None:
+            cache_key = ResponseCache.make_key(url, params)
+            cached = self.cache.load(cache_key)
+            if cached:
+                if cached.get("etag"):
+                    request_headers["If-None-Match"] = cached["etag"]
+                if cached.get("last_modified"):
+                    request_headers["If-Modified-Since"] = cached["last_modified"]
+
+        unconditional_retry_done = False
+        attempt = 0
+        while attempt < self.max_attempts:
+            attempt += 1
+            await limiter.acquire()
+            self.stats["requests"] += 1
+            try:
+                async with self._session.get(url, params=params, headers=request_headers) as response:
+                    if response.status == 304:
+                        if cached and "result" in cached:
+                            self.stats["not_modified"] += 1
+                            return cached["result"]
+                        # 재사용할 캐시 항목이 없는 304 (조회 후 항목이 지워졌거나 깨진 경우 등):
+                        # 검증자 없이 한 번만 다시 요청합니다. 이 재요청은 재시도 횟수에 넣지 않습니다.
+                        if unconditional_retry_done or not _has_validators(request_headers):
+                            raise UnexpectedNotModifiedError(
+                                f"{url}: 캐시된 결과가 없는데 304 Not Modified 응답을 받았습니다."
+                            )
+                        unconditional_retry_done = True
+                        request_headers = _without_validators(request_headers)
+                        cached = None
+                        attempt -= 1
+                        print(f"  -> HTTP 304 ({url}) 이지만 캐시 항목이 없어 조건 없이 다시 요청합니다.")
+                        continue
+
+                    if response.status not in RETRYABLE_STATUSES or attempt >= self.max_attempts:
+                        response.raise_for_status()
+                        if self.cache is None:
+                            data = await response.json(content_type=None)
+                            return transform(data) if transform else data
+                        body = await response.read()
+                        return self._resolve_cached_body(cache_key, cached, response, body, transform)
+
+                    retry_after = None
+                    if response.status in THROTTLE_STATUSES:
+                        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt >= self.max_attempts:
+                    raise
+                delay = _backoff_seconds(attempt)
+                print(f"  -> 요청 오류 ({url}): {e!r}, {delay:.1f}초 후 재시도 ({attempt}/{self.max_attempts})")
+                await asyncio.sleep(delay)
+                continue
+
+            if retry_after is not None:
+                # 버킷에 대기 시간을 빚지게 하면 같은 호스트로 가는 다른 요청도 함께 물러나고,
+                # 다음 acquire()가 그만큼 기다립니다.
+                retry_after = min(retry_after, config.CRAWLER_HTTP_MAX_RETRY_AFTER)
+                print(f"  -> HTTP {response.status} ({url}), Retry-After {retry_after:.1f}초 후 재시도 ({attempt}/{self.max_attempts})")
+                limiter.penalize(retry_after)
+            else:
+                delay = _backoff_seconds(attempt)
+                print(f"  -> HTTP {response.status} ({url}), {delay:.1f}초 후 재시도 ({attempt}/{self.max_attempts})")
+                await asyncio.sleep(delay)
+
+    def _resolve_cached_body(self, cache_key, cached, response, body, transform):
+        body_hash = hashlib.sha256(body).hexdigest()
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+
+        if cached and cached.get("body_hash") == body_hash:
+            # 본문이 같으면 파싱/정규화 없이 이전 결과를 재사용하고 검증자만 갱신합니다.
+            self.stats["unchanged_body"] += 1
+            result = cached["result"]
+            if (etag, last_modified) != (cached.get("etag"), cached.get("last_modified")):
+                self.cache.store(cache_key, {**cached, "etag": etag, "last_modified": last_modified})
+            return result
+
+        self.stats["fetched"] += 1
+        data = json.loads(body)
+        result = transform(data) if transform else data
+        self.cache.store(
+            cache_key,
+            {"etag": etag, "last_modified": last_modified, "body_hash": body_hash, "result": result},
+        )
+        return result
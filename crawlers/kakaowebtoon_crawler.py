@@ -1,13 +1,10 @@
 # crawlers/kakaowebtoon_crawler.py
 
 import asyncio
-import aiohttp
-import json
 import os
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 from .base_crawler import ContentCrawler
-from database import get_cursor
+from .http_client import CrawlerHttpClient
 
 # --- KakaoWebtoon API Configuration ---
 API_BASE_URL = "https://gateway-kw.kakao.com/section/v1/pages"
@@ -18,13 +15,19 @@ HEADERS = {
     "Accept-Language": "ko"
 }
 
+# 요일 한글 -> 영문 변환 맵
+DAY_MAP = {"월": "mon", "화": "tue", "수": "wed", "목": "thu", "금": "fri", "토": "sat", "일": "sun"}
+
 class KakaowebtoonCrawler(ContentCrawler):
     """
     webtoon.kakao.com에서 웹툰 정보를 수집하는 크롤러입니다.
     """
 
+    source_name = 'kakaowebtoon'
+    supports_incremental = True
+
     def __init__(self):
-        super().__init__('kakaowebtoon')
+        super().__init__(self.source_name)
         self.cookies = self._get_cookies_from_env()
 
     def _get_cookies_from_env(self):
@@ -39,40 +42,108 @@ class KakaowebtoonCrawler(ContentCrawler):
 
         return {"webid": webid, "_T_ANO": t_ano}
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
-    async def _fetch_from_api(self, session, url, params=None):
+    async def _fetch_from_api(self, client, url, params=None, transform=None):
         """
         주어진 URL과 파라미터로 API에 GET 요청을 보내고 JSON 응답을 반환합니다.
+        속도 제한, 재시도(Retry-After 포함), 응답 캐시는 CrawlerHttpClient가 담당합니다.
+        """
+        return await client.get_json(url, params=params, transform=transform)
+
+    @staticmethod
+    def _normalize_card(card, weekdays=()):
         """
-        async with session.get(url, headers=HEADERS, cookies=self.cookies, params=params) as response:
-            response.raise_for_status()
-            return await response.json()
+        API 카드 하나를 동기화용 레코드로 정규화합니다.
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
-    async def _fetch_paginated_completed(self, session):
-        """'completed' 엔드포인트의 모든 페이지를 순회하며 데이터를 수집합니다."""
+        결과는 응답 캐시에 그대로 저장되므로 JSON 직렬화가 가능해야 하며,
+        304/본문 해시 일치 시에는 이 정규화가 다시 실행되지 않습니다.
+        """
+        content_data = card.get('content', {})
+        author_names = [author['name'] for author in content_data.get('authors', [])]
+
+        # 우선순위: lookThroughImage (단일) -> featuredCharacterImageA (캐릭터) -> lookThroughImages[0] (슬라이스)
+        thumbnail_url = content_data.get('lookThroughImage')
+        if not thumbnail_url and content_data.get('featuredCharacterImageA'):
+            thumbnail_url = content_data.get('featuredCharacterImageA')
+        if not thumbnail_url and content_data.get('lookThroughImages'):
+            thumbnail_url = content_data['lookThroughImages'][0]
+
+        return {
+            'id': str(card['id']),
+            'title': card['title'] if 'title' in card else content_data.get('title'),
+            # DB에는 content.title을 저장합니다 (없으면 동기화 대상에서 제외).
+            'content_title': content_data.get('title'),
+            'paused': content_data.get('onGoingStatus') == 'PAUSE',  # 휴재 상태 키 확인
+            'meta': {
+                "common": {
+                    "authors": author_names,
+                    "thumbnail_url": thumbnail_url
+                },
+                "attributes": {
+                    "weekdays": list(weekdays),
+                    "lookThroughImage": content_data.get('lookThroughImage'),
+                    "backgroundImage": content_data.get('backgroundImage'),
+                    "featuredCharacterImageA": content_data.get('featuredCharacterImageA'),
+                    "featuredCharacterImageB": content_data.get('featuredCharacterImageB'),
+                    "titleImageA": content_data.get('titleImageA'),
+                    "titleImageB": content_data.get('titleImageB'),
+                    "lookThroughImages": content_data.get('lookThroughImages')
+                }
+            },
+        }
+
+    @classmethod
+    def _normalize_weekday_page(cls, data):
+        """'요일별' 응답을 섹션 순서대로 정규화된 레코드 목록으로 바꿉니다."""
+        records = []
+        for section in (data.get('data') or {}).get('sections') or []:
+            weekday_kor = section.get('title', '').replace('요일', '')  # "월요일" -> "월"
+            weekday_eng = DAY_MAP.get(weekday_kor)
+            if not weekday_eng:
+                continue
+            for card_group in section.get('cardGroups', []):
+                for card in card_group.get('cards', []):
+                    records.append(cls._normalize_card(card, (weekday_eng,)))
+        return records
+
+    @classmethod
+    def _normalize_completed_page(cls, data):
+        """'완결' 응답 한 페이지를 정규화된 레코드 목록으로 바꿉니다."""
+        sections = (data.get('data') or {}).get('sections')
+        if not sections:
+            return []
+        return [cls._normalize_card(card) for card in sections[0]['cardGroups'][0]['cards']]
+
+    async def _fetch_paginated_completed(self, client):
+        """
+        'completed' 엔드포인트의 모든 페이지를 순회하며 데이터를 수집합니다.
+        증분 모드에서는 한 페이지 전체가 이미 완결로 기록된 작품이면 그 페이지까지만 수집합니다.
+        """
         all_completed_content = []
         offset = 0
         limit = 100
+        page_number = 0
         while True:
             try:
                 url = f"{API_BASE_URL}/completed"
-                data = await self._fetch_from_api(session, url, params={"offset": offset, "limit": limit})
-
-                if not data.get('data', {}).get('sections'):
-                    break
-
-                cards = data['data']['sections'][0]['cardGroups'][0]['cards']
+                cards = await self._fetch_from_api(
+                    client, url, params={"offset": offset, "limit": limit},
+                    transform=self._normalize_completed_page,
+                )
                 if not cards:
                     break
 
                 all_completed_content.extend(cards)
                 offset += len(cards)
+                page_number += 1
 
-                if len(cards) < limit:
+                page_ids = [card['id'] for card in cards]
+                self.record_high_water_mark("completed", page_number, page_ids)
+                if self.should_stop_incremental("completed", page_ids):
+                    print(f"  -> offset {offset - len(cards)} 페이지가 모두 이미 완결로 기록된 작품이므로 증분 수집을 종료합니다.")
                     break
 
-                await asyncio.sleep(0.1)
+                if len(cards) < limit:
+                    break
             except Exception as e:
                 print(f"Error fetching completed page at offset {offset}: {e}")
                 break
@@ -83,69 +154,41 @@ class KakaowebtoonCrawler(ContentCrawler):
         카카오웹툰의 '요일별'과 '완결' API에서 모든 웹툰 데이터를 비동기적으로 가져옵니다.
         """
         print("카카오웹툰 서버에서 최신 데이터를 가져옵니다...")
-        async with aiohttp.ClientSession() as session:
+        async with CrawlerHttpClient(headers=HEADERS, cookies=self.cookies) as client:
             weekday_url = f"{API_BASE_URL}/general-weekdays"
 
             tasks = [
-                self._fetch_from_api(session, weekday_url),
-                self._fetch_paginated_completed(session)
+                self._fetch_from_api(client, weekday_url, transform=self._normalize_weekday_page),
+                self._fetch_paginated_completed(client)
             ]
             results = await asyncio.gather(*tasks, return_exceptions=True)
 
             weekday_data, completed_data = results
+            self.last_fetch_stats = {**client.stats, 'crawl_mode': self.crawl_mode}
 
 
         if isinstance(weekday_data, Exception):
             print(f"❌ 요일별 데이터 수집 실패: {weekday_data}")
-            weekday_data = {}
+            weekday_data = []
         if isinstance(completed_data, Exception):
             print(f"❌ 완결 데이터 수집 실패: {completed_data}")
             completed_data = []
 
-        print("\n--- 데이터 정규화 시작 ---")
+        # 카드 정규화는 페이지 transform에서 끝났으므로 여기서는 상태별로 나누기만 합니다.
         ongoing_today, hiatus_today, finished_today = {}, {}, {}
-
-        # 요일 한글 -> 영문 변환 맵
-        DAY_MAP = {"월": "mon", "화": "tue", "수": "wed", "목": "thu", "금": "fri", "토": "sat", "일": "sun"}
-
-        if weekday_data.get('data', {}).get('sections'):
-            for section in weekday_data['data']['sections']:
-                weekday_kor = section.get('title', '').replace('요일', '') # "월요일" -> "월"
-                weekday_eng = DAY_MAP.get(weekday_kor)
-                if not weekday_eng: continue
-
-                for card_group in section.get('cardGroups', []):
-
-                    for webtoon in card_group.get('cards', []):
-                        content_id = str(webtoon['id'])
-                        webtoon['weekdayDisplayGroups'] = [weekday_eng]
-
-                        content_payload = webtoon.get('content', {})
-                        if 'title' not in webtoon:
-                            webtoon['title'] = content_payload.get('title')
-
-                        status_text = webtoon.get('content', {}).get('onGoingStatus') # 'onGoingStatus' 사용
-                        if status_text == 'PAUSE': # 휴재 상태 키 확인
-                            if content_id not in hiatus_today:
-                                hiatus_today[content_id] = webtoon
-                        else:
-                            if content_id not in ongoing_today:
-                                ongoing_today[content_id] = webtoon
+        for webtoon in weekday_data:
+            content_id = webtoon['id']
+            if webtoon['paused']:
+                hiatus_today.setdefault(content_id, webtoon)
+            else:
+                ongoing_today.setdefault(content_id, webtoon)
 
         for webtoon in completed_data:
-            content_id = str(webtoon['id'])
+            content_id = webtoon['id']
             if content_id not in ongoing_today and content_id not in hiatus_today:
-                # 완결 데이터는 'status'가 최상위에 있을 수 있음
-                webtoon['status'] = '완결'
-                content_payload = webtoon.get('content', {})
-                if 'title' not in webtoon:
-                    webtoon['title'] = content_payload.get('title')
                 finished_today[content_id] = webtoon
 
         all_content_today = {**ongoing_today, **hiatus_today, **finished_today}
-        for webtoon in all_content_today.values():
-            if 'title' not in webtoon:
-                webtoon['title'] = webtoon.get('content', {}).get('title')
         print(f"오늘자 데이터 수집 완료: 총 {len(all_content_today)}개 고유 웹툰 확인")
         print(f"  - 연재중: {len(ongoing_today)}개, 휴재: {len(hiatus_today)}개, 완결: {len(finished_today)}개")
         return ongoing_today, hiatus_today, finished_today, all_content_today
@@ -155,10 +198,7 @@ class KakaowebtoonCrawler(ContentCrawler):
         수집된 최신 웹툰 데이터를 데이터베이스와 동기화합니다.
         """
         print("\nDB를 오늘의 최신 상태로 전체 동기화를 시작합니다...")
-        cursor = get_cursor(conn)
-        cursor.execute("SELECT content_id FROM contents WHERE source = %s", (self.source_name,))
-        db_existing_ids = {row['content_id'] for row in cursor.fetchall()}
-        updates, inserts = [], []
+        records = []
 
         for content_id, webtoon_data in all_content_today.items():
             status = ''
@@ -167,52 +207,16 @@ class KakaowebtoonCrawler(ContentCrawler):
             elif content_id in ongoing_today: status = '연재중'
             else: continue
 
-            content_data = webtoon_data.get('content', {})
-            author_names = [author['name'] for author in content_data.get('authors', [])]
-
-            # 우선순위: lookThroughImage (단일) -> featuredCharacterImageA (캐릭터) -> lookThroughImages[0] (슬라이스)
-            thumbnail_url = content_data.get('lookThroughImage')
-            if not thumbnail_url and content_data.get('featuredCharacterImageA'):
-                thumbnail_url = content_data.get('featuredCharacterImageA')
-            if not thumbnail_url and content_data.get('lookThroughImages'):
-                thumbnail_url = content_data['lookThroughImages'][0]
-
-            meta_data = {
-                "common": {
-                    "authors": author_names,
-                    "thumbnail_url": thumbnail_url
-                },
-                "attributes": {
-                    "weekdays": webtoon_data.get('weekdayDisplayGroups', []),
-                    "lookThroughImage": content_data.get('lookThroughImage'),
-                    "backgroundImage": content_data.get('backgroundImage'),
-                    "featuredCharacterImageA": content_data.get('featuredCharacterImageA'),
-                    "featuredCharacterImageB": content_data.get('featuredCharacterImageB'),
-                    "titleImageA": content_data.get('titleImageA'),
-                    "titleImageB": content_data.get('titleImageB'),
-                    "lookThroughImages": content_data.get('lookThroughImages')
-                }
-            }
-
-            title = content_data.get('title')
+            title = webtoon_data['content_title']
             if not title:
                 continue
 
-            if content_id in db_existing_ids:
-                record = ('webtoon', title, status, json.dumps(meta_data), content_id, self.source_name)
-                updates.append(record)
-            else:
-                record = (content_id, self.source_name, 'webtoon', title, status, json.dumps(meta_data))
-                inserts.append(record)
-
-        if updates:
-            cursor.executemany("UPDATE contents SET content_type=%s, title=%s, status=%s, meta=%s WHERE content_id=%s AND source=%s", updates)
-            print(f"{len(updates)}개 웹툰 정보 업데이트 완료.")
-
-        if inserts:
-            cursor.executemany("INSERT INTO contents (content_id, source, content_type, title, status, meta) VALUES (%s, %s, %s, %s, %s, %s) ON CONFLICT (content_id, source) DO NOTHING", inserts)
-            print(f"{len(inserts)}개 신규 웹툰 DB 추가 완료.")
-        cursor.close()
-        print("DB 동기화 완료.")
-        return len(inserts)
+            records.append((content_id, 'webtoon', title, status, webtoon_data['meta']))
 
+        stats = self.bulk_upsert_contents(conn, records)
+        self.last_sync_stats = stats
+        print(
+            f"DB 동기화 완료. (신규 {stats['inserted']}개, 업데이트 {stats['updated']}개, "
+            f"변경 없음 {stats['unchanged']}개)"
+        )
+        return stats['inserted']
@@ -4,15 +4,14 @@ import os
 import time
 import traceback
 import asyncio
-import aiohttp
-import json
 import sys
-from tenacity import retry, stop_after_attempt, wait_exponential
 from dotenv import load_dotenv
 
 import config
 from .base_crawler import ContentCrawler
-from database import get_cursor, create_standalone_connection
+from .http_client import CrawlerHttpClient
+from database import create_standalone_connection
+from repositories.crawler_reports_repo import save_crawler_report
 
 load_dotenv()
 
@@ -23,56 +22,140 @@ WEEKDAYS = config.WEEKDAYS
 class NaverWebtoonCrawler(ContentCrawler):
     """네이버 웹툰 크롤러"""
 
+    source_name = 'naver_webtoon'
+    supports_incremental = True
+
     def __init__(self):
-        super().__init__('naver_webtoon')
+        super().__init__(self.source_name)
+        self.fetch_concurrency = max(1, config.NAVER_FETCH_CONCURRENCY)
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
-    async def _fetch_from_api(self, session, url):
-        async with session.get(url, headers=HEADERS) as response:
-            response.raise_for_status()
-            data = await response.json()
-            return data.get('titleList', data.get('list', []))
+    async def _fetch_from_api(self, client, url, transform=None):
+        # 속도 제한, 재시도, 응답 캐시는 CrawlerHttpClient가 담당합니다.
+        return await client.get_json(url, transform=transform)
 
-    async def _fetch_paginated_data(self, session, base_url, max_pages, description):
+    @staticmethod
+    def _normalize_webtoon(webtoon):
         """
-        주어진 API URL의 모든 페이지를 순회하며 데이터를 수집하는 범용 함수
+        목록 항목 하나를 동기화용 레코드로 정규화합니다.
+
+        결과는 응답 캐시에 그대로 저장되므로 JSON 직렬화가 가능해야 하며,
+        304/본문 해시 일치 시에는 이 정규화가 다시 실행되지 않습니다.
+        요일은 여러 목록을 합쳐야 정해지므로 fetch_all_data에서 채웁니다.
         """
-        all_candidates = {}
+        author = webtoon.get('author')
+        return {
+            'titleId': webtoon['titleId'],
+            'titleName': webtoon.get('titleName'),
+            'title': webtoon['title'] if 'title' in webtoon else webtoon.get('titleName'),
+            'rest': bool(webtoon.get('rest', False)),
+            'common': {
+                "authors": [author] if author else [],
+                "thumbnail_url": webtoon.get('thumbnailUrl')
+            },
+        }
+
+    @classmethod
+    def _parse_page(cls, data):
+        return {
+            'items': [cls._normalize_webtoon(webtoon) for webtoon in data.get('titleList', data.get('list', []))],
+            'total_pages': (data.get('pageInfo') or {}).get('totalPages'),
+        }
+
+    async def _fetch_page(self, client, base_url, page):
+        """한 페이지를 가져와 (웹툰 목록, 전체 페이지 수 또는 None)을 반환합니다."""
+        api_url = f"{base_url}&page={page}&pageSize=100"
+        parsed = await self._fetch_from_api(client, api_url, transform=self._parse_page)
+        return parsed['items'], parsed['total_pages']
+
+    async def _fetch_paginated_data(self, client, base_url, max_pages, description, list_name=None):
+        """
+        주어진 API URL의 모든 페이지를 동시에(세마포어로 제한) 수집하는 범용 함수
+
+        - 1페이지 응답의 pageInfo.totalPages로 전체 페이지 수를 알 수 있으면 나머지 페이지를 한 번에 요청합니다.
+        - 알 수 없으면 동시 요청 수만큼씩 앞 페이지를 미리 요청(speculative probe)합니다.
+        - 처음으로 비어 있거나 실패한 페이지 이후의 결과는 순차 수집과 동일하게 버립니다.
+        - list_name이 주어지면 high-water mark를 기록하고, 증분 모드에서는 한 페이지 전체가
+          이미 완결로 기록된 작품이면 그 페이지까지만 수집합니다.
+        """
+        incremental = list_name is not None and self.crawl_mode == "incremental"
         print(f"\n'{description}' 목록 확보를 위해 페이지네이션 수집 시작...")
-        for page in range(1, max_pages + 1):
-            try:
-                api_url = f"{base_url}&page={page}&pageSize=100"
-                webtoons_on_page = await self._fetch_from_api(session, api_url)
+        semaphore = asyncio.Semaphore(self.fetch_concurrency)
+
+        async def fetch(page):
+            async with semaphore:
+                return await self._fetch_page(client, base_url, page)
+
+        pages = {}
+        stop_page = None
+        total_pages = None
+        next_page = 1
+        while stop_page is None:
+            last_page = min(total_pages, max_pages) if total_pages else max_pages
+            if next_page > last_page:
+                if total_pages and total_pages <= max_pages:
+                    print(f"  -> 전체 {total_pages} 페이지 수집 완료.")
+                else:
+                    print(f"  -> 최대 {max_pages} 페이지까지 수집하여 종료합니다.")
+                break
+
+            if total_pages and not incremental:
+                window_end = last_page
+            elif next_page == 1:
+                window_end = 1
+            else:
+                window_end = min(next_page + self.fetch_concurrency - 1, last_page)
+            window = range(next_page, window_end + 1)
+
+            results = await asyncio.gather(*(fetch(page) for page in window), return_exceptions=True)
+            for page, result in zip(window, results):
+                if isinstance(result, Exception):
+                    print(f"  -> {page} 페이지 수집 중 오류 발생: {result}")
+                    stop_page = page
+                    break
+                webtoons_on_page, page_total = result
                 if not webtoons_on_page:
                     print(f"  -> {page-1} 페이지에서 수집 종료 (데이터 없음).")
+                    stop_page = page
                     break
-                for webtoon in webtoons_on_page:
-                    if webtoon['titleId'] not in all_candidates:
-                        all_candidates[webtoon['titleId']] = webtoon
-                print(f"  -> {page} 페이지 수집 완료. (현재 후보군: {len(all_candidates)}개)")
-                await asyncio.sleep(0.1)
-            except Exception as e:
-                print(f"  -> {page} 페이지 수집 중 오류 발생: {e}")
-                break
-        else:
-            print(f"  -> 최대 {max_pages} 페이지까지 수집하여 종료합니다.")
+                if page_total:
+                    total_pages = page_total
+                pages[page] = webtoons_on_page
+
+                if list_name is not None:
+                    page_ids = [webtoon['titleId'] for webtoon in webtoons_on_page]
+                    self.record_high_water_mark(list_name, page, page_ids)
+                    if self.should_stop_incremental(list_name, page_ids):
+                        print(f"  -> {page} 페이지가 모두 이미 완결로 기록된 작품이므로 증분 수집을 종료합니다.")
+                        stop_page = page + 1
+                        break
+            next_page = window_end + 1
+
+        all_candidates = {}
+        for page in sorted(pages):
+            for webtoon in pages[page]:
+                if webtoon['titleId'] not in all_candidates:
+                    all_candidates[webtoon['titleId']] = webtoon
+        print(f"  -> {len(pages)}개 페이지 수집 완료. (후보군: {len(all_candidates)}개)")
         return all_candidates
 
     async def fetch_all_data(self):
         print("네이버 웹툰 서버에서 오늘의 최신 데이터를 가져옵니다...")
-        async with aiohttp.ClientSession() as session:
+        async with CrawlerHttpClient(headers=HEADERS) as client:
             ongoing_tasks = []
             for api_day in WEEKDAYS.keys():
                 base_url = f"{config.NAVER_API_URL}/weekday?week={api_day}"
-                task = self._fetch_paginated_data(session, base_url, 50, f"'{api_day}'요일 웹툰")
+                task = self._fetch_paginated_data(client, base_url, 50, f"'{api_day}'요일 웹툰")
                 ongoing_tasks.append(task)
 
             finished_base_url = f"{config.NAVER_API_URL}/finished?order=UPDATE"
-            finished_task = self._fetch_paginated_data(session, finished_base_url, 150, "완결/장기 휴재 후보")
+            finished_task = self._fetch_paginated_data(
+                client, finished_base_url, 150, "완결/장기 휴재 후보", list_name="finished"
+            )
 
             results = await asyncio.gather(*ongoing_tasks, finished_task, return_exceptions=True)
             ongoing_results = results[:-1]
             finished_candidates = results[-1] if not isinstance(results[-1], Exception) else {}
+            self.last_fetch_stats = {**client.stats, 'crawl_mode': self.crawl_mode}
 
         print("\n--- 데이터 수집 결과 ---")
         naver_ongoing_today, naver_hiatus_today, naver_finished_today = {}, {}, {}
@@ -83,47 +166,38 @@ class NaverWebtoonCrawler(ContentCrawler):
                 print(f"❌ '{day_key}'요일 데이터 수집 실패: {result}")
                 continue
 
+            # 항목 정규화는 페이지 transform에서 끝났으므로 여기서는 요일을 합치고 상태별로 나누기만 합니다.
             for webtoon in result.values():
                 titleId = webtoon['titleId']
 
                 if titleId not in naver_ongoing_today:
                     naver_ongoing_today[titleId] = webtoon
                     naver_ongoing_today[titleId]['normalized_weekdays'] = set()
-                    if 'title' not in naver_ongoing_today[titleId]:
-                        naver_ongoing_today[titleId]['title'] = webtoon.get('titleName')
 
                 naver_ongoing_today[titleId]['normalized_weekdays'].add(WEEKDAYS[day_key])
 
-                if webtoon.get('rest', False):
+                if webtoon['rest']:
                     naver_hiatus_today[titleId] = webtoon
 
         print("  -> 수집된 요일 정보를 list로 변환합니다...")
         for webtoon in naver_ongoing_today.values():
-            webtoon['normalized_weekdays'] = list(webtoon['normalized_weekdays'])
+            # 정렬하여 저장해야 content_hash가 실행마다 흔들리지 않습니다.
+            webtoon['normalized_weekdays'] = sorted(webtoon['normalized_weekdays'])
 
         for tid, data in finished_candidates.items():
             if tid not in naver_ongoing_today and tid not in naver_hiatus_today:
-                if data.get('rest', False):
+                if data['rest']:
                     naver_hiatus_today[tid] = data
                 else:
                     naver_finished_today[tid] = data
 
-                if 'title' not in data:
-                    data['title'] = data.get('titleName')
-
         all_naver_webtoons_today = {**naver_finished_today, **naver_hiatus_today, **naver_ongoing_today}
-        for webtoon in all_naver_webtoons_today.values():
-            if 'title' not in webtoon:
-                webtoon['title'] = webtoon.get('titleName')
         print(f"오늘자 데이터 수집 완료: 총 {len(all_naver_webtoons_today)}개 고유 웹툰 확인")
         return naver_ongoing_today, naver_hiatus_today, naver_finished_today, all_naver_webtoons_today
 
     def synchronize_database(self, conn, all_naver_webtoons_today, naver_ongoing_today, naver_hiatus_today, naver_finished_today):
         print("\nDB를 오늘의 최신 상태로 전체 동기화를 시작합니다...")
-        cursor = get_cursor(conn)
-        cursor.execute("SELECT content_id FROM contents WHERE source = %s", (self.source_name,))
-        db_existing_ids = {row['content_id'] for row in cursor.fetchall()}
-        updates, inserts = [], []
+        records = []
 
         for content_id, webtoon_data in all_naver_webtoons_today.items():
             status = ''
@@ -136,41 +210,22 @@ class NaverWebtoonCrawler(ContentCrawler):
             else:
                 continue
 
-            author = webtoon_data.get('author')
             meta_data = {
-                "common": {
-                    "authors": [author] if author else [],
-                    "thumbnail_url": webtoon_data.get('thumbnailUrl')
-                },
+                "common": webtoon_data['common'],
                 "attributes": {
                     "weekdays": webtoon_data.get('normalized_weekdays', [])
                 }
             }
 
-            if content_id in db_existing_ids:
-                record = ('webtoon', webtoon_data['titleName'], status, json.dumps(meta_data), content_id, self.source_name)
-                updates.append(record)
-            else:
-                record = (content_id, self.source_name, 'webtoon', webtoon_data['titleName'], status, json.dumps(meta_data))
-                inserts.append(record)
+            records.append((content_id, 'webtoon', webtoon_data['titleName'], status, meta_data))
 
-        if updates:
-            cursor.executemany(
-                "UPDATE contents SET content_type=%s, title=%s, status=%s, meta=%s WHERE content_id=%s AND source=%s",
-                updates
-            )
-            print(f"{len(updates)}개 웹툰 정보 업데이트 완료.")
-
-        if inserts:
-            cursor.executemany(
-                "INSERT INTO contents (content_id, source, content_type, title, status, meta) VALUES (%s, %s, %s, %s, %s, %s) "
-                "ON CONFLICT (content_id, source) DO NOTHING",
-                inserts
-            )
-            print(f"{len(inserts)}개 신규 웹툰 DB 추가 완료.")
-        cursor.close()
-        print("DB 동기화 완료.")
-        return len(inserts)
+        stats = self.bulk_upsert_contents(conn, records)
+        self.last_sync_stats = stats
+        print(
+            f"DB 동기화 완료. (신규 {stats['inserted']}개, 업데이트 {stats['updated']}개, "
+            f"변경 없음 {stats['unchanged']}개)"
+        )
+        return stats['inserted']
 
 
 if __name__ == '__main__':
@@ -198,6 +253,8 @@ if __name__ == '__main__':
             'new_webtoons': new_contents,
             'newly_completed_items': newly_completed_items,
             'cdc_info': cdc_info,
+            'sync_stats': crawler.last_sync_stats,
+            'fetch_stats': crawler.last_fetch_stats,
         })
 
     except Exception as e:
@@ -215,17 +272,9 @@ if __name__ == '__main__':
         report_conn = None
         try:
             report_conn = create_standalone_connection()
-            report_cursor = get_cursor(report_conn)
             print(f"LOG: Saving report to 'daily_crawler_reports' table...")
-            report_cursor.execute(
-                """
-                INSERT INTO daily_crawler_reports (crawler_name, status, report_data)
-                VALUES (%s, %s, %s)
-                """,
-                (CRAWLER_DISPLAY_NAME, report['status'], json.dumps(report))
-            )
+            save_crawler_report(report_conn, CRAWLER_DISPLAY_NAME, report)
             report_conn.commit()
-            report_cursor.close()
             print("LOG: Report saved successfully.")
         except Exception as report_e:
             print(f"FATAL: [실패] 보고서 DB 저장 실패: {report_e}", file=sys.stderr)
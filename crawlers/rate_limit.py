@@ -0,0 +1,67 @@
+# crawlers/rate_limit.py
+import asyncio
+import time
+
+import config
+
+
+class TokenBucket:
+    """
+    asyncio용 토큰 버킷 속도 제한기입니다.
+
+    초당 ``rate``개의 토큰이 채워지고 최대 ``burst``개까지 쌓입니다.
+    ``acquire()``는 토큰이 생길 때까지 필요한 만큼만 대기합니다.
+    """
+
+    def __init__(self, rate, burst=None):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = None
+        self._lock_loop = None
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def penalize(self, seconds):
+        """
+        서버가 Retry-After로 대기를 요구하면 그 시간만큼 토큰을 빚지게 하여
+        같은 호스트로 가는 모든 요청이 함께 물러나도록 합니다.
+        """
+        self._refill()
+        self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+    async def acquire(self, tokens=1):
+        # Lock은 실행 중인 이벤트 루프에 묶이므로 루프가 바뀌면 새로 만듭니다.
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+
+_host_limiters = {}
+
+
+def get_host_limiter(host):
+    """
+    호스트별로 프로세스 전역에서 공유되는 TokenBucket을 반환합니다.
+    같은 호스트를 호출하는 크롤러가 늘어나도 호스트에 가하는 총 부하는 늘지 않습니다.
+    """
+    limiter = _host_limiters.get(host)
+    if limiter is None:
+        rate = config.CRAWLER_HOST_RATE_LIMITS.get(host, config.CRAWLER_DEFAULT_RATE_LIMIT_PER_SEC)
+        limiter = TokenBucket(rate)
+        _host_limiters[host] = limiter
+    return limiter
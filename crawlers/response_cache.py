@@ -0,0 +1,50 @@
+# crawlers/response_cache.py
+import hashlib
+import json
+import os
+import tempfile
+
+
+class ResponseCache:
+    """
+    크롤러 HTTP 응답을 디스크에 보관하는 캐시입니다.
+
+    URL과 쿼리 파라미터로 키를 만들고, 항목마다 다음을 저장합니다.
+    - etag / last_modified: 조건부 요청(If-None-Match / If-Modified-Since)용 검증자
+    - body_hash: 응답 본문의 SHA-256 (검증자가 없거나 바뀌어도 본문이 같으면 재사용)
+    - result: 응답을 파싱/정규화한 결과 (JSON 직렬화 가능해야 함)
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(url, params=None):
+        normalized_params = sorted((str(k), str(v)) for k, v in (params or {}).items())
+        raw = json.dumps([url, normalized_params], ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def load(self, key):
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def store(self, key, entry):
+        # 중간에 프로세스가 죽어도 깨진 파일이 남지 않도록 임시 파일에 쓴 뒤 교체합니다.
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path(key))
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
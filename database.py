@@ -1,10 +1,16 @@
 # database.py
 
 import psycopg2
+import psycopg2.extensions
 import psycopg2.extras
+import psycopg2.pool
 from flask import g
 import os
 import sys
+import threading
+import time
+
+import config
 
 def _create_connection():
     """
@@ -28,10 +34,225 @@ def _create_connection():
         port=os.environ.get('DB_PORT')
     )
 
+class PoolTimeoutError(psycopg2.pool.PoolError):
+    """풀에서 정해진 시간 안에 연결을 얻지 못했을 때 발생합니다."""
+
+
+class ConnectionPool:
+    """
+    프로세스 단위 PostgreSQL 연결 풀입니다.
+
+    - 최소/최대 크기를 지키며, 여유 연결이 없으면 timeout 동안 대기합니다.
+    - 대여(checkout) 시 닫힌 연결은 폐기하고, 오래 쉬었던 연결은 SELECT 1로 점검합니다.
+    - 반납(return) 시 열린 트랜잭션을 rollback하여 다음 요청에 상태가 새지 않도록 합니다.
+    """
+
+    def __init__(self, connect, min_size, max_size, timeout, healthcheck_interval):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("DB 풀 크기 설정이 올바르지 않습니다 (0 <= min <= max, max >= 1).")
+        self._connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.healthcheck_interval = healthcheck_interval
+        self.pid = os.getpid()
+
+        self._cond = threading.Condition()
+        self._idle = []  # [(conn, returned_at)]
+        self._in_use = set()
+        self._waiting = 0
+        self._opening = 0
+        self._closed = False
+        self._metrics = {
+            'checkouts': 0,
+            'created': 0,
+            'discarded': 0,
+            'timeouts': 0,
+            'total_wait_seconds': 0.0,
+            'max_wait_seconds': 0.0,
+        }
+
+        for _ in range(min_size):
+            self._idle.append((self._connect(), time.monotonic()))
+            self._metrics['created'] += 1
+
+    @property
+    def size(self):
+        return len(self._idle) + len(self._in_use)
+
+    def _discard(self, conn):
+        self._metrics['discarded'] += 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _is_healthy(self, conn, idle_since):
+        if conn.closed:
+            return False
+        if time.monotonic() - idle_since < self.healthcheck_interval:
+            return True
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1")
+            cursor.close()
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    def getconn(self):
+        """풀에서 연결을 하나 대여합니다. 필요하면 새 연결을 만들거나 대기합니다."""
+        started = time.monotonic()
+        deadline = started + self.timeout
+        while True:
+            candidate, reserved = None, False
+            with self._cond:
+                while candidate is None and not reserved:
+                    if self._closed:
+                        raise psycopg2.pool.PoolError("connection pool is closed")
+                    if self._idle:
+                        candidate = self._idle.pop()
+                        # 헬스체크 동안에도 size에 포함되도록 사용 중으로 표시합니다.
+                        self._in_use.add(candidate[0])
+                    elif self.size + self._opening < self.max_size:
+                        self._opening += 1
+                        reserved = True
+                    else:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self._metrics['timeouts'] += 1
+                            raise PoolTimeoutError(
+                                f"DB 연결 풀에서 {self.timeout}초 안에 연결을 얻지 못했습니다 (max_size={self.max_size})."
+                            )
+                        self._waiting += 1
+                        try:
+                            self._cond.wait(remaining)
+                        finally:
+                            self._waiting -= 1
+
+            # 네트워크 I/O(연결 생성, 헬스체크)는 락 밖에서 수행합니다.
+            if reserved:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._cond:
+                        self._opening -= 1
+                        self._cond.notify()
+                    raise
+                with self._cond:
+                    self._opening -= 1
+                    self._metrics['created'] += 1
+                    return self._checkout(conn, started)
+
+            conn, idle_since = candidate
+            if self._is_healthy(conn, idle_since):
+                with self._cond:
+                    return self._checkout(conn, started)
+            with self._cond:
+                self._in_use.discard(conn)
+                self._discard(conn)
+                self._cond.notify()
+
+    def _checkout(self, conn, started):
+        waited = time.monotonic() - started
+        self._in_use.add(conn)
+        self._metrics['checkouts'] += 1
+        self._metrics['total_wait_seconds'] += waited
+        self._metrics['max_wait_seconds'] = max(self._metrics['max_wait_seconds'], waited)
+        return conn
+
+    def putconn(self, conn, discard=False):
+        """대여한 연결을 반납합니다. 트랜잭션은 rollback으로 정리합니다."""
+        if not discard and not self._closed and not conn.closed:
+            try:
+                status = conn.get_transaction_status()
+                if status == psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN:
+                    discard = True
+                elif status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+            except Exception:
+                discard = True
+        else:
+            discard = True
+
+        with self._cond:
+            self._in_use.discard(conn)
+            if discard or self._closed:
+                self._discard(conn)
+            else:
+                self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    def closeall(self):
+        """풀의 모든 연결을 닫습니다."""
+        with self._cond:
+            self._closed = True
+            for conn, _ in self._idle:
+                self._discard(conn)
+            for conn in list(self._in_use):
+                self._discard(conn)
+            self._idle.clear()
+            self._in_use.clear()
+            self._cond.notify_all()
+
+    def stats(self):
+        """풀 크기 및 대기 시간 지표를 반환합니다."""
+        with self._cond:
+            checkouts = self._metrics['checkouts']
+            return {
+                'pid': self.pid,
+                'min_size': self.min_size,
+                'max_size': self.max_size,
+                'size': self.size,
+                'idle': len(self._idle),
+                'in_use': len(self._in_use),
+                'waiting': self._waiting,
+                **self._metrics,
+                'avg_wait_seconds': (self._metrics['total_wait_seconds'] / checkouts) if checkouts else 0.0,
+            }
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool():
+    """
+    현재 프로세스의 연결 풀을 반환합니다.
+    gunicorn 등이 fork한 자식 프로세스에서는 부모의 소켓을 공유하지 않도록 풀을 새로 만듭니다.
+    """
+    global _pool
+    pool = _pool
+    if pool is not None and pool.pid == os.getpid():
+        return pool
+
+    with _pool_lock:
+        if _pool is None or _pool.pid != os.getpid():
+            # 부모 프로세스에서 상속된 연결은 close()하지 않고 버립니다.
+            # (close 시 서버에 종료 메시지가 전송되어 부모의 세션이 끊어질 수 있음)
+            _pool = ConnectionPool(
+                _create_connection,
+                min_size=config.DB_POOL_MIN_SIZE,
+                max_size=config.DB_POOL_MAX_SIZE,
+                timeout=config.DB_POOL_TIMEOUT,
+                healthcheck_interval=config.DB_POOL_HEALTHCHECK_INTERVAL,
+            )
+        return _pool
+
+
+def get_pool_stats():
+    """현재 프로세스의 연결 풀 지표를 반환합니다. 풀이 아직 없으면 None을 반환합니다."""
+    pool = _pool
+    if pool is None or pool.pid != os.getpid():
+        return None
+    return pool.stats()
+
+
 def get_db():
-    """Application Context 내에서 유일한 DB 연결을 가져옵니다."""
+    """Application Context 내에서 유일한 DB 연결을 가져옵니다 (프로세스 연결 풀에서 대여)."""
     if 'db' not in g:
-        g.db = _create_connection()
+        g.db = _get_pool().getconn()
     return g.db
 
 def get_cursor(db):
@@ -39,10 +260,14 @@ def get_cursor(db):
     return db.cursor(cursor_factory=psycopg2.extras.DictCursor)
 
 def close_db(exception=None):
-    """요청(request)이 끝나면 자동으로 호출되어 DB 연결을 닫습니다."""
+    """요청(request)이 끝나면 자동으로 호출되어 DB 연결을 풀에 반납합니다."""
     db = g.pop('db', None)
     if db is not None:
-        db.close()
+        pool = _pool
+        if pool is not None and pool.pid == os.getpid():
+            pool.putconn(db)
+        else:
+            db.close()
 
 def create_standalone_connection():
     """Flask 컨텍스트 없이 독립적인 DB 연결을 생성합니다."""
@@ -71,10 +296,35 @@ def setup_database_standalone():
             title TEXT NOT NULL,
             status TEXT NOT NULL,
             meta JSONB,
+            content_hash TEXT,
             PRIMARY KEY (content_id, source)
         )""")
+        # 기존 테이블에도 변경 감지용 지문 컬럼을 추가합니다 (NULL이면 다음 동기화 때 채워짐).
+        cursor.execute("ALTER TABLE contents ADD COLUMN IF NOT EXISTS content_hash TEXT")
+        # 휴재/완결 목록의 keyset 페이지네이션 (title, source, content_id) 순서를 그대로 따르는 인덱스
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_contents_status_type_title_keyset "
+            "ON contents (status, content_type, title, source, content_id)"
+        )
+        # source 필터가 있는 목록용 (source가 등호 조건이므로 title 앞에 둠)
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_contents_status_type_source_title_keyset "
+            "ON contents (status, content_type, source, title, content_id)"
+        )
         print("LOG: [DB Setup] 'contents' table created or already exists.")
 
+        print("LOG: [DB Setup] Creating 'content_status_counts' table...")
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS content_status_counts (
+            content_type TEXT NOT NULL,
+            source TEXT NOT NULL,
+            status TEXT NOT NULL,
+            item_count INTEGER NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT NOW(),
+            PRIMARY KEY (content_type, source, status)
+        )""")
+        print("LOG: [DB Setup] 'content_status_counts' table created or already exists.")
+
         print("LOG: [DB Setup] Creating 'users' table...")
         cursor.execute("""
         CREATE TABLE IF NOT EXISTS users (
@@ -98,6 +348,10 @@ def setup_database_standalone():
             source TEXT NOT NULL,
             UNIQUE(user_id, content_id, source)
         )""")
+        # 완결 알림 팬아웃(콘텐츠 → 구독자) 조회용. UNIQUE 제약은 user_id가 선두라 쓸 수 없습니다.
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_subscriptions_content_source ON subscriptions (content_id, source)"
+        )
         print("LOG: [DB Setup] 'subscriptions' table created or already exists.")
 
         print("LOG: [DB Setup] Creating 'admin_content_overrides' table...")
@@ -114,6 +368,20 @@ def setup_database_standalone():
             updated_at TIMESTAMP DEFAULT NOW(),
             UNIQUE(content_id, source)
         )""")
+        # 예약 완결 처리 표시. 스캔이 이벤트를 확인한 override에 시각을 남기고, override가 바뀌면 NULL로 되돌립니다.
+        cursor.execute(
+            "ALTER TABLE admin_content_overrides ADD COLUMN IF NOT EXISTS completion_recorded_at TIMESTAMP NULL"
+        )
+        # 예약 완결 스캔(record_due_scheduled_completions)·ticker 재적재용 부분 인덱스.
+        # 처리된 과거 예약은 인덱스에서 빠지므로 스캔 비용이 누적 이력에 비례하지 않습니다.
+        cursor.execute("DROP INDEX IF EXISTS idx_admin_overrides_completed_at_due")
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_admin_overrides_completion_pending
+            ON admin_content_overrides (override_completed_at)
+            WHERE override_status = '완결' AND completion_recorded_at IS NULL
+            """
+        )
         print("LOG: [DB Setup] 'admin_content_overrides' table created or already exists.")
 
         print("LOG: [DB Setup] Creating 'cdc_events' table...")
@@ -133,8 +401,119 @@ def setup_database_standalone():
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_cdc_events_source_created_at ON cdc_events (source, created_at)"
         )
+        # 알림 outbox 적재 여부 (NULL = 아직 적재되지 않음).
+        # 컬럼을 처음 추가할 때 기존 이벤트는 이미 처리된 것으로 채워, 첫 디스패처 실행이 과거 완결 전체를 메일로 보내지 않게 합니다.
+        cursor.execute("""
+        DO $$
+        BEGIN
+            IF NOT EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_name = 'cdc_events' AND column_name = 'outbox_enqueued_at'
+            ) THEN
+                ALTER TABLE cdc_events ADD COLUMN outbox_enqueued_at TIMESTAMP NULL;
+                UPDATE cdc_events SET outbox_enqueued_at = COALESCE(created_at, NOW())
+                WHERE outbox_enqueued_at IS NULL;
+            END IF;
+        END $$;
+        """)
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_cdc_events_outbox_pending
+            ON cdc_events (id)
+            WHERE outbox_enqueued_at IS NULL
+            """
+        )
         print("LOG: [DB Setup] 'cdc_events' table created or already exists.")
 
+        print("LOG: [DB Setup] Creating 'notification_outbox' table...")
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS notification_outbox (
+            id BIGSERIAL PRIMARY KEY,
+            cdc_event_id INTEGER NOT NULL REFERENCES cdc_events(id) ON DELETE CASCADE,
+            user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+            email TEXT NOT NULL,
+            subject TEXT NOT NULL,
+            body TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            next_attempt_at TIMESTAMP NOT NULL DEFAULT NOW(),
+            locked_at TIMESTAMP NULL,
+            last_error TEXT NULL,
+            sent_at TIMESTAMP NULL,
+            created_at TIMESTAMP DEFAULT NOW(),
+            UNIQUE(cdc_event_id, user_id)
+        )""")
+        # 다이제스트 한 통이 묶은 이벤트 전체. cdc_event_id는 그중 가장 작은 id(중복 적재 방지 키)입니다.
+        cursor.execute("ALTER TABLE notification_outbox ADD COLUMN IF NOT EXISTS cdc_event_ids INTEGER[] NULL")
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_notification_outbox_pending
+            ON notification_outbox (next_attempt_at)
+            WHERE status = 'pending'
+            """
+        )
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_notification_outbox_sending
+            ON notification_outbox (locked_at)
+            WHERE status = 'sending'
+            """
+        )
+        print("LOG: [DB Setup] 'notification_outbox' table created or already exists.")
+
+        print("LOG: [DB Setup] Creating 'content_data_versions' table...")
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS content_data_versions (
+            source TEXT PRIMARY KEY,
+            version BIGINT NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT NOW()
+        )""")
+        print("LOG: [DB Setup] 'content_data_versions' table created or already exists.")
+
+        print("LOG: [DB Setup] Creating 'content_snapshots' table...")
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS content_snapshots (
+            content_type TEXT NOT NULL,
+            source TEXT NOT NULL,
+            weekday TEXT NOT NULL,
+            projection TEXT NOT NULL DEFAULT 'full',
+            generation TEXT NOT NULL,
+            data_version BIGINT NOT NULL DEFAULT 0,
+            item_count INTEGER NOT NULL DEFAULT 0,
+            body BYTEA NOT NULL,
+            body_gzip BYTEA NOT NULL,
+            body_br BYTEA NULL,
+            created_at TIMESTAMP DEFAULT NOW(),
+            PRIMARY KEY (content_type, source, weekday, projection)
+        )""")
+        # 투영(view=card 등) 도입 전에 만들어진 테이블: 컬럼을 추가하고 기본키에 포함시킵니다.
+        cursor.execute("ALTER TABLE content_snapshots ADD COLUMN IF NOT EXISTS projection TEXT NOT NULL DEFAULT 'full'")
+        cursor.execute("""
+        DO $$
+        BEGIN
+            IF NOT EXISTS (
+                SELECT 1
+                FROM information_schema.key_column_usage
+                WHERE table_name = 'content_snapshots'
+                  AND constraint_name = 'content_snapshots_pkey'
+                  AND column_name = 'projection'
+            ) THEN
+                ALTER TABLE content_snapshots DROP CONSTRAINT content_snapshots_pkey;
+                ALTER TABLE content_snapshots ADD PRIMARY KEY (content_type, source, weekday, projection);
+            END IF;
+        END $$;
+        """)
+        print("LOG: [DB Setup] 'content_snapshots' table created or already exists.")
+
+        print("LOG: [DB Setup] Creating 'crawler_state' table...")
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS crawler_state (
+            source TEXT PRIMARY KEY,
+            state JSONB NOT NULL DEFAULT '{}'::jsonb,
+            updated_at TIMESTAMP DEFAULT NOW()
+        )""")
+        print("LOG: [DB Setup] 'crawler_state' table created or already exists.")
+
         # === 🚨 [신규] 통합 보고서 저장을 위한 테이블 생성 ===
         print("LOG: [DB Setup] Creating 'daily_crawler_reports' table...")
         cursor.execute("""
@@ -145,7 +524,51 @@ def setup_database_standalone():
             report_data JSONB NOT NULL,
             created_at TIMESTAMP DEFAULT NOW()
         )""")
+        # 보고서 요약 수치는 타입이 있는 컬럼으로 두고, report_data에는 작은 부가 정보만 남깁니다.
+        for column, column_type in (
+            ('duration_seconds', 'DOUBLE PRECISION'),
+            ('new_contents', 'INTEGER'),
+            ('newly_completed_count', 'INTEGER'),
+            ('cdc_events_inserted_count', 'INTEGER'),
+            ('sync_inserted', 'INTEGER'),
+            ('sync_updated', 'INTEGER'),
+            ('sync_unchanged', 'INTEGER'),
+            ('fetch_requests', 'INTEGER'),
+            ('fetch_not_modified', 'INTEGER'),
+        ):
+            cursor.execute(
+                f"ALTER TABLE daily_crawler_reports ADD COLUMN IF NOT EXISTS {column} {column_type} NULL"
+            )
+        # report_sender가 발송 대상으로 선점한 행 표시 (NULL = 미선점)
+        cursor.execute("ALTER TABLE daily_crawler_reports ADD COLUMN IF NOT EXISTS claim_token TEXT NULL")
+        cursor.execute("ALTER TABLE daily_crawler_reports ADD COLUMN IF NOT EXISTS claimed_at TIMESTAMP NULL")
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_daily_crawler_reports_claim_token
+            ON daily_crawler_reports (claim_token)
+            WHERE claim_token IS NOT NULL
+            """
+        )
         print("LOG: [DB Setup] 'daily_crawler_reports' table created or already exists.")
+
+        print("LOG: [DB Setup] Creating 'daily_crawler_report_items' table...")
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS daily_crawler_report_items (
+            id BIGSERIAL PRIMARY KEY,
+            report_id INTEGER NOT NULL REFERENCES daily_crawler_reports(id) ON DELETE CASCADE,
+            item_kind TEXT NOT NULL,
+            content_id TEXT NOT NULL,
+            source TEXT NULL,
+            final_completed_at TIMESTAMP NULL,
+            resolved_by TEXT NULL
+        )""")
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_daily_crawler_report_items_report
+            ON daily_crawler_report_items (report_id, item_kind)
+            """
+        )
+        print("LOG: [DB Setup] 'daily_crawler_report_items' table created or already exists.")
         # ================================================
 
         print("LOG: [DB Setup] Enabling 'pg_trgm' extension...")
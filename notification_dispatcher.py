@@ -0,0 +1,153 @@
+# notification_dispatcher.py
+"""
+cdc_events → notification_outbox → 이메일 발송을 담당하는 워커 프로세스.
+
+1) 아직 적재되지 않은 CONTENT_COMPLETED 이벤트를 구독자별 다이제스트 outbox 행으로 묶습니다.
+2) 발송 가능한 outbox 행을 FOR UPDATE SKIP LOCKED로 선점해 제한된 동시성으로 발송합니다.
+3) 결과에 따라 sent / 재시도 예약(지수 백오프) / failed로 기록합니다.
+
+여러 워커를 동시에 띄워도 같은 행을 두 번 선점하지 않으며, 워커가 죽어 'sending'에 남은
+행은 NOTIFICATION_LEASE_SECONDS 이후 다른 워커가 회수합니다.
+"""
+import sys
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+import config
+from database import create_standalone_connection
+from repositories.notification_outbox_repo import (
+    claim_outbox_batch,
+    enqueue_digest_messages,
+    fetch_unenqueued_events,
+    mark_outbox_failed,
+    mark_outbox_sent,
+)
+from services.base_email_service import EmailMessage
+from services.email import get_email_service
+from services.notification_service import build_digest_message, plan_completion_digests
+from utils.record import read_field
+
+
+def retry_delay_seconds(attempts, max_attempts=None, base=None, cap=None):
+    """attempts번째 시도가 실패했을 때 다음 시도까지의 대기 시간(초). 더 이상 재시도하지 않으면 None."""
+    max_attempts = max_attempts if max_attempts is not None else config.NOTIFICATION_MAX_ATTEMPTS
+    base = base if base is not None else config.NOTIFICATION_RETRY_BASE_SECONDS
+    cap = cap if cap is not None else config.NOTIFICATION_RETRY_MAX_SECONDS
+    if attempts >= max_attempts:
+        return None
+    return min(cap, base * (2 ** max(0, attempts - 1)))
+
+
+class NotificationDispatcher:
+    def __init__(
+        self,
+        conn,
+        email_service,
+        *,
+        enqueue_batch_size=None,
+        batch_size=None,
+        concurrency=None,
+        lease_seconds=None,
+    ):
+        self.conn = conn
+        self.email_service = email_service
+        self.enqueue_batch_size = enqueue_batch_size or config.NOTIFICATION_ENQUEUE_BATCH_SIZE
+        self.batch_size = batch_size or config.NOTIFICATION_DISPATCH_BATCH_SIZE
+        self.concurrency = max(1, concurrency or config.NOTIFICATION_DISPATCH_CONCURRENCY)
+        self.lease_seconds = lease_seconds or config.NOTIFICATION_LEASE_SECONDS
+
+    def enqueue_pending_events(self):
+        """
+        outbox에 아직 적재되지 않은 완결 이벤트를 적재합니다.
+
+        한 배치 안에서 같은 사용자가 구독한 이벤트는 다이제스트 한 통으로 묶습니다.
+        """
+        try:
+            events = fetch_unenqueued_events(self.conn, self.enqueue_batch_size)
+            event_ids, titles, items = {}, {}, []
+            for event in events:
+                key = (str(read_field(event, "content_id")), read_field(event, "source"))
+                event_ids[key] = read_field(event, "id")
+                titles[key] = read_field(event, "title")
+                items.append((*key, read_field(event, "final_completed_at"), read_field(event, "resolved_by")))
+
+            messages = []
+            for digest in plan_completion_digests(self.conn, items, None, titles=titles):
+                subject, body = build_digest_message(digest["items"])
+                covered = [event_ids[(item["content_id"], item["source"])] for item in digest["items"]]
+                messages.append((covered, digest["user_id"], digest["email"], subject, body))
+            inserted = enqueue_digest_messages(self.conn, event_ids.values(), messages)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return {"events": len(events), "messages": inserted}
+
+    def dispatch_once(self):
+        """outbox 한 배치를 선점해 발송하고 결과를 기록합니다."""
+        claimed = claim_outbox_batch(self.conn, self.batch_size, self.lease_seconds)
+        if not claimed:
+            return {"claimed": 0, "sent": 0, "retried": 0, "failed": 0}
+
+        results = self.email_service.send_many(
+            [EmailMessage(row["email"], row["subject"], row["body"]) for row in claimed],
+            max_workers=self.concurrency,
+        )
+
+        sent, failures = [], []
+        retried = failed = 0
+        for row, result in zip(claimed, results):
+            if result.success:
+                sent.append((row["id"], row["attempts"]))
+                continue
+            retry_in = retry_delay_seconds(row["attempts"])
+            if retry_in is None:
+                failed += 1
+            else:
+                retried += 1
+            failures.append((row["id"], row["attempts"], (result.error or "unknown error")[:1000], retry_in))
+
+        try:
+            mark_outbox_sent(self.conn, sent)
+            mark_outbox_failed(self.conn, failures)
+            self.conn.commit()
+        except Exception:
+            # 기록에 실패하면 lease 만료 후 재발송됩니다(at-least-once).
+            self.conn.rollback()
+            raise
+
+        return {"claimed": len(claimed), "sent": len(sent), "retried": retried, "failed": failed}
+
+    def run_forever(self, poll_interval=None):
+        poll_interval = poll_interval if poll_interval is not None else config.NOTIFICATION_POLL_INTERVAL_SECONDS
+        while True:
+            enqueued = self.enqueue_pending_events()
+            stats = self.dispatch_once()
+            if enqueued["messages"] or stats["claimed"]:
+                print(
+                    f"LOG: [Notifier] 적재 {enqueued['messages']}건 / 발송 {stats['sent']}건 / "
+                    f"재시도 예약 {stats['retried']}건 / 실패 {stats['failed']}건"
+                )
+            if not enqueued["events"] and stats["claimed"] < self.batch_size:
+                time.sleep(poll_interval)
+
+
+if __name__ == '__main__':
+    try:
+        email_service = get_email_service()
+    except ValueError as e:
+        print(f"FATAL: 이메일 서비스 초기화 실패: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    conn = create_standalone_connection()
+    try:
+        NotificationDispatcher(conn, email_service).run_forever()
+    except KeyboardInterrupt:
+        print("LOG: [Notifier] 종료합니다.")
+    finally:
+        if hasattr(email_service, 'close'):
+            email_service.close()
+        conn.close()
@@ -1,14 +1,52 @@
 # report_sender.py
 import os
 import sys
-import json
+import uuid
 from datetime import datetime
 from dotenv import load_dotenv
-from database import create_standalone_connection, get_cursor
+
+import config
+from database import create_standalone_connection
+from repositories.crawler_reports_repo import (
+    claim_reports,
+    delete_claimed_reports,
+    iter_claimed_reports,
+    release_claimed_reports,
+)
 from services.email import get_email_service
 
 
+def _format_report_lines(report):
+    """보고서 요약 행 한 건을 메일 본문 줄들로 변환합니다."""
+    name, status = report['crawler_name'], report['status']
+    lines = [f"\n--- 🤖 {name} ({status}) ---"]
+
+    if status == '성공':
+        cdc_info = report['cdc_info'] or {}
+        resolved_by_counts = cdc_info.get('resolved_by_counts', {})
+
+        lines.append(f"  - 실행 시간: {report['duration_seconds'] or 0:.2f}초")
+        lines.append(f"  - 신규 등록: {report['new_contents'] or 0}개")
+        lines.append(
+            f"  - 신규 완결: {report['newly_completed_count'] or 0}건 (CDC 모드: {cdc_info.get('cdc_mode', 'unknown')})"
+        )
+        if resolved_by_counts:
+            lines.append(f"  - 완결 판정 출처: {resolved_by_counts}")
+        lines.append(f"  - CDC 이벤트 기록 수: {report['cdc_events_inserted_count'] or 0}건")
+    else:
+        lines.append(f"  - 오류: {report['error_message'] or '알 수 없는 오류'}")
+
+    return lines
+
+
 def send_consolidated_report():
+    """
+    발송되지 않은 크롤러 보고서를 선점(claim)해 한 통의 메일로 보내고, 선점한 행만 삭제합니다.
+
+    TRUNCATE 대신 행 단위로 선점/삭제하므로 크롤러가 동시에 보고서를 쓰고 있어도
+    막히지 않으며, 선점 이후에 들어온 보고서는 다음 실행에서 발송됩니다.
+    발송에 실패하면 선점을 해제해 다음 실행이 다시 가져가도록 합니다.
+    """
     load_dotenv()
     admin_email = os.getenv('ADMIN_EMAIL')
     if not admin_email:
@@ -22,56 +60,32 @@ def send_consolidated_report():
         sys.exit(1)
 
     conn = None
+    claim_token = uuid.uuid4().hex
+    claimed = 0
     try:
         conn = create_standalone_connection()
-        cursor = get_cursor(conn)
 
-        print("LOG: 일일 크롤러 보고서를 DB에서 조회합니다...")
-        cursor.execute("SELECT id, crawler_name, status, report_data FROM daily_crawler_reports")
-        reports = cursor.fetchall()
+        print("LOG: 발송할 크롤러 보고서를 선점합니다...")
+        claimed = claim_reports(conn, claim_token, config.REPORT_CLAIM_STALE_SECONDS)
 
-        if not reports:
+        if not claimed:
             print("LOG: 발송할 보고서가 없습니다. 종료합니다.")
             return
 
-        print(f"LOG: {len(reports)}개의 크롤러 보고서를 취합합니다.")
+        print(f"LOG: {claimed}개의 크롤러 보고서를 취합합니다.")
 
         overall_status_icon = "✅"
         overall_status_text = "성공"
         body_lines = [
-            f"안녕하세요, 관리자님.\n\n일일 콘텐츠 동기화 작업이 완료되었습니다.\n총 {len(reports)}개의 작업 결과가 보고되었습니다.\n"
+            f"안녕하세요, 관리자님.\n\n일일 콘텐츠 동기화 작업이 완료되었습니다.\n총 {claimed}개의 작업 결과가 보고되었습니다.\n"
         ]
 
-        for report in reports:
-            name = report['crawler_name']
-            status = report['status']
-            data = report['report_data']
-
-            if status == '실패':
+        for report in iter_claimed_reports(conn, claim_token):
+            if report['status'] == '실패':
                 overall_status_icon = "❌"
                 overall_status_text = "실패"
-
-            body_lines.append(f"\n--- 🤖 {name} ({status}) ---")
-
-            if status == '성공':
-                body_lines.append(f"  - 실행 시간: {data.get('duration', 0):.2f}초")
-                body_lines.append(f"  - 신규 등록: {data.get('new_webtoons', data.get('new_contents', 0))}개")
-
-                newly_completed_items = data.get('newly_completed_items', [])
-                cdc_info = data.get('cdc_info', {})
-                resolved_by_counts = cdc_info.get('resolved_by_counts', {})
-
-                newly_completed_count = cdc_info.get('newly_completed_count', len(newly_completed_items))
-                inserted_event_count = cdc_info.get('cdc_events_inserted_count', 0)
-
-                body_lines.append(
-                    f"  - 신규 완결: {newly_completed_count}건 (CDC 모드: {cdc_info.get('cdc_mode', 'unknown')})"
-                )
-                if resolved_by_counts:
-                    body_lines.append(f"  - 완결 판정 출처: {resolved_by_counts}")
-                body_lines.append(f"  - CDC 이벤트 기록 수: {inserted_event_count}건")
-            else:
-                body_lines.append(f"  - 오류: {data.get('error_message', '알 수 없는 오류')}")
+            body_lines.extend(_format_report_lines(report))
+        conn.rollback()  # 스트리밍용 읽기 트랜잭션 종료
 
         body = "\n".join(body_lines)
         now = datetime.now().strftime("%Y-%m-%d")
@@ -81,17 +95,24 @@ def send_consolidated_report():
         success = email_service.send_mail(admin_email, subject, body)
 
         if not success:
-            raise Exception("이메일 발송에 실패했습니다 (send_mail이 False 반환). 보고서 DB를 TRUNCATE하지 않습니다.")
+            raise Exception("이메일 발송에 실패했습니다 (send_mail이 False 반환). 선점한 보고서를 삭제하지 않습니다.")
 
         print("LOG: 통합 보고서 발송 완료.")
 
-        print("LOG: 'daily_crawler_reports' 테이블을 비웁니다 (TRUNCATE)...")
-        cursor.execute("TRUNCATE TABLE daily_crawler_reports;")
+        deleted = delete_claimed_reports(conn, claim_token)
         conn.commit()
-        print("LOG: 테이블 비우기 완료.")
+        claimed = 0
+        print(f"LOG: 발송한 보고서 {deleted}건을 삭제했습니다.")
 
     except Exception as e:
         print(f"FATAL: 통합 보고서 발송기 실행 중 치명적 오류 발생: {e}", file=sys.stderr)
+        if conn is not None and claimed:
+            try:
+                conn.rollback()
+                release_claimed_reports(conn, claim_token)
+                print("LOG: 보고서 선점을 해제했습니다. 다음 실행에서 다시 발송됩니다.")
+            except Exception as release_e:
+                print(f"경고: 보고서 선점 해제 실패 (만료 후 재선점됩니다): {release_e}", file=sys.stderr)
         sys.exit(1)
     finally:
         if conn:
@@ -1,5 +1,7 @@
 """Repository for CDC event persistence."""
 
+import psycopg2.extras
+
 from database import get_cursor
 
 
@@ -29,3 +31,54 @@ def insert_event(conn, *, content_id, source, event_type, final_status, final_co
     inserted = cursor.fetchone() is not None
     cursor.close()
     return inserted
+
+
+def insert_events(conn, events, page_size=1000) -> set:
+    """
+    Insert many CDC events idempotently with multi-row ``INSERT`` statements.
+
+    Args:
+        conn: Active DB connection (commit is left to the caller).
+        events: Iterable of dicts with ``content_id``, ``source``, ``event_type``,
+            ``final_status``, ``final_completed_at`` and ``resolved_by``.
+        page_size: Rows per statement sent by ``execute_values``.
+
+    Returns the set of ``(content_id, source, event_type)`` keys that were newly
+    inserted; keys that already existed are omitted.
+    """
+    rows = [
+        (
+            event["content_id"],
+            event["source"],
+            event["event_type"],
+            event["final_status"],
+            event["final_completed_at"],
+            event["resolved_by"],
+        )
+        for event in events
+    ]
+    if not rows:
+        return set()
+
+    cursor = get_cursor(conn)
+    inserted_rows = psycopg2.extras.execute_values(
+        cursor,
+        """
+        INSERT INTO cdc_events (
+            content_id,
+            source,
+            event_type,
+            final_status,
+            final_completed_at,
+            resolved_by
+        )
+        VALUES %s
+        ON CONFLICT (content_id, source, event_type) DO NOTHING
+        RETURNING content_id, source, event_type
+        """,
+        rows,
+        page_size=page_size,
+        fetch=True,
+    )
+    cursor.close()
+    return {(row[0], row[1], row[2]) for row in inserted_rows}
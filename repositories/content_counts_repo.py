@@ -0,0 +1,43 @@
+"""Repository for maintained per-(content_type, source, status) content counts."""
+
+from database import get_cursor
+
+
+def refresh_content_status_counts(conn, source):
+    """
+    Recompute the status counts of one source from ``contents``.
+
+    Run inside the crawl transaction that changed the source so listing endpoints can
+    report totals without ``COUNT(*)`` per request. Commit is left to the caller.
+    """
+    cursor = get_cursor(conn)
+    cursor.execute("DELETE FROM content_status_counts WHERE source = %s", (source,))
+    cursor.execute(
+        """
+        INSERT INTO content_status_counts (content_type, source, status, item_count, updated_at)
+        SELECT content_type, source, status, COUNT(*), NOW()
+        FROM contents
+        WHERE source = %s
+        GROUP BY content_type, source, status
+        """,
+        (source,),
+    )
+    cursor.close()
+
+
+def load_status_total(conn, content_type, status, source="all"):
+    """Return the maintained count for ``status`` (summed over sources when ``source`` is 'all')."""
+    cursor = get_cursor(conn)
+    query = """
+        SELECT COALESCE(SUM(item_count), 0) AS total
+        FROM content_status_counts
+        WHERE content_type = %s AND status = %s
+    """
+    params = [content_type, status]
+    if source != "all":
+        query += " AND source = %s"
+        params.append(source)
+    cursor.execute(query, tuple(params))
+    total = cursor.fetchone()["total"]
+    cursor.close()
+    return int(total)
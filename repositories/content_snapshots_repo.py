@@ -0,0 +1,75 @@
+"""Repository for pre-serialized, pre-compressed ongoing-contents snapshots."""
+
+from psycopg2.extras import execute_values
+
+from database import get_cursor
+
+# encoding -> column holding the body in that encoding
+SNAPSHOT_BODY_COLUMNS = {
+    'identity': 'body',
+    'gzip': 'body_gzip',
+    'br': 'body_br',
+}
+
+
+def upsert_snapshots(conn, rows, page_size=100):
+    """
+    Insert or replace snapshot rows.
+
+    ``rows`` are ``(content_type, source, weekday, projection, generation, data_version,
+    item_count, body, body_gzip, body_br)`` tuples. A row is only replaced by one built from an equal or
+    newer ``data_version``, so a slower concurrent crawl cannot overwrite a fresher snapshot.
+    Commit is left to the caller.
+    """
+    if not rows:
+        return 0
+    cursor = get_cursor(conn)
+    execute_values(
+        cursor,
+        """
+        INSERT INTO content_snapshots (
+            content_type, source, weekday, projection, generation, data_version, item_count,
+            body, body_gzip, body_br
+        )
+        VALUES %s
+        ON CONFLICT (content_type, source, weekday, projection) DO UPDATE SET
+            generation = EXCLUDED.generation,
+            data_version = EXCLUDED.data_version,
+            item_count = EXCLUDED.item_count,
+            body = EXCLUDED.body,
+            body_gzip = EXCLUDED.body_gzip,
+            body_br = EXCLUDED.body_br,
+            created_at = NOW()
+        WHERE content_snapshots.data_version <= EXCLUDED.data_version
+        """,
+        rows,
+        page_size=page_size,
+    )
+    written = cursor.rowcount
+    cursor.close()
+    return written
+
+
+def fetch_snapshot_body(conn, content_type, source, weekday, projection, encoding):
+    """
+    Return ``(generation, body_bytes)`` for one snapshot of ``projection`` in ``encoding``.
+
+    ``None`` is returned when no snapshot exists; ``body_bytes`` is ``None`` when the
+    snapshot was written without that encoding (e.g. brotli was unavailable).
+    """
+    column = SNAPSHOT_BODY_COLUMNS[encoding]
+    cursor = get_cursor(conn)
+    cursor.execute(
+        f"""
+        SELECT generation, {column} AS body
+        FROM content_snapshots
+        WHERE content_type = %s AND source = %s AND weekday = %s AND projection = %s
+        """,
+        (content_type, source, weekday, projection),
+    )
+    row = cursor.fetchone()
+    cursor.close()
+    if row is None:
+        return None
+    body = row['body']
+    return row['generation'], (bytes(body) if body is not None else None)
@@ -0,0 +1,36 @@
+"""Repository for per-source content data versions (cache generation counters)."""
+
+from database import get_cursor
+
+
+def bump_content_data_version(conn, source) -> int:
+    """
+    Increment the data version of ``source`` and return the new value.
+
+    Call inside the transaction that changes the source's data so the bump
+    becomes visible together with it. Commit is left to the caller.
+    """
+    cursor = get_cursor(conn)
+    cursor.execute(
+        """
+        INSERT INTO content_data_versions (source, version, updated_at)
+        VALUES (%s, 1, NOW())
+        ON CONFLICT (source) DO UPDATE SET
+            version = content_data_versions.version + 1,
+            updated_at = NOW()
+        RETURNING version
+        """,
+        (source,),
+    )
+    version = cursor.fetchone()["version"]
+    cursor.close()
+    return version
+
+
+def load_content_data_versions(conn) -> dict:
+    """Return ``{source: version}`` for every source that has been bumped at least once."""
+    cursor = get_cursor(conn)
+    cursor.execute("SELECT source, version FROM content_data_versions")
+    versions = {row["source"]: row["version"] for row in cursor.fetchall()}
+    cursor.close()
+    return versions
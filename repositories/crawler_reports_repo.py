@@ -0,0 +1,220 @@
+"""Repository for daily crawler reports (save → claim → stream → delete)."""
+
+import json
+
+import psycopg2.extras
+
+from database import get_cursor
+
+REPORT_ITEM_NEWLY_COMPLETED = "newly_completed"
+REPORT_ITEM_CDC_EVENT_INSERTED = "cdc_event_inserted"
+
+_SUMMARY_COLUMNS = (
+    "duration_seconds",
+    "new_contents",
+    "newly_completed_count",
+    "cdc_events_inserted_count",
+    "sync_inserted",
+    "sync_updated",
+    "sync_unchanged",
+    "fetch_requests",
+    "fetch_not_modified",
+)
+
+
+def split_crawler_report(report):
+    """
+    Split a crawler run report into typed summary columns, a compact JSON payload
+    and detail item rows.
+
+    Returns ``(summary, report_data, items)`` where ``items`` are
+    ``(item_kind, content_id, source, final_completed_at, resolved_by)`` tuples.
+    Item lists are moved out of the JSON payload into the detail table.
+    """
+    report_data = dict(report)
+    newly_completed_items = report_data.pop("newly_completed_items", None) or []
+    cdc_info = dict(report_data.get("cdc_info") or {})
+    cdc_inserted_ids = cdc_info.pop("cdc_events_inserted_items", None) or []
+    if "cdc_info" in report_data:
+        report_data["cdc_info"] = cdc_info
+
+    sync_stats = report_data.get("sync_stats") or {}
+    fetch_stats = report_data.get("fetch_stats") or {}
+    new_contents = report_data.get("new_contents", report_data.get("new_webtoons"))
+
+    summary = {
+        "duration_seconds": report_data.get("duration"),
+        "new_contents": new_contents,
+        "newly_completed_count": cdc_info.get("newly_completed_count", len(newly_completed_items) if cdc_info else None),
+        "cdc_events_inserted_count": cdc_info.get("cdc_events_inserted_count"),
+        "sync_inserted": sync_stats.get("inserted"),
+        "sync_updated": sync_stats.get("updated"),
+        "sync_unchanged": sync_stats.get("unchanged"),
+        "fetch_requests": fetch_stats.get("requests"),
+        "fetch_not_modified": fetch_stats.get("not_modified"),
+    }
+
+    items = []
+    source_by_id = {}
+    for content_id, source, final_completed_at, resolved_by in newly_completed_items:
+        source_by_id[str(content_id)] = source
+        items.append((REPORT_ITEM_NEWLY_COMPLETED, str(content_id), source, final_completed_at, resolved_by))
+    for content_id in cdc_inserted_ids:
+        items.append((REPORT_ITEM_CDC_EVENT_INSERTED, str(content_id), source_by_id.get(str(content_id)), None, None))
+
+    return summary, report_data, items
+
+
+def save_crawler_report(conn, crawler_name, report) -> int:
+    """
+    Persist a crawler run report as one compact summary row plus detail item rows.
+
+    Commit is left to the caller. Returns the new report id.
+    """
+    summary, report_data, items = split_crawler_report(report)
+
+    cursor = get_cursor(conn)
+    columns = ", ".join(_SUMMARY_COLUMNS)
+    placeholders = ", ".join(["%s"] * len(_SUMMARY_COLUMNS))
+    cursor.execute(
+        f"""
+        INSERT INTO daily_crawler_reports (crawler_name, status, report_data, {columns})
+        VALUES (%s, %s, %s, {placeholders})
+        RETURNING id
+        """,
+        (
+            crawler_name,
+            report["status"],
+            json.dumps(report_data, ensure_ascii=False, default=str),
+            *(summary[column] for column in _SUMMARY_COLUMNS),
+        ),
+    )
+    report_id = cursor.fetchone()["id"]
+
+    if items:
+        psycopg2.extras.execute_values(
+            cursor,
+            """
+            INSERT INTO daily_crawler_report_items (
+                report_id, item_kind, content_id, source, final_completed_at, resolved_by
+            )
+            VALUES %s
+            """,
+            [(report_id, *item) for item in items],
+            page_size=1000,
+        )
+    cursor.close()
+    return report_id
+
+
+def fetch_report_items(conn, report_id, item_kind=None):
+    """Load the detail item rows of one report, optionally filtered by kind."""
+    cursor = get_cursor(conn)
+    query = """
+        SELECT item_kind, content_id, source, final_completed_at, resolved_by
+        FROM daily_crawler_report_items
+        WHERE report_id = %s
+    """
+    params = [report_id]
+    if item_kind is not None:
+        query += " AND item_kind = %s"
+        params.append(item_kind)
+    cursor.execute(query + " ORDER BY id", params)
+    rows = cursor.fetchall()
+    cursor.close()
+    return rows
+
+
+def claim_reports(conn, claim_token, stale_after_seconds) -> int:
+    """
+    Claim every unclaimed report (or one whose claim went stale) for ``claim_token``.
+
+    Only row locks are taken (``FOR UPDATE SKIP LOCKED``), so crawlers can keep
+    inserting reports while a sender runs; rows inserted afterwards are left for
+    the next run. The claim is committed here. Returns the number of claimed rows.
+    """
+    cursor = get_cursor(conn)
+    cursor.execute(
+        """
+        UPDATE daily_crawler_reports r
+        SET claim_token = %s, claimed_at = NOW()
+        WHERE r.id IN (
+            SELECT id
+            FROM daily_crawler_reports
+            WHERE claim_token IS NULL
+               OR claimed_at < NOW() - make_interval(secs => %s)
+            FOR UPDATE SKIP LOCKED
+        )
+        """,
+        (claim_token, stale_after_seconds),
+    )
+    claimed = cursor.rowcount
+    conn.commit()
+    cursor.close()
+    return claimed
+
+
+def iter_claimed_reports(conn, claim_token, itersize=100):
+    """
+    Stream the reports claimed by ``claim_token`` in insertion order via a server-side cursor.
+
+    Only summary columns and small JSON fields are read; item lists stay in
+    ``daily_crawler_report_items``.
+    """
+    cursor = conn.cursor(name="claimed_reports", cursor_factory=psycopg2.extras.DictCursor)
+    cursor.itersize = itersize
+    try:
+        cursor.execute(
+            """
+            -- 요약 컬럼이 없는 이전 형식의 행은 report_data에서 같은 값을 꺼냅니다.
+            SELECT
+                id,
+                crawler_name,
+                status,
+                COALESCE(duration_seconds, (report_data ->> 'duration')::double precision) AS duration_seconds,
+                COALESCE(
+                    new_contents,
+                    (report_data ->> 'new_contents')::integer,
+                    (report_data ->> 'new_webtoons')::integer
+                ) AS new_contents,
+                COALESCE(
+                    newly_completed_count,
+                    (report_data -> 'cdc_info' ->> 'newly_completed_count')::integer,
+                    jsonb_array_length(COALESCE(report_data -> 'newly_completed_items', '[]'::jsonb))
+                ) AS newly_completed_count,
+                COALESCE(
+                    cdc_events_inserted_count,
+                    (report_data -> 'cdc_info' ->> 'cdc_events_inserted_count')::integer
+                ) AS cdc_events_inserted_count,
+                (report_data -> 'cdc_info') - 'cdc_events_inserted_items' AS cdc_info,
+                report_data ->> 'error_message' AS error_message
+            FROM daily_crawler_reports
+            WHERE claim_token = %s
+            ORDER BY id
+            """,
+            (claim_token,),
+        )
+        for row in cursor:
+            yield row
+    finally:
+        cursor.close()
+
+
+def delete_claimed_reports(conn, claim_token) -> int:
+    """Delete only the rows claimed by ``claim_token``. Commit is left to the caller."""
+    cursor = get_cursor(conn)
+    cursor.execute("DELETE FROM daily_crawler_reports WHERE claim_token = %s", (claim_token,))
+    deleted = cursor.rowcount
+    cursor.close()
+    return deleted
+
+
+def release_claimed_reports(conn, claim_token) -> None:
+    """Give claimed rows back so the next run picks them up again, and commit."""
+    cursor = get_cursor(conn)
+    cursor.execute(
+        "UPDATE daily_crawler_reports SET claim_token = NULL, claimed_at = NULL WHERE claim_token = %s",
+        (claim_token,),
+    )
+    conn.commit()
+    cursor.close()
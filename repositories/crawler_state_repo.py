@@ -0,0 +1,40 @@
+"""Repository for per-source crawler state (incremental crawl high-water marks)."""
+
+import json
+
+from database import get_cursor
+
+
+def load_crawler_state(conn, source) -> dict:
+    """
+    Load the persisted crawler state for ``source``.
+
+    Returns an empty dict when nothing has been recorded yet.
+    """
+    cursor = get_cursor(conn)
+    cursor.execute("SELECT state FROM crawler_state WHERE source = %s", (source,))
+    row = cursor.fetchone()
+    cursor.close()
+    if row is None:
+        return {}
+    return row["state"] or {}
+
+
+def save_crawler_state(conn, source, state) -> None:
+    """
+    Upsert the crawler state for ``source``.
+
+    Commit is left to the caller so the state moves together with the synced data.
+    """
+    cursor = get_cursor(conn)
+    cursor.execute(
+        """
+        INSERT INTO crawler_state (source, state, updated_at)
+        VALUES (%s, %s, NOW())
+        ON CONFLICT (source) DO UPDATE SET
+            state = EXCLUDED.state,
+            updated_at = NOW()
+        """,
+        (source, json.dumps(state)),
+    )
+    cursor.close()
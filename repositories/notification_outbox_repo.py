@@ -0,0 +1,169 @@
+"""Repository for the notification outbox (cdc_events -> per-subscriber digest emails)."""
+
+import psycopg2.extras
+
+from database import get_cursor
+from services.cdc_constants import EVENT_CONTENT_COMPLETED
+
+
+def fetch_unenqueued_events(conn, limit):
+    """
+    Lock up to ``limit`` CONTENT_COMPLETED events that have not been fanned out yet.
+
+    Rows are locked with ``FOR UPDATE SKIP LOCKED`` so concurrent workers enqueue
+    disjoint events; the lock is held until the caller commits.
+    """
+    cursor = get_cursor(conn)
+    cursor.execute(
+        """
+        SELECT e.id, e.content_id, e.source, e.final_completed_at, e.resolved_by, c.title
+        FROM cdc_events e
+        LEFT JOIN contents c
+          ON c.content_id = e.content_id
+         AND c.source = e.source
+        WHERE e.outbox_enqueued_at IS NULL
+          AND e.event_type = %s
+        ORDER BY e.id
+        LIMIT %s
+        FOR UPDATE OF e SKIP LOCKED
+        """,
+        (EVENT_CONTENT_COMPLETED, limit),
+    )
+    rows = cursor.fetchall()
+    cursor.close()
+    return rows
+
+
+def enqueue_digest_messages(conn, event_ids, messages) -> int:
+    """
+    Insert one outbox row per subscriber digest and mark the events enqueued.
+
+    Args:
+        event_ids: Ids of every event in the batch, including events without subscribers.
+        messages: Iterable of ``(cdc_event_ids, user_id, email, subject, body)``, one per
+            user; ``cdc_event_ids`` lists the events the digest covers.
+
+    Returns the number of outbox rows inserted. Commit is left to the caller.
+    """
+    event_ids = list(event_ids)
+    if not event_ids:
+        return 0
+
+    cursor = get_cursor(conn)
+    inserted = 0
+    messages = [
+        (min(ids), sorted(ids), user_id, email, subject, body)
+        for ids, user_id, email, subject, body in messages
+    ]
+    if messages:
+        inserted_rows = psycopg2.extras.execute_values(
+            cursor,
+            """
+            INSERT INTO notification_outbox (cdc_event_id, cdc_event_ids, user_id, email, subject, body)
+            VALUES %s
+            ON CONFLICT (cdc_event_id, user_id) DO NOTHING
+            RETURNING 1
+            """,
+            messages,
+            template="(%s::integer, %s::integer[], %s::integer, %s, %s, %s)",
+            fetch=True,
+        )
+        inserted = len(inserted_rows)
+    cursor.execute(
+        "UPDATE cdc_events SET outbox_enqueued_at = NOW() WHERE id = ANY(%s)",
+        (event_ids,),
+    )
+    cursor.close()
+    return inserted
+
+
+def claim_outbox_batch(conn, limit, lease_seconds):
+    """
+    Claim up to ``limit`` deliverable outbox rows for this worker and commit the claim.
+
+    Pending rows whose ``next_attempt_at`` has passed are claimed, as are
+    ``sending`` rows whose lease expired (a worker died mid-batch). Claimed rows
+    move to ``sending`` with ``attempts`` incremented.
+    """
+    cursor = get_cursor(conn)
+    cursor.execute(
+        """
+        UPDATE notification_outbox o
+        SET status = 'sending',
+            locked_at = NOW(),
+            attempts = o.attempts + 1
+        WHERE o.id IN (
+            SELECT id
+            FROM notification_outbox
+            WHERE (status = 'pending' AND next_attempt_at <= NOW())
+               OR (status = 'sending' AND locked_at < NOW() - make_interval(secs => %s))
+            ORDER BY id
+            LIMIT %s
+            FOR UPDATE SKIP LOCKED
+        )
+        RETURNING o.id, o.email, o.subject, o.body, o.attempts
+        """,
+        (lease_seconds, limit),
+    )
+    rows = cursor.fetchall()
+    conn.commit()
+    cursor.close()
+    return rows
+
+
+def mark_outbox_sent(conn, claims) -> None:
+    """
+    Mark claimed rows as delivered. Commit is left to the caller.
+
+    Args:
+        claims: Iterable of ``(outbox_id, attempts)`` as returned by the claim;
+            ``attempts`` fences out a worker whose lease was already reclaimed.
+    """
+    claims = list(claims)
+    if not claims:
+        return
+    cursor = get_cursor(conn)
+    psycopg2.extras.execute_values(
+        cursor,
+        """
+        UPDATE notification_outbox o
+        SET status = 'sent', sent_at = NOW(), locked_at = NULL, last_error = NULL
+        FROM (VALUES %s) AS v(id, attempts)
+        WHERE o.id = v.id AND o.attempts = v.attempts AND o.status = 'sending'
+        """,
+        claims,
+        template="(%s::bigint, %s::integer)",
+    )
+    cursor.close()
+
+
+def mark_outbox_failed(conn, failures) -> None:
+    """
+    Record failed deliveries. Commit is left to the caller.
+
+    Args:
+        failures: Iterable of ``(outbox_id, attempts, error, retry_in_seconds)``;
+            a ``retry_in_seconds`` of ``None`` marks the row permanently failed.
+    """
+    failures = list(failures)
+    if not failures:
+        return
+    cursor = get_cursor(conn)
+    psycopg2.extras.execute_values(
+        cursor,
+        """
+        UPDATE notification_outbox o
+        SET status = CASE WHEN v.retry_in IS NULL THEN 'failed' ELSE 'pending' END,
+            next_attempt_at = CASE
+                WHEN v.retry_in IS NULL THEN o.next_attempt_at
+                ELSE NOW() + make_interval(secs => v.retry_in)
+            END,
+            locked_at = NULL,
+            last_error = v.error
+        FROM (VALUES %s) AS v(id, attempts, error, retry_in)
+        WHERE o.id = v.id AND o.attempts = v.attempts AND o.status = 'sending'
+        """,
+        failures,
+        template="(%s::bigint, %s::integer, %s, %s::double precision)",
+    )
+    cursor.close()
@@ -0,0 +1,40 @@
+"""Repository for subscription lookups used by notification fan-out."""
+
+import psycopg2.extras
+
+
+def iter_subscribers_for_contents(conn, content_keys, itersize=2000):
+    """
+    Stream ``(content_id, source, user_id, email)`` rows for a batch of contents.
+
+    A single query covers the whole batch (keys are passed as two parallel
+    arrays and ``unnest``-ed), and rows are read through a server-side named
+    cursor so large fan-outs are not materialized in memory. Rows are ordered by
+    ``user_id`` so callers can group per user while streaming.
+
+    Args:
+        content_keys: Iterable of ``(content_id, source)``.
+    """
+    keys = list(dict.fromkeys((str(content_id), source) for content_id, source in content_keys))
+    if not keys:
+        return
+
+    cursor = conn.cursor(name="completion_fanout", cursor_factory=psycopg2.extras.DictCursor)
+    cursor.itersize = itersize
+    try:
+        cursor.execute(
+            """
+            SELECT DISTINCT s.content_id, s.source, u.id AS user_id, u.email
+            FROM unnest(%s::text[], %s::text[]) AS k(content_id, source)
+            JOIN subscriptions s
+              ON s.content_id = k.content_id
+             AND s.source = k.source
+            JOIN users u ON u.id = s.user_id
+            ORDER BY u.id, s.source, s.content_id
+            """,
+            ([content_id for content_id, _ in keys], [source for _, source in keys]),
+        )
+        for row in cursor:
+            yield row["content_id"], row["source"], row["user_id"], row["email"]
+    finally:
+        cursor.close()
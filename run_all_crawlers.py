@@ -1,14 +1,17 @@
 # run_all_crawlers.py
 import asyncio
+import multiprocessing
+import multiprocessing.connection
 import time
 import traceback
-import json
 import sys
 from dotenv import load_dotenv
 
 load_dotenv()
 
-from database import create_standalone_connection, get_cursor
+import config
+from database import create_standalone_connection
+from repositories.crawler_reports_repo import save_crawler_report
 from crawlers.naver_webtoon_crawler import NaverWebtoonCrawler
 from crawlers.kakaowebtoon_crawler import KakaowebtoonCrawler
 
@@ -18,19 +21,46 @@ ALL_CRAWLERS = [
 ]
 
 
+def _display_name(crawler_class, crawler_instance=None):
+    # 인스턴스가 없으면 클래스 속성 source_name을 씁니다 (생성자 부작용 없이 이름만 필요할 때).
+    name = (
+        getattr(crawler_instance, 'source_name', None)
+        or getattr(crawler_class, 'source_name', None)
+        or crawler_class.__name__
+    )
+    return name.replace('_', ' ').title()
+
+
+def _save_report(crawler_display_name, report):
+    """크롤러 실행 결과를 daily_crawler_reports 테이블에 저장합니다. 저장에 성공하면 True를 반환합니다."""
+    report_conn = None
+    try:
+        report_conn = create_standalone_connection()
+        save_crawler_report(report_conn, crawler_display_name, report)
+        report_conn.commit()
+        print(f"LOG: [{crawler_display_name}]의 실행 결과를 DB에 성공적으로 저장했습니다.")
+        return True
+    except Exception as report_e:
+        print(f"FATAL: [{crawler_display_name}]의 보고서를 DB에 저장하는 데 실패했습니다: {report_e}", file=sys.stderr)
+        return False
+    finally:
+        if report_conn:
+            report_conn.close()
+
+
 async def run_one_crawler(crawler_class):
     """
     단일 크롤러 인스턴스를 생성하고 실행한 뒤, 그 결과를 DB에 보고합니다.
+    보고서 저장에 성공했는지를 반환합니다.
     """
     report = {'status': '성공'}
     crawler_start_time = time.time()
 
     db_conn = None
-    crawler_display_name = crawler_class.__name__
+    crawler_display_name = _display_name(crawler_class)
     try:
         crawler_instance = crawler_class()
-        crawler_display_name = getattr(crawler_instance, 'source_name', crawler_class.__name__)
-        crawler_display_name = crawler_display_name.replace('_', ' ').title()
+        crawler_display_name = _display_name(crawler_class, crawler_instance)
 
         print(f"\n--- [{crawler_display_name}] 크롤러 작업 시작 ---")
 
@@ -41,10 +71,11 @@ async def run_one_crawler(crawler_class):
             'new_contents': new_contents,
             'newly_completed_items': newly_completed_items,
             'cdc_info': cdc_info,
+            'sync_stats': crawler_instance.last_sync_stats,
+            'fetch_stats': crawler_instance.last_fetch_stats,
         })
 
     except Exception as e:
-        crawler_display_name = crawler_display_name.replace('_', ' ').title()
         print(f"FATAL: [{crawler_display_name}] 크롤러 실행 중 치명적 오류 발생: {e}", file=sys.stderr)
         report['status'] = '실패'
         report['error_message'] = traceback.format_exc()
@@ -54,43 +85,109 @@ async def run_one_crawler(crawler_class):
         if db_conn:
             db_conn.close()
 
-        report_conn = None
-        try:
-            report_conn = create_standalone_connection()
-            report_cursor = get_cursor(report_conn)
-            report_cursor.execute(
-                """
-                INSERT INTO daily_crawler_reports (crawler_name, status, report_data)
-                VALUES (%s, %s, %s)
-                """,
-                (crawler_display_name, report['status'], json.dumps(report))
-            )
-            report_conn.commit()
-            report_cursor.close()
-            print(f"LOG: [{crawler_display_name}]의 실행 결과를 DB에 성공적으로 저장했습니다.")
-        except Exception as report_e:
-            print(f"FATAL: [{crawler_display_name}]의 보고서를 DB에 저장하는 데 실패했습니다: {report_e}", file=sys.stderr)
-        finally:
-            if report_conn:
-                report_conn.close()
-
-
-async def main():
+        report_saved = _save_report(crawler_display_name, report)
+    return report_saved
+
+
+def _run_crawler_process(crawler_class, report_saved):
     """
-    등록된 모든 크롤러를 병렬로 실행하고, 각 크롤러의 실행 결과를 DB에 저장합니다.
+    process 모드에서 자식 프로세스가 실행하는 진입점입니다.
+
+    보고서를 저장했으면 report_saved 이벤트를 세워, 부모가 실패 보고서를 중복 저장하지 않게 합니다.
     """
-    start_time = time.time()
-    print("==========================================")
-    print("   통합 크롤러 실행 스크립트 시작")
-    print("==========================================")
+    if asyncio.run(run_one_crawler(crawler_class)):
+        report_saved.set()
+
 
-    tasks = [run_one_crawler(crawler_class) for crawler_class in ALL_CRAWLERS]
+async def run_all_in_event_loop(crawler_classes):
+    """모든 크롤러를 하나의 이벤트 루프에서 asyncio.gather로 실행합니다."""
+    tasks = [run_one_crawler(crawler_class) for crawler_class in crawler_classes]
     results = await asyncio.gather(*tasks, return_exceptions=True)
 
     for result in results:
         if isinstance(result, Exception):
             print(f"WARNING: 크롤러 작업 중 일부가 gather 레벨에서 예외를 반환했습니다: {result}", file=sys.stderr)
 
+
+def run_all_in_processes(crawler_classes, max_workers, timeout, target=_run_crawler_process):
+    """
+    크롤러마다 별도 프로세스를 띄워 실행합니다.
+
+    - 동시에 실행되는 프로세스는 max_workers개로 제한합니다.
+    - 한 크롤러의 동기 DB 작업이나 CPU 작업이 다른 크롤러의 네트워크 I/O를 막지 않습니다.
+    - timeout초를 넘긴 크롤러는 강제 종료하고, 부모 프로세스가 실패 보고서를 대신 저장합니다.
+      보고서를 남기기 전에 비정상 종료한 자식(크래시, OOM kill 등)도 마찬가지입니다.
+      각 자식은 자기 보고서를 직접 저장하므로 다른 크롤러의 결과는 영향을 받지 않습니다.
+
+    target은 ``(crawler_class, report_saved)``를 받으며, 보고서를 저장했으면 report_saved를 세웁니다.
+    """
+    ctx = multiprocessing.get_context('spawn')
+    pending = list(crawler_classes)
+    running = {}  # sentinel -> (process, crawler_class, started_at, report_saved)
+
+    while pending or running:
+        while pending and len(running) < max(1, max_workers):
+            crawler_class = pending.pop(0)
+            report_saved = ctx.Event()
+            process = ctx.Process(target=target, args=(crawler_class, report_saved), name=crawler_class.__name__)
+            process.start()
+            running[process.sentinel] = (process, crawler_class, time.monotonic(), report_saved)
+            print(f"LOG: [{crawler_class.__name__}] 프로세스 시작 (pid={process.pid})")
+
+        now = time.monotonic()
+        next_deadline = min(started_at + timeout for _, _, started_at, _ in running.values())
+        ready = multiprocessing.connection.wait(list(running.keys()), timeout=max(0.0, next_deadline - now))
+
+        for sentinel in ready:
+            process, crawler_class, started_at, report_saved = running.pop(sentinel)
+            process.join()
+            if process.exitcode != 0:
+                print(
+                    f"WARNING: [{crawler_class.__name__}] 프로세스가 비정상 종료했습니다 (exitcode={process.exitcode}).",
+                    file=sys.stderr,
+                )
+                if not report_saved.is_set():
+                    _save_report(_display_name(crawler_class), {
+                        'status': '실패',
+                        'error_message': f"크롤러 프로세스가 보고서를 남기지 못하고 비정상 종료했습니다 (exitcode={process.exitcode}).",
+                        'duration': time.monotonic() - started_at,
+                    })
+
+        now = time.monotonic()
+        for sentinel, (process, crawler_class, started_at, report_saved) in list(running.items()):
+            if now - started_at < timeout:
+                continue
+            print(f"FATAL: [{crawler_class.__name__}] {timeout:.0f}초 제한 시간을 넘겨 프로세스를 종료합니다.", file=sys.stderr)
+            process.terminate()
+            process.join(5)
+            if process.is_alive():
+                process.kill()
+                process.join()
+            running.pop(sentinel)
+            if report_saved.is_set():
+                continue
+
+            _save_report(_display_name(crawler_class), {
+                'status': '실패',
+                'error_message': f"크롤러가 제한 시간({timeout:.0f}초)을 넘겨 강제 종료되었습니다.",
+                'duration': now - started_at,
+            })
+
+
+def main():
+    """
+    등록된 모든 크롤러를 병렬로 실행하고, 각 크롤러의 실행 결과를 DB에 저장합니다.
+    """
+    start_time = time.time()
+    print("==========================================")
+    print("   통합 크롤러 실행 스크립트 시작")
+    print("==========================================")
+
+    if config.CRAWLER_EXECUTOR == 'process':
+        run_all_in_processes(ALL_CRAWLERS, config.CRAWLER_MAX_WORKERS, config.CRAWLER_TIMEOUT_SECONDS)
+    else:
+        asyncio.run(run_all_in_event_loop(ALL_CRAWLERS))
+
     total_duration = time.time() - start_time
     print("\n==========================================")
     print(f"  통합 크롤러 실행 완료 (총 소요 시간: {total_duration:.2f}초)")
@@ -98,4 +195,4 @@ async def main():
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    main()
@@ -0,0 +1,215 @@
+# scheduled_completion_ticker.py
+"""
+예약 완결(override_completed_at이 미래인 '완결' override)을 정시에 CDC 이벤트로 발행하는 상주 프로세스.
+
+- 다가오는 예약 완결을 메모리 min-heap에 보관하고, 가장 이른 시각까지 잠든 뒤 이벤트를 발행합니다.
+- 관리자가 override를 변경/삭제하면 pg_notify(SCHEDULED_COMPLETION_CHANNEL)로 알림을 받아 해당 키만 갱신합니다.
+- 알림 누락에 대비해 SCHEDULED_COMPLETION_RESYNC_SECONDS마다 DB에서 전체를 다시 읽습니다.
+
+SCHEDULED_COMPLETION_MODE=ticker로 설정하면 크롤러는 예약 완결 처리를 건너뜁니다.
+"""
+import heapq
+import json
+import select
+import sys
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+import config
+from database import create_standalone_connection, get_cursor
+from services.cdc_event_service import record_due_scheduled_completions
+from services.cdc_constants import STATUS_COMPLETED
+from utils.record import read_field
+from utils.time import now_kst_naive
+
+
+class ScheduledCompletionTicker:
+    """
+    예약 완결 min-heap과 발행 로직.
+
+    heap 항목은 (completed_at, content_id, source)이며, 변경된 키의 옛 항목은
+    ``_scheduled``와 비교해 pop 시점에 버립니다(lazy invalidation).
+    """
+
+    def __init__(self, conn, now_fn=now_kst_naive):
+        self.conn = conn
+        self.now_fn = now_fn
+        self._heap = []
+        self._scheduled = {}
+        self.fired_count = 0
+
+    def _push(self, content_id, source, completed_at):
+        key = (content_id, source)
+        self._scheduled[key] = completed_at
+        heapq.heappush(self._heap, (completed_at, content_id, source))
+
+    def reload(self):
+        """DB에서 아직 도래하지 않은 예약 완결 전체를 다시 읽어 heap을 재구성합니다."""
+        now = self.now_fn()
+        cursor = get_cursor(self.conn)
+        cursor.execute(
+            """
+            SELECT content_id, source, override_completed_at
+            FROM admin_content_overrides
+            WHERE override_status = %s
+              AND completion_recorded_at IS NULL
+              AND override_completed_at > %s
+            """,
+            (STATUS_COMPLETED, now),
+        )
+        rows = cursor.fetchall()
+        cursor.close()
+
+        self._heap = []
+        self._scheduled = {}
+        for row in rows:
+            self._push(
+                read_field(row, "content_id"),
+                read_field(row, "source"),
+                read_field(row, "override_completed_at"),
+            )
+        return len(self._scheduled)
+
+    def refresh_key(self, content_id, source):
+        """알림을 받은 override 한 건만 다시 읽어 예약 상태를 갱신합니다."""
+        cursor = get_cursor(self.conn)
+        cursor.execute(
+            """
+            SELECT override_completed_at
+            FROM admin_content_overrides
+            WHERE content_id = %s
+              AND source = %s
+              AND override_status = %s
+            """,
+            (content_id, source, STATUS_COMPLETED),
+        )
+        row = cursor.fetchone()
+        cursor.close()
+
+        completed_at = read_field(row, "override_completed_at")
+        if completed_at is None:
+            # 삭제/상태 변경/즉시 완결: 더 이상 예약이 아님
+            self._scheduled.pop((content_id, source), None)
+            return
+        self._push(content_id, source, completed_at)
+
+    def handle_notification(self, payload):
+        try:
+            data = json.loads(payload)
+            content_id, source = data["content_id"], data["source"]
+        except (ValueError, KeyError, TypeError):
+            # 알 수 없는 알림은 전체 재동기화로 처리
+            self.reload()
+            return
+        self.refresh_key(content_id, source)
+
+    def _discard_stale(self):
+        while self._heap:
+            completed_at, content_id, source = self._heap[0]
+            if self._scheduled.get((content_id, source)) == completed_at:
+                return
+            heapq.heappop(self._heap)
+
+    def next_due_at(self):
+        """가장 이른 유효 예약 시각(없으면 None)."""
+        self._discard_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def fire_due(self, now=None):
+        """
+        도래한 예약 완결을 발행합니다.
+
+        heap에서 도래 항목을 꺼낸 뒤, 실제 발행은 멱등한 set 기반
+        record_due_scheduled_completions에 맡겨 놓친 항목까지 함께 처리합니다.
+        """
+        now = now if now is not None else self.now_fn()
+        due_keys = []
+        while True:
+            next_due = self.next_due_at()
+            if next_due is None or next_due > now:
+                break
+            _, content_id, source = heapq.heappop(self._heap)
+            self._scheduled.pop((content_id, source), None)
+            due_keys.append((content_id, source))
+
+        if not due_keys:
+            return 0
+
+        try:
+            return self.catch_up(now)
+        except Exception:
+            # 다음 루프에서 다시 시도되도록 예약을 되돌립니다.
+            for content_id, source in due_keys:
+                self._push(content_id, source, now)
+            raise
+
+    def catch_up(self, now=None):
+        """도래했지만 아직 이벤트가 없는 예약 완결을 모두 발행합니다(멱등)."""
+        now = now if now is not None else self.now_fn()
+        cursor = get_cursor(self.conn)
+        try:
+            result = record_due_scheduled_completions(self.conn, cursor, now)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+        self.fired_count += result["inserted_count"]
+        return result["inserted_count"]
+
+    def seconds_until_next(self, max_sleep):
+        next_due = self.next_due_at()
+        if next_due is None:
+            return max_sleep
+        return max(0.0, min(max_sleep, (next_due - self.now_fn()).total_seconds()))
+
+
+def run_forever(resync_seconds=None):
+    resync_seconds = resync_seconds or config.SCHEDULED_COMPLETION_RESYNC_SECONDS
+
+    conn = create_standalone_connection()
+    # LISTEN 알림은 트랜잭션 밖에서만 전달되므로 autocommit으로 동작합니다.
+    conn.autocommit = True
+    listen_cursor = get_cursor(conn)
+    listen_cursor.execute(f"LISTEN {config.SCHEDULED_COMPLETION_CHANNEL}")
+    listen_cursor.close()
+
+    ticker = ScheduledCompletionTicker(conn)
+    inserted = ticker.catch_up()
+    if inserted:
+        print(f"LOG: [Ticker] 밀린 예약 완결 이벤트 {inserted}건을 발행했습니다.")
+    print(f"LOG: [Ticker] 예약 완결 {ticker.reload()}건을 불러왔습니다.")
+    last_resync = time.monotonic()
+
+    while True:
+        timeout = ticker.seconds_until_next(resync_seconds)
+        ready, _, _ = select.select([conn], [], [], timeout)
+        if ready:
+            conn.poll()
+            while conn.notifies:
+                notify = conn.notifies.pop(0)
+                ticker.handle_notification(notify.payload)
+
+        if time.monotonic() - last_resync >= resync_seconds:
+            ticker.catch_up()
+            ticker.reload()
+            last_resync = time.monotonic()
+
+        inserted = ticker.fire_due()
+        if inserted:
+            print(f"LOG: [Ticker] 예약 완결 이벤트 {inserted}건을 발행했습니다.")
+
+
+if __name__ == '__main__':
+    try:
+        run_forever()
+    except KeyboardInterrupt:
+        print("LOG: [Ticker] 종료합니다.")
+    except Exception as e:
+        print(f"FATAL: [Ticker] 예약 완결 처리 중 오류 발생: {e}", file=sys.stderr)
+        sys.exit(1)
@@ -1,4 +1,8 @@
+import json
+
+import config
 from database import get_cursor
+from repositories.content_versions_repo import bump_content_data_version
 from services.cdc_event_service import record_content_completed_event
 from services.final_state_resolver import resolve_final_state
 from utils.time import now_kst_naive
@@ -29,6 +33,22 @@ def _serialize_override_row(row):
     }
 
 
+def notify_override_changed(cursor, content_id, source):
+    """
+    Notify the scheduled-completion ticker that an override changed.
+
+    NOTIFY is transactional, so the message is delivered only when the
+    caller commits.
+    """
+    cursor.execute(
+        "SELECT pg_notify(%s, %s)",
+        (
+            config.SCHEDULED_COMPLETION_CHANNEL,
+            json.dumps({"content_id": content_id, "source": source}, ensure_ascii=False),
+        ),
+    )
+
+
 def upsert_override_and_record_event(
     conn,
     *,
@@ -86,7 +106,8 @@ def upsert_override_and_record_event(
             override_completed_at = EXCLUDED.override_completed_at,
             reason = EXCLUDED.reason,
             admin_id = EXCLUDED.admin_id,
-            updated_at = NOW()
+            updated_at = NOW(),
+            completion_recorded_at = NULL
         RETURNING id, content_id, source, override_status, override_completed_at, reason, admin_id, created_at, updated_at
         """,
         (content_id, source, override_status, override_completed_at, reason, admin_id),
@@ -120,6 +141,10 @@ def upsert_override_and_record_event(
             resolved_by="override",
         )
 
+    notify_override_changed(cursor, content_id, source)
+    # 공개 콘텐츠 API의 ETag/캐시가 이 소스를 다시 검증하도록 데이터 버전을 올립니다.
+    bump_content_data_version(conn, source)
+
     conn.commit()
     cursor.close()
 
@@ -1,10 +1,32 @@
 # services/base_email_service.py
+import asyncio
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class EmailMessage:
+    """발송할 이메일 한 통 (단일 수신자, text 본문)."""
+    to_email: str
+    subject: str
+    body: str
+
+
+@dataclass(frozen=True)
+class SendResult:
+    """send_many의 메시지별 발송 결과."""
+    message: EmailMessage
+    success: bool
+    error: Optional[str] = None
+
 
 class BaseEmailService(ABC):
     """
     모든 이메일 발송 서비스가 상속받아야 할 추상 기본 클래스입니다.
-    이메일 발송에 필요한 'send_mail' 메서드를 정의합니다.
+    이메일 발송에 필요한 'send_mail' 메서드를 정의하고,
+    여러 통을 한 번에 보내는 'send_many'의 기본 구현을 제공합니다.
     """
 
     @abstractmethod
@@ -21,3 +43,35 @@ class BaseEmailService(ABC):
             bool: 발송 성공 여부
         """
         pass
+
+    def _send_one(self, message: EmailMessage) -> SendResult:
+        try:
+            if self.send_mail(message.to_email, message.subject, message.body):
+                return SendResult(message, True)
+            return SendResult(message, False, "send_mail returned False")
+        except Exception as e:
+            return SendResult(message, False, str(e) or e.__class__.__name__)
+
+    def default_bulk_concurrency(self) -> int:
+        """send_many에서 max_workers를 지정하지 않았을 때의 동시 발송 수."""
+        return 1
+
+    def send_many(self, messages, max_workers: Optional[int] = None) -> list[SendResult]:
+        """
+        여러 통의 이메일을 발송하고 메시지별 결과를 입력 순서대로 반환합니다.
+
+        기본 구현은 send_mail을 최대 max_workers개 스레드에서 병렬 호출합니다.
+        공급자별로 더 효율적인 일괄 API가 있으면 하위 클래스에서 재정의합니다.
+        """
+        messages = list(messages)
+        if not messages:
+            return []
+        workers = max(1, min(max_workers or self.default_bulk_concurrency(), len(messages)))
+        if workers == 1:
+            return [self._send_one(message) for message in messages]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._send_one, messages))
+
+    async def send_many_async(self, messages, max_workers: Optional[int] = None) -> list[SendResult]:
+        """이벤트 루프를 막지 않도록 send_many를 별도 스레드에서 실행합니다."""
+        return await asyncio.to_thread(self.send_many, messages, max_workers)
@@ -1,5 +1,5 @@
 from services.cdc_constants import EVENT_CONTENT_COMPLETED, STATUS_COMPLETED
-from repositories.cdc_events_repo import insert_event
+from repositories.cdc_events_repo import insert_event, insert_events
 from utils.record import read_field
 
 
@@ -18,51 +18,101 @@ def record_content_completed_event(conn, *, content_id, source, final_completed_
     )
 
 
+def record_content_completed_events(conn, items) -> set:
+    """
+    Record CONTENT_COMPLETED CDC events for many items in bulk, idempotently.
+
+    Args:
+        items: Iterable of ``(content_id, source, final_completed_at, resolved_by)``.
+
+    Returns the set of ``(content_id, source)`` pairs that were newly inserted.
+    """
+    inserted = insert_events(
+        conn,
+        (
+            {
+                "content_id": content_id,
+                "source": source,
+                "event_type": EVENT_CONTENT_COMPLETED,
+                "final_status": STATUS_COMPLETED,
+                "final_completed_at": final_completed_at,
+                "resolved_by": resolved_by,
+            }
+            for content_id, source, final_completed_at, resolved_by in items
+        ),
+    )
+    return {(content_id, source) for content_id, source, _ in inserted}
+
+
 def record_due_scheduled_completions(conn, cursor, now):
     """
     Insert CONTENT_COMPLETED events for scheduled override completions that
     became effective as of ``now``.
+
+    Runs as a single set-based statement over overrides not yet marked as
+    processed (``completion_recorded_at IS NULL``, the partial index predicate):
+    due overrides get an event unless one already exists, and are then marked
+    so later runs skip them. Rewriting an override clears the mark. Rows locked
+    by a concurrent run are skipped. The returned ``due_count`` only covers
+    overrides still waiting for an event. Commit is left to the caller.
     """
 
     cursor.execute(
         """
-        SELECT content_id, source, override_completed_at
-        FROM admin_content_overrides
-        WHERE override_status = %s
-          AND override_completed_at IS NOT NULL
-          AND override_completed_at <= %s
+        WITH due AS (
+            SELECT o.id, o.content_id, o.source, o.override_completed_at
+            FROM admin_content_overrides o
+            JOIN contents c
+              ON c.content_id = o.content_id
+             AND c.source = o.source
+            WHERE o.override_status = %s
+              AND o.completion_recorded_at IS NULL
+              AND o.override_completed_at IS NOT NULL
+              AND o.override_completed_at <= %s
+            FOR UPDATE OF o SKIP LOCKED
+        ),
+        pending AS (
+            SELECT d.content_id, d.source, d.override_completed_at
+            FROM due d
+            WHERE NOT EXISTS (
+                SELECT 1
+                FROM cdc_events e
+                WHERE e.content_id = d.content_id
+                  AND e.source = d.source
+                  AND e.event_type = %s
+            )
+        ),
+        inserted AS (
+            INSERT INTO cdc_events (
+                content_id,
+                source,
+                event_type,
+                final_status,
+                final_completed_at,
+                resolved_by
+            )
+            SELECT content_id, source, %s, %s, override_completed_at, 'override'
+            FROM pending
+            ON CONFLICT (content_id, source, event_type) DO NOTHING
+            RETURNING 1
+        ),
+        marked AS (
+            UPDATE admin_content_overrides o
+            SET completion_recorded_at = %s
+            FROM due d
+            WHERE o.id = d.id
+            RETURNING 1
+        )
+        SELECT
+            (SELECT COUNT(*) FROM pending) AS due_count,
+            (SELECT COUNT(*) FROM inserted) AS inserted_count,
+            (SELECT COUNT(*) FROM marked) AS marked_count
         """,
-        (STATUS_COMPLETED, now),
+        (STATUS_COMPLETED, now, EVENT_CONTENT_COMPLETED, EVENT_CONTENT_COMPLETED, STATUS_COMPLETED, now),
     )
-    due_rows = cursor.fetchall()
-
-    inserted_count = 0
-    for row in due_rows:
-        content_id = read_field(row, "content_id")
-        source = read_field(row, "source")
-        override_completed_at = read_field(row, "override_completed_at")
-
-        if content_id is None or source is None:
-            continue
-
-        cursor.execute(
-            "SELECT 1 FROM contents WHERE content_id = %s AND source = %s",
-            (content_id, source),
-        )
-        if cursor.fetchone() is None:
-            continue
-
-        inserted = record_content_completed_event(
-            conn,
-            content_id=content_id,
-            source=source,
-            final_completed_at=override_completed_at,
-            resolved_by="override",
-        )
-        if inserted:
-            inserted_count += 1
+    row = cursor.fetchone()
 
     return {
-        "due_count": len(due_rows),
-        "inserted_count": inserted_count,
+        "due_count": int(read_field(row, "due_count") or 0),
+        "inserted_count": int(read_field(row, "inserted_count") or 0),
     }
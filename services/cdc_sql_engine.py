@@ -0,0 +1,144 @@
+"""Set-based Final-State CDC engine.
+
+Computes newly completed content directly in PostgreSQL instead of loading
+the whole ``contents``/``admin_content_overrides`` snapshot into Python.
+Today's crawl is streamed into a temp staging table with ``COPY`` and a
+single statement resolves previous/current final states with the same
+rules as :func:`services.final_state_resolver.resolve_final_state`, then
+inserts the ``cdc_events`` rows idempotently.
+"""
+
+import csv
+import io
+
+from database import get_cursor
+from services.cdc_constants import EVENT_CONTENT_COMPLETED, STATUS_COMPLETED
+
+
+_DETECT_AND_RECORD_SQL = """
+WITH universe AS (
+    SELECT content_id FROM contents WHERE source = %(source)s
+    UNION
+    SELECT content_id FROM cdc_crawl_staging
+    UNION
+    SELECT content_id FROM admin_content_overrides WHERE source = %(source)s
+),
+snapshot AS (
+    SELECT
+        u.content_id,
+        c.status AS previous_status,
+        s.status AS current_status,
+        o.content_id IS NOT NULL AS has_override,
+        o.override_status,
+        o.override_completed_at
+    FROM universe u
+    LEFT JOIN contents c
+        ON c.content_id = u.content_id AND c.source = %(source)s
+    LEFT JOIN cdc_crawl_staging s
+        ON s.content_id = u.content_id
+    LEFT JOIN admin_content_overrides o
+        ON o.content_id = u.content_id AND o.source = %(source)s
+),
+resolved AS (
+    -- pinned_status: final status forced by the override (NULL = crawler status decides)
+    SELECT
+        content_id,
+        previous_status,
+        current_status,
+        CASE
+            WHEN NOT has_override THEN NULL
+            WHEN override_status <> %(completed)s THEN override_status
+            WHEN override_completed_at IS NULL THEN %(completed)s
+            WHEN %(now)s < override_completed_at THEN NULL
+            ELSE %(completed)s
+        END AS pinned_status,
+        CASE
+            WHEN has_override
+                AND override_status = %(completed)s
+                AND override_completed_at IS NOT NULL
+                AND override_completed_at <= %(now)s
+            THEN override_completed_at
+        END AS pinned_completed_at
+    FROM snapshot
+),
+transitions AS (
+    -- Ids missing from today's crawl keep their previous final status.
+    SELECT
+        content_id,
+        pinned_completed_at AS final_completed_at,
+        CASE WHEN pinned_status IS NOT NULL THEN 'override' ELSE 'crawler' END AS resolved_by
+    FROM resolved
+    WHERE COALESCE(pinned_status, previous_status) IS DISTINCT FROM %(completed)s
+      AND COALESCE(pinned_status, current_status, previous_status) = %(completed)s
+),
+inserted AS (
+    INSERT INTO cdc_events (content_id, source, event_type, final_status, final_completed_at, resolved_by)
+    SELECT content_id, %(source)s, %(event_type)s, %(completed)s, final_completed_at, resolved_by
+    FROM transitions
+    ON CONFLICT (content_id, source, event_type) DO NOTHING
+    RETURNING content_id
+)
+SELECT
+    t.content_id,
+    t.final_completed_at,
+    t.resolved_by,
+    (i.content_id IS NOT NULL) AS inserted
+FROM transitions t
+LEFT JOIN inserted i ON i.content_id = t.content_id
+"""
+
+
+def detect_and_record_completions_sql(conn, source, current_status_map, now):
+    """
+    Detect content that newly became ``완결`` for ``source`` and record
+    CONTENT_COMPLETED events, entirely in SQL.
+
+    Must run before the crawler syncs ``contents`` (the stored statuses are
+    the "previous" snapshot). Commit is left to the caller.
+
+    Args:
+        conn: Active DB connection.
+        source: Content source name.
+        current_status_map: ``{content_id: raw_status}`` from today's crawl.
+        now: Naive KST datetime used for scheduled completion comparisons.
+
+    Returns:
+        list[tuple]: ``(content_id, final_completed_at, resolved_by, inserted)``
+        for every newly completed id; ``inserted`` is False when the event
+        already existed.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for content_id, status in current_status_map.items():
+        writer.writerow((str(content_id), status))
+    buffer.seek(0)
+
+    cursor = get_cursor(conn)
+    try:
+        cursor.execute(
+            """
+            CREATE TEMP TABLE IF NOT EXISTS cdc_crawl_staging (
+                content_id TEXT PRIMARY KEY,
+                status TEXT NOT NULL
+            ) ON COMMIT DROP
+            """
+        )
+        cursor.execute("TRUNCATE cdc_crawl_staging")
+        cursor.copy_expert("COPY cdc_crawl_staging (content_id, status) FROM STDIN WITH (FORMAT csv)", buffer)
+        cursor.execute(
+            _DETECT_AND_RECORD_SQL,
+            {
+                "source": source,
+                "now": now,
+                "completed": STATUS_COMPLETED,
+                "event_type": EVENT_CONTENT_COMPLETED,
+            },
+        )
+        rows = cursor.fetchall()
+    finally:
+        cursor.close()
+
+    return [
+        (row["content_id"], row["final_completed_at"], row["resolved_by"], row["inserted"])
+        for row in rows
+    ]
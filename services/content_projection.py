@@ -0,0 +1,95 @@
+# services/content_projection.py
+"""
+콘텐츠 목록 API의 필드 투영(view=card|full, fields=...).
+
+meta JSONB 전체 대신 필요한 경로만 SQL에서 jsonb_build_object로 골라내므로,
+Kakao처럼 이미지 URL이 많은 meta도 목록 응답에서는 몇 개 필드만 전송·직렬화합니다.
+투영된 meta는 원래 구조(meta.common.thumbnail_url 등)를 유지해 기존 클라이언트가 그대로 읽을 수 있습니다.
+"""
+
+FULL_PROJECTION = 'full'
+CARD_PROJECTION = 'card'
+
+# contents 테이블 컬럼으로 바로 선택되는 필드
+COLUMN_FIELDS = ('content_id', 'title', 'status', 'source', 'content_type')
+
+# 필드 이름 -> meta 안의 (상위 키, 하위 키)
+META_FIELDS = {
+    'thumbnail_url': ('common', 'thumbnail_url'),
+    'authors': ('common', 'authors'),
+    'weekdays': ('attributes', 'weekdays'),
+}
+
+# 목록 카드 UI에 필요한 최소 필드
+CARD_FIELDS = ('content_id', 'title', 'status', 'source', 'thumbnail_url', 'authors', 'weekdays')
+
+# 구독/페이지네이션에 필요한 식별자는 항상 포함합니다.
+_IDENTITY_FIELDS = ('content_id', 'source')
+
+_FULL_SELECT = "content_id, title, status, meta, source"
+
+
+def parse_projection(view=None, fields=None):
+    """
+    요청 파라미터를 ``(name, fields)``로 해석합니다.
+
+    ``fields``는 full이면 None, 그 외에는 선택할 필드 이름 튜플입니다. ``name``은 캐시/스냅샷
+    키로 쓰는 정규화된 이름('full', 'card', 'fields:a,b,...')입니다.
+
+    Raises:
+        ValueError: 알 수 없는 view 또는 필드.
+    """
+    if fields:
+        requested = [name.strip() for name in fields.split(',') if name.strip()]
+        unknown = [name for name in requested if name not in COLUMN_FIELDS and name not in META_FIELDS and name != 'meta']
+        if unknown:
+            raise ValueError(f"unknown fields: {', '.join(unknown)}")
+        if 'meta' in requested:
+            # meta 전체를 요청하면 meta 경로 필드는 의미가 없으므로 meta만 남깁니다.
+            requested = [name for name in requested if name not in META_FIELDS]
+        selected = tuple(dict.fromkeys((*_IDENTITY_FIELDS, *requested)))
+        return 'fields:' + ','.join(sorted(selected)), selected
+
+    if view in (None, '', FULL_PROJECTION):
+        return FULL_PROJECTION, None
+    if view == CARD_PROJECTION:
+        return CARD_PROJECTION, CARD_FIELDS
+    raise ValueError("view must be 'card' or 'full'")
+
+
+def with_fields(fields, *required):
+    """투영에 ``required`` 필드를 보탭니다 (full 투영은 그대로)."""
+    if fields is None:
+        return None
+    return tuple(dict.fromkeys((*fields, *required)))
+
+
+def build_select_list(fields):
+    """``fields`` 투영에 해당하는 SELECT 목록 SQL을 만듭니다. 식별자는 모두 위의 화이트리스트에서 옵니다."""
+    if fields is None:
+        return _FULL_SELECT
+
+    expressions = [name for name in fields if name in COLUMN_FIELDS]
+    if 'meta' in fields:
+        expressions.append('meta')
+    else:
+        groups = {}
+        for name in fields:
+            if name in META_FIELDS:
+                top, key = META_FIELDS[name]
+                groups.setdefault(top, []).append(key)
+        if groups:
+            parts = []
+            for top, keys in groups.items():
+                inner = ', '.join(f"'{key}', meta->'{top}'->'{key}'" for key in keys)
+                parts.append(f"'{top}', jsonb_build_object({inner})")
+            expressions.append(f"jsonb_build_object({', '.join(parts)}) AS meta")
+    return ', '.join(expressions)
+
+
+def shape_row(row):
+    """DB 행을 응답 dict로 바꿉니다 (meta가 선택된 경우 NULL을 {}로)."""
+    item = dict(row)
+    if 'meta' in item:
+        item['meta'] = item['meta'] or {}
+    return item
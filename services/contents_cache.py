@@ -0,0 +1,220 @@
+# services/contents_cache.py
+"""
+/api/contents/ongoing 응답 캐시.
+
+- 1단계: 프로세스 내 LRU (직렬화·압축된 응답 바이트를 그대로 보관)
+- 2단계: (선택) Redis 호환 공유 캐시 — 여러 워커 프로세스가 한 번 만든 응답을 함께 씁니다.
+
+항목은 (type, source, weekday, encoding)과 소스별 데이터 버전(content_data_versions)으로 만든 세대 토큰에 묶입니다.
+크롤러가 커밋하면서 버전을 올리면 토큰이 바뀌어 옛 항목은 더 이상 맞지 않게 됩니다.
+버전 조회는 CONTENTS_CACHE_VERSION_TTL_SECONDS 동안 프로세스 안에서 재사용하므로,
+갱신은 최대 그 시간만큼 늦게 보일 수 있습니다.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+import config
+from repositories.content_versions_repo import load_content_data_versions
+
+try:  # 공유 캐시는 redis 패키지와 REDIS_URL이 모두 있을 때만 사용합니다.
+    import redis
+except ImportError:
+    redis = None
+
+
+def generation_token(versions, source):
+    """``source``('all'이면 전체 소스)의 데이터 버전으로 만든 세대 토큰."""
+    if source == 'all':
+        return ','.join(f"{name}:{version}" for name, version in sorted(versions.items()))
+    return str(versions.get(source, 0))
+
+
+def data_version_rank(versions, source):
+    """
+    세대끼리 새로운 정도를 비교하기 위한 값. 버전은 증가만 하므로
+    'all' 범위는 모든 소스 버전의 합이 단조 증가합니다.
+    """
+    if source == 'all':
+        return sum(versions.values())
+    return versions.get(source, 0)
+
+
+class LocalLRUCache:
+    """스레드 안전한 최대 ``max_entries``개짜리 LRU 캐시입니다."""
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class InMemorySharedCache:
+    """
+    redis 클라이언트의 get/set(ex=) 부분만 흉내 낸 로컬 대역입니다.
+
+    테스트나 redis가 없는 개발 환경에서 공유 캐시 자리에 넣어 씁니다.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key, value, ex=None):
+        with self._lock:
+            expires_at = time.monotonic() + ex if ex else None
+            self._entries[key] = (value, expires_at)
+        return True
+
+
+class ContentsResponseCache:
+    """
+    응답 키별 직렬화(압축) 응답 바이트 캐시입니다.
+
+    Args:
+        local: 프로세스 내 캐시 (LocalLRUCache).
+        shared: get/set(ex=)를 제공하는 Redis 호환 클라이언트. None이면 로컬만 사용합니다.
+        version_ttl: 데이터 버전을 DB에서 다시 읽기 전까지 재사용할 시간(초).
+        shared_ttl: 공유 캐시 항목 만료 시간(초). 옛 세대 항목은 이 시간이 지나면 사라집니다.
+    """
+
+    def __init__(self, local=None, shared=None, *, version_ttl=5.0, shared_ttl=86400):
+        self.local = local if local is not None else LocalLRUCache()
+        self.shared = shared
+        self.version_ttl = version_ttl
+        self.shared_ttl = shared_ttl
+        self._versions = None
+        self._versions_loaded_at = 0.0
+        self._lock = threading.Lock()
+        self.metrics = {'local_hits': 0, 'shared_hits': 0, 'misses': 0}
+
+    def _load_versions(self, conn_factory):
+        with self._lock:
+            fresh = (
+                self._versions is not None
+                and time.monotonic() - self._versions_loaded_at < self.version_ttl
+            )
+            if fresh:
+                return self._versions
+        versions = load_content_data_versions(conn_factory())
+        with self._lock:
+            self._versions = versions
+            self._versions_loaded_at = time.monotonic()
+        return versions
+
+    def invalidate_versions(self):
+        """다음 조회에서 데이터 버전을 DB에서 다시 읽게 합니다."""
+        with self._lock:
+            self._versions = None
+
+    def generation(self, source, conn_factory):
+        """``source``('all' 포함)의 현재 세대 토큰을 반환합니다."""
+        return generation_token(self._load_versions(conn_factory), source)
+
+    @staticmethod
+    def _shared_key(key, generation):
+        return "contents:ongoing:" + ":".join(str(part) for part in key) + f":{generation}"
+
+    def get_or_build(self, key, source, conn_factory, build):
+        """
+        캐시된 응답 바이트를 반환하고, 없으면 ``build(generation)``으로 만들어 두 단계에 저장합니다.
+
+        ``key``는 응답을 구분하는 튜플(예: type, source, weekday, encoding)이고, ``source``는
+        세대 토큰을 정할 데이터 범위입니다. 세대 토큰은 ``build`` 전에 읽으므로,
+        그 사이 커밋된 변경은 다음 세대에서 반영됩니다.
+        """
+        generation = self.generation(source, conn_factory)
+
+        entry = self.local.get(key)
+        if entry is not None and entry[0] == generation:
+            self.metrics['local_hits'] += 1
+            return entry[1]
+
+        shared_key = self._shared_key(key, generation)
+        if self.shared is not None:
+            try:
+                payload = self.shared.get(shared_key)
+            except Exception as e:
+                print(f"WARN: [ContentsCache] 공유 캐시 조회 실패: {e}")
+                payload = None
+            if payload is not None:
+                self.metrics['shared_hits'] += 1
+                self.local.set(key, (generation, payload))
+                return payload
+
+        self.metrics['misses'] += 1
+        payload = build(generation)
+        self.local.set(key, (generation, payload))
+        if self.shared is not None:
+            try:
+                self.shared.set(shared_key, payload, ex=self.shared_ttl)
+            except Exception as e:
+                print(f"WARN: [ContentsCache] 공유 캐시 저장 실패: {e}")
+        return payload
+
+
+_contents_cache = None
+_contents_cache_lock = threading.Lock()
+
+
+def _create_shared_cache():
+    if not config.REDIS_URL:
+        return None
+    if redis is None:
+        print("WARN: [ContentsCache] REDIS_URL이 설정되었지만 redis 패키지가 없어 로컬 캐시만 사용합니다.")
+        return None
+    return redis.Redis.from_url(config.REDIS_URL)
+
+
+def get_contents_cache():
+    """프로세스 전역 ContentsResponseCache를 반환합니다 (처음 호출 시 생성)."""
+    global _contents_cache
+    if _contents_cache is None:
+        with _contents_cache_lock:
+            if _contents_cache is None:
+                _contents_cache = ContentsResponseCache(
+                    LocalLRUCache(config.CONTENTS_CACHE_MAX_ENTRIES),
+                    _create_shared_cache(),
+                    version_ttl=config.CONTENTS_CACHE_VERSION_TTL_SECONDS,
+                    shared_ttl=config.CONTENTS_CACHE_SHARED_TTL_SECONDS,
+                )
+    return _contents_cache
+
+
+def reset_contents_cache(cache=None):
+    """전역 캐시를 교체합니다 (테스트용)."""
+    global _contents_cache
+    with _contents_cache_lock:
+        _contents_cache = cache
@@ -65,3 +65,61 @@ def resolve_final_state(content_status, override=None, now=None):
         "final_completed_at": override_completed_at,
         "resolved_by": "override",
     }
+
+
+def resolve_completion_transitions(
+    content_ids,
+    previous_statuses,
+    current_statuses,
+    override_statuses,
+    override_completed_ats,
+    now=None,
+):
+    """Batch-detect content whose final status newly became ``완결``.
+
+    Columnar counterpart of calling :func:`resolve_final_state` twice per id
+    (before and after today's crawl) and comparing the results. Inputs are
+    equal-length sequences aligned by position; no per-id dicts are built.
+
+    Args:
+        content_ids: Content ids.
+        previous_statuses: Raw crawler status stored in the DB before sync
+            (``None`` for content not yet stored).
+        current_statuses: Raw status from today's crawl, or ``None`` when the
+            id was not seen today. Unseen ids keep their previous final status.
+        override_statuses: ``override_status`` per id, or ``None`` when there
+            is no override.
+        override_completed_ats: ``override_completed_at`` per id (ignored when
+            there is no override).
+        now: Optional naive datetime. Defaults to ``now_kst_naive()``.
+
+    Returns:
+        list[tuple]: ``(content_id, final_completed_at, resolved_by)`` for each
+        id whose previous final status was not ``완결`` and whose current final
+        status is ``완결``.
+    """
+    effective_now = now if now is not None else now_kst_naive()
+    transitions = []
+
+    for content_id, previous, current, override_status, override_completed_at in zip(
+        content_ids, previous_statuses, current_statuses, override_statuses, override_completed_ats
+    ):
+        if override_status is not None:
+            # A non-completion override, an immediate completion, or an effective
+            # scheduled completion pins both previous and current final states to
+            # the same value, so no transition can happen.
+            if override_status != "완결" or override_completed_at is None:
+                continue
+            if effective_now >= override_completed_at:
+                continue
+            # Pending scheduled completion: the crawler status decides.
+
+        if previous == "완결":
+            continue
+        if current is None:
+            # Not seen today: current final status equals the previous one.
+            continue
+        if current == "완결":
+            transitions.append((content_id, None, "crawler"))
+
+    return transitions
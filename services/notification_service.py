@@ -1,7 +1,11 @@
 # services/notification_service.py
-from database import get_cursor
+from repositories.subscriptions_repo import iter_subscribers_for_contents
+from .base_email_service import EmailMessage
 from .email import get_email_service
 
+# 다이제스트를 이 개수만큼 모아 send_many로 한 번에 넘깁니다.
+SEND_CHUNK_SIZE = 1000
+
 
 def _extract_title(content_id, content_data):
     return (
@@ -12,9 +16,97 @@ def _extract_title(content_id, content_data):
     )
 
 
+def build_completion_message(title, final_completed_at, resolved_by):
+    """Build the ``(subject, body)`` of a completion notification email."""
+    subject = f"콘텐츠 완결 알림: '{title}'가 완결되었습니다!"
+    body_lines = [
+        "안녕하세요! Ending Signal입니다.",
+        f"회원님께서 구독하신 콘텐츠 '{title}'가 완결되었습니다.",
+        "지금 바로 정주행을 시작해보세요!",
+    ]
+    if final_completed_at:
+        body_lines.append(f"완결 시점: {final_completed_at}")
+    body_lines.append(f"완결 판정 출처: {resolved_by}")
+    body_lines.append("감사합니다.")
+    return subject, "\n".join(body_lines)
+
+
+def build_digest_message(items):
+    """Build the ``(subject, body)`` of one email covering several completed titles.
+
+    Args:
+        items (list[dict]): Entries with ``title``, ``final_completed_at`` and ``resolved_by``.
+    """
+    if len(items) == 1:
+        item = items[0]
+        return build_completion_message(item['title'], item['final_completed_at'], item['resolved_by'])
+
+    subject = f"콘텐츠 완결 알림: 구독하신 콘텐츠 {len(items)}개가 완결되었습니다!"
+    body_lines = [
+        "안녕하세요! Ending Signal입니다.",
+        f"회원님께서 구독하신 콘텐츠 {len(items)}개가 완결되었습니다.",
+        "",
+    ]
+    for item in items:
+        line = f"- '{item['title']}'"
+        if item['final_completed_at']:
+            line += f" (완결 시점: {item['final_completed_at']})"
+        body_lines.append(line)
+    body_lines.append("")
+    body_lines.append("지금 바로 정주행을 시작해보세요!")
+    body_lines.append("감사합니다.")
+    return subject, "\n".join(body_lines)
+
+
+def plan_completion_digests(conn, newly_completed_items, all_content_today, source=None, titles=None):
+    """Plan one digest per subscriber for a whole completion batch.
+
+    Subscribers of every completed item are fetched with a single streamed
+    query ordered by user, so each digest is yielded as soon as that user's
+    rows have been read.
+
+    Args:
+        newly_completed_items (list[tuple]): ``(content_id, source, final_completed_at, resolved_by)`` tuples.
+        all_content_today (dict): Latest crawler content map used to extract titles.
+        source (str | None): Fallback source for items that do not carry one.
+        titles (dict | None): ``(content_id, source) -> title`` taking precedence over ``all_content_today``.
+
+    Yields:
+        dict: ``{'user_id', 'email', 'items'}`` where ``items`` lists the completed
+        contents (``content_id``, ``source``, ``title``, ``final_completed_at``,
+        ``resolved_by``) the user subscribes to.
+    """
+    content_by_id = {str(content_id): data for content_id, data in (all_content_today or {}).items()}
+    titles = titles or {}
+    item_by_key = {}
+    for content_id, item_source, final_completed_at, resolved_by in newly_completed_items:
+        key = (str(content_id), item_source or source)
+        item_by_key[key] = {
+            'content_id': key[0],
+            'source': key[1],
+            'title': titles.get(key) or _extract_title(key[0], content_by_id.get(key[0], {})),
+            'final_completed_at': final_completed_at,
+            'resolved_by': resolved_by,
+        }
+
+    current = None
+    for content_id, item_source, user_id, email in iter_subscribers_for_contents(conn, item_by_key.keys()):
+        if current is None or current['user_id'] != user_id:
+            if current is not None:
+                yield current
+            current = {'user_id': user_id, 'email': email, 'items': []}
+        current['items'].append(item_by_key[(content_id, item_source)])
+
+    if current is not None:
+        yield current
+
+
 def send_completion_notifications(conn, newly_completed_items, all_content_today, source):
     """Send completion notifications for newly completed content.
 
+    Each subscriber receives a single digest email covering every title in the
+    batch they subscribe to.
+
     Args:
         conn: Active DB connection.
         newly_completed_items (list[tuple]): ``(content_id, source, final_completed_at, resolved_by)`` tuples.
@@ -35,58 +127,41 @@ def send_completion_notifications(conn, newly_completed_items, all_content_today
         print(f"❌ 이메일 서비스 초기화 실패: {e}")
         return [f"오류: {e}"], 0
 
-    cursor = get_cursor(conn)
-
     print(f"\n🔥 새로운 완결 콘텐츠 {len(newly_completed_items)}개 발견! 알림 발송을 시작합니다.")
-    completed_details, total_notified_users = [], 0
-
-    for content_id, _, final_completed_at, resolved_by in newly_completed_items:
-        content_data = all_content_today.get(content_id, {})
-        title = _extract_title(content_id, content_data)
-
-        cursor.execute(
-            """
-            SELECT DISTINCT u.id AS user_id, u.email
-            FROM subscriptions s
-            JOIN users u ON s.user_id = u.id
-            WHERE s.content_id = %s AND s.source = %s
-            """,
-            (content_id, source),
-        )
-        subscribers = cursor.fetchall()
-
-        print(f"--- '{title}'(ID:{content_id}) 완결 알림 발송 대상: {len(subscribers)}명 ---")
-        if not subscribers:
-            completed_details.append(f"- '{title}' (ID:{content_id}) : 구독자 없음")
-            continue
-
-        subject = f"콘텐츠 완결 알림: '{title}'가 완결되었습니다!"
-        body_lines = [
-            "안녕하세요! Ending Signal입니다.",
-            f"회원님께서 구독하신 콘텐츠 '{title}'가 완결되었습니다.",
-            "지금 바로 정주행을 시작해보세요!",
-        ]
-        if final_completed_at:
-            body_lines.append(f"완결 시점: {final_completed_at}")
-        body_lines.append(f"완결 판정 출처: {resolved_by}")
-        body_lines.append("감사합니다.")
-        body = "\n".join(body_lines)
-
-        unique_user_ids = set()
-        for subscriber in subscribers:
-            user_id = subscriber['user_id']
-            if user_id in unique_user_ids:
-                continue
 
-            email = subscriber['email']
-            email_service.send_mail(email, subject, body)
-            unique_user_ids.add(user_id)
+    notified_per_content = {}
+    total_notified_users = 0
 
-        notified_count = len(unique_user_ids)
-        total_notified_users += notified_count
-        completed_details.append(
-            f"- '{title}' (ID:{content_id}) : {notified_count}명에게 알림 발송"
-        )
+    def flush(chunk):
+        nonlocal total_notified_users
+        results = email_service.send_many([message for message, _ in chunk])
+        for result, (_, items) in zip(results, chunk):
+            if not result.success:
+                continue
+            total_notified_users += 1
+            for item in items:
+                key = (item['content_id'], item['source'])
+                notified_per_content[key] = notified_per_content.get(key, 0) + 1
+
+    chunk = []
+    for digest in plan_completion_digests(conn, newly_completed_items, all_content_today, source):
+        subject, body = build_digest_message(digest['items'])
+        chunk.append((EmailMessage(digest['email'], subject, body), digest['items']))
+        if len(chunk) >= SEND_CHUNK_SIZE:
+            flush(chunk)
+            chunk = []
+    if chunk:
+        flush(chunk)
+
+    content_by_id = {str(content_id): data for content_id, data in (all_content_today or {}).items()}
+    completed_details = []
+    for content_id, item_source, _, _ in newly_completed_items:
+        title = _extract_title(content_id, content_by_id.get(str(content_id), {}))
+        notified_count = notified_per_content.get((str(content_id), item_source or source), 0)
+        if notified_count:
+            completed_details.append(f"- '{title}' (ID:{content_id}) : {notified_count}명에게 알림 발송")
+        else:
+            completed_details.append(f"- '{title}' (ID:{content_id}) : 구독자 없음")
 
-    cursor.close()
+    print(f"--- 완결 알림 발송 완료: {total_notified_users}명 ---")
     return completed_details, total_notified_users
@@ -0,0 +1,173 @@
+# services/ongoing_contents_service.py
+"""
+/api/contents/ongoing 응답 본문 생성과 사전 계산 스냅샷.
+
+크롤이 끝나면 materialize_ongoing_snapshots가 (type, source, weekday)별 응답을
+직렬화·압축(gzip, brotli)해 content_snapshots에 저장하고, 요청 경로는 세대 토큰이
+맞는 스냅샷 바이트를 그대로 내려보냅니다. 스냅샷이 없거나 오래되면 DB에서 바로 만듭니다.
+"""
+import gzip
+import json
+
+import config
+from database import get_cursor
+from repositories.content_snapshots_repo import fetch_snapshot_body, upsert_snapshots
+from repositories.content_versions_repo import load_content_data_versions
+from services.content_projection import (
+    CARD_FIELDS,
+    CARD_PROJECTION,
+    FULL_PROJECTION,
+    build_select_list,
+    shape_row,
+    with_fields,
+)
+from services.contents_cache import data_version_rank, generation_token
+
+try:  # brotli 패키지가 없으면 br 스냅샷은 만들지 않고 gzip만 제공합니다.
+    import brotli
+except ImportError:
+    brotli = None
+
+WEEKDAY_KEYS = ('mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun', 'daily')
+GROUPED_CONTENT_TYPES = ('webtoon', 'novel')
+ALL_DAYS = 'all'
+
+# 크롤 종료 시 미리 만들어 두는 투영 (그 외 fields= 조합은 요청 시 생성)
+SNAPSHOT_PROJECTIONS = {FULL_PROJECTION: None, CARD_PROJECTION: CARD_FIELDS}
+
+
+def supported_encodings():
+    """서버가 만들 수 있는 Content-Encoding 목록 (선호 순)."""
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def load_ongoing_contents(conn, content_type, source, fields=None):
+    """
+    연재중/휴재 콘텐츠를 조회해 웹툰/웹소설은 요일별 dict로, 그 외는 목록으로 반환합니다.
+
+    ``fields``를 주면 해당 필드만 SQL에서 투영합니다 (요일 그룹화를 위해 weekdays는 항상 포함).
+    """
+    if content_type in GROUPED_CONTENT_TYPES:
+        fields = with_fields(fields, 'weekdays')
+
+    cursor = get_cursor(conn)
+
+    base_query = f"SELECT {build_select_list(fields)} FROM contents WHERE content_type = %s AND (status = '연재중' OR status = '휴재')"
+    params = [content_type]
+
+    if source != 'all':
+        base_query += " AND source = %s"
+        params.append(source)
+
+    cursor.execute(base_query, tuple(params))
+
+    all_contents = [shape_row(row) for row in cursor.fetchall()]
+    cursor.close()
+
+    # 콘텐츠 타입에 따라 분기
+    if content_type in GROUPED_CONTENT_TYPES:
+        # 웹툰/웹소설인 경우, 요일별로 그룹화
+        grouped_by_day = {day: [] for day in WEEKDAY_KEYS}
+        for content in all_contents:
+            # 변경된 meta 구조에 맞게 'attributes'에서 'weekdays'를 가져옴
+            day_list = content.get('meta', {}).get('attributes', {}).get('weekdays', [])
+            for day_eng in day_list:
+                if day_eng in grouped_by_day:
+                    grouped_by_day[day_eng].append(content)
+        return grouped_by_day
+
+    # 다른 콘텐츠 타입(OTT, Series)의 경우, 그룹화하지 않고 목록 그대로 반환
+    return all_contents
+
+
+def select_day(data, weekday):
+    """전체 응답에서 ``weekday`` 부분만 골라냅니다 (그룹화되지 않은 타입은 전체 목록)."""
+    if weekday == ALL_DAYS or not isinstance(data, dict):
+        return data
+    return data.get(weekday, [])
+
+
+def serialize_body(data):
+    """응답 JSON을 바이트로 직렬화합니다. 스냅샷과 요청 경로가 같은 바이트를 만들도록 한 곳에서 처리합니다."""
+    return json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+def encode_body(body, encoding, level=None):
+    if encoding == 'identity':
+        return body
+    if encoding == 'gzip':
+        # mtime=0: 같은 본문이면 같은 바이트가 나오도록 (ETag/캐시 친화적)
+        return gzip.compress(body, compresslevel=level or config.CONTENTS_SNAPSHOT_GZIP_LEVEL, mtime=0)
+    if encoding == 'br':
+        if brotli is None:
+            raise ValueError("brotli 패키지가 설치되어 있지 않습니다.")
+        return brotli.compress(body, quality=level or config.CONTENTS_SNAPSHOT_BROTLI_QUALITY)
+    raise ValueError(f"지원하지 않는 encoding: {encoding}")
+
+
+def _snapshot_rows(content_type, source, projection, data, versions):
+    generation = generation_token(versions, source)
+    rank = data_version_rank(versions, source)
+    days = (ALL_DAYS,) + (WEEKDAY_KEYS if isinstance(data, dict) else ())
+    for weekday in days:
+        part = select_day(data, weekday)
+        body = serialize_body(part)
+        item_count = sum(len(v) for v in part.values()) if isinstance(part, dict) else len(part)
+        yield (
+            content_type,
+            source,
+            weekday,
+            projection,
+            generation,
+            rank,
+            item_count,
+            body,
+            encode_body(body, 'gzip'),
+            encode_body(body, 'br') if brotli is not None else None,
+        )
+
+
+def materialize_ongoing_snapshots(conn, source):
+    """
+    ``source``와 'all' 범위의 ongoing 스냅샷을 SNAPSHOT_PROJECTIONS별로 다시 만듭니다.
+
+    크롤 커밋 직후 호출합니다. 데이터 버전을 콘텐츠보다 먼저 읽으므로 스냅샷의 세대 토큰은
+    담긴 데이터보다 새것일 수 없고, 그 사이 다른 크롤이 커밋했다면 토큰 불일치로 요청 경로가
+    DB에서 직접 만들게 됩니다. Commit is left to the caller.
+
+    Returns:
+        int: 저장한 스냅샷 행 수.
+    """
+    versions = load_content_data_versions(conn)
+
+    cursor = get_cursor(conn)
+    cursor.execute("SELECT DISTINCT content_type FROM contents WHERE source = %s", (source,))
+    content_types = [row['content_type'] for row in cursor.fetchall()]
+    cursor.close()
+
+    written = 0
+    for content_type in content_types:
+        for scope in (source, 'all'):
+            for projection, fields in SNAPSHOT_PROJECTIONS.items():
+                data = load_ongoing_contents(conn, content_type, scope, fields)
+                rows = list(_snapshot_rows(content_type, scope, projection, data, versions))
+                written += upsert_snapshots(conn, rows)
+    return written
+
+
+def build_ongoing_body(conn, content_type, source, weekday, projection, fields, encoding, generation):
+    """
+    요청 하나의 응답 바이트를 ``encoding``으로 반환합니다.
+
+    ``projection``이 스냅샷 대상이고 세대 토큰이 일치하는 스냅샷이 있으면 그 바이트를 그대로 쓰고,
+    없으면 DB에서 ``fields``를 투영해 조회한 뒤 직렬화·압축합니다.
+    """
+    if projection in SNAPSHOT_PROJECTIONS:
+        snapshot = fetch_snapshot_body(conn, content_type, source, weekday, projection, encoding)
+        if snapshot is not None:
+            snapshot_generation, body = snapshot
+            if snapshot_generation == generation and body is not None:
+                return body
+
+    body = serialize_body(select_day(load_ongoing_contents(conn, content_type, source, fields), weekday))
+    return encode_body(body, encoding, level=config.CONTENTS_DYNAMIC_COMPRESSION_LEVEL)
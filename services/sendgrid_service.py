@@ -1,19 +1,25 @@
 # services/sendgrid_service.py
 import os
+from concurrent.futures import ThreadPoolExecutor
 from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail
-from .base_email_service import BaseEmailService
+from sendgrid.helpers.mail import Mail, Personalization, To
+import config
+from .base_email_service import BaseEmailService, SendResult
+
+# SendGrid v3 Mail Send API는 요청 하나에 최대 1000개의 personalization을 허용합니다.
+MAX_PERSONALIZATIONS_PER_REQUEST = 1000
+
 
 class SendGridService(BaseEmailService):
     """
     SendGrid API를 사용하여 이메일을 발송하는 서비스입니다.
     """
-    def __init__(self):
+    def __init__(self, client=None):
         self.api_key = os.getenv('SENDGRID_API_KEY')
         self.sender_email = os.getenv('EMAIL_ADDRESS') # SendGrid에 등록된 발신자
         if not self.api_key or not self.sender_email:
             raise ValueError("SendGrid 서비스에 필요한 SENDGRID_API_KEY 또는 EMAIL_ADDRESS가 설정되지 않았습니다.")
-        self.sg = SendGridAPIClient(self.api_key)
+        self.sg = client or SendGridAPIClient(self.api_key)
 
     def send_mail(self, to_email: str, subject: str, body: str) -> bool:
         message = Mail(
@@ -29,3 +35,52 @@ class SendGridService(BaseEmailService):
         except Exception as e:
             print(f"오류: [SendGridService] {to_email}에게 이메일 발송 실패 - {e}")
             return False
+
+    def default_bulk_concurrency(self) -> int:
+        return config.SENDGRID_BULK_CONCURRENCY
+
+    def _send_batch(self, batch):
+        """제목/본문이 같은 메시지 묶음을 수신자별 personalization으로 한 번에 발송합니다."""
+        subject, body = batch[0][1].subject, batch[0][1].body
+        mail = Mail(from_email=self.sender_email, subject=subject, plain_text_content=body)
+        # 수신자끼리 주소가 노출되지 않도록 personalization 하나에 수신자 한 명만 넣습니다.
+        for _, message in batch:
+            personalization = Personalization()
+            personalization.add_to(To(message.to_email))
+            mail.add_personalization(personalization)
+
+        try:
+            response = self.sg.send(mail)
+            if 200 <= response.status_code < 300:
+                return [(index, SendResult(message, True)) for index, message in batch]
+            error = f"SendGrid responded with HTTP {response.status_code}"
+        except Exception as e:
+            error = str(e) or e.__class__.__name__
+        print(f"오류: [SendGridService] {len(batch)}건 일괄 발송 실패 - {error}")
+        return [(index, SendResult(message, False, error)) for index, message in batch]
+
+    def send_many(self, messages, max_workers=None):
+        """
+        제목/본문이 같은 메시지를 묶어 personalization(요청당 최대 1000명)으로 발송합니다.
+        서로 다른 묶음은 최대 max_workers개 요청을 병렬로 보냅니다.
+        """
+        messages = list(messages)
+        if not messages:
+            return []
+
+        groups = {}
+        for index, message in enumerate(messages):
+            groups.setdefault((message.subject, message.body), []).append((index, message))
+
+        batches = []
+        for group in groups.values():
+            for start in range(0, len(group), MAX_PERSONALIZATIONS_PER_REQUEST):
+                batches.append(group[start:start + MAX_PERSONALIZATIONS_PER_REQUEST])
+
+        workers = max(1, min(max_workers or self.default_bulk_concurrency(), len(batches)))
+        results = [None] * len(messages)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for batch_results in executor.map(self._send_batch, batches):
+                for index, result in batch_results:
+                    results[index] = result
+        return results
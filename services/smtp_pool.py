@@ -0,0 +1,207 @@
+# services/smtp_pool.py
+import smtplib
+import threading
+import time
+from contextlib import contextmanager
+
+# 수신자/발신자 거부 등 메시지 단위 영구 오류: 세션은 그대로 재사용합니다.
+_PERMANENT_ERRORS = (
+    smtplib.SMTPRecipientsRefused,
+    smtplib.SMTPSenderRefused,
+    smtplib.SMTPDataError,
+)
+
+# 서버가 세션을 끊었거나 네트워크가 깨진 경우: 새 세션으로 한 번 더 시도할 가치가 있습니다.
+# (smtplib.SMTPException도 OSError의 하위 클래스입니다.)
+_RECONNECTABLE_ERRORS = (OSError,)
+
+
+def _closes_session(error):
+    """421(서비스 종료) 응답이면 smtplib가 이미 연결을 닫았으므로 재접속 대상입니다."""
+    if getattr(error, 'smtp_code', None) == 421:
+        return True
+    recipients = getattr(error, 'recipients', None) or {}
+    return any(code == 421 for code, _ in recipients.values())
+
+
+class SmtpPoolTimeoutError(RuntimeError):
+    """풀에서 정해진 시간 안에 SMTP 세션을 얻지 못했을 때 발생합니다."""
+
+
+class _Session:
+    __slots__ = ('client', 'messages_sent', 'last_used')
+
+    def __init__(self, client):
+        self.client = client
+        self.messages_sent = 0
+        self.last_used = time.monotonic()
+
+
+class SmtpConnectionPool:
+    """
+    인증된 SMTP 세션을 재사용하는 스레드 안전 풀입니다.
+
+    - 최대 max_size개의 세션을 동시에 사용할 수 있습니다 (병렬 발송).
+    - 한 세션으로 여러 통을 연속 발송하고, max_messages_per_session에 도달하면 세션을 닫고 새로 엽니다.
+    - 오래 쉬었던 세션은 NOOP으로 점검하고, 서버가 연결을 끊으면 새 세션으로 한 번 재시도합니다.
+    """
+
+    def __init__(
+        self,
+        host,
+        port,
+        username,
+        password,
+        *,
+        max_size=4,
+        max_messages_per_session=100,
+        use_tls=True,
+        timeout=30,
+        acquire_timeout=60,
+        idle_check_seconds=30,
+        smtp_factory=smtplib.SMTP,
+    ):
+        if max_size < 1:
+            raise ValueError("SMTP 풀 크기는 1 이상이어야 합니다.")
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.max_size = max_size
+        self.max_messages_per_session = max_messages_per_session
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self.acquire_timeout = acquire_timeout
+        self.idle_check_seconds = idle_check_seconds
+        self._smtp_factory = smtp_factory
+
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self._idle = []
+        self._closed = False
+        self._metrics = {
+            'sessions_opened': 0,
+            'sessions_closed': 0,
+            'messages_sent': 0,
+            'reconnects': 0,
+        }
+
+    def _open_session(self):
+        client = self._smtp_factory(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.use_tls:
+                client.starttls()
+            if self.username:
+                client.login(self.username, self.password)
+        except Exception:
+            self._quietly_close(client)
+            raise
+        with self._lock:
+            self._metrics['sessions_opened'] += 1
+        return _Session(client)
+
+    def _quietly_close(self, client):
+        try:
+            client.quit()
+        except Exception:
+            try:
+                client.close()
+            except Exception:
+                pass
+
+    def _close_session(self, session):
+        with self._lock:
+            self._metrics['sessions_closed'] += 1
+        self._quietly_close(session.client)
+
+    def _is_alive(self, session):
+        if time.monotonic() - session.last_used < self.idle_check_seconds:
+            return True
+        try:
+            return session.client.noop()[0] == 250
+        except Exception:
+            return False
+
+    @contextmanager
+    def session(self):
+        """세션 하나를 대여합니다. 블록이 끝나면 풀에 반납하거나(정상) 폐기합니다(오류/상한 도달)."""
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise SmtpPoolTimeoutError(
+                f"SMTP 풀에서 {self.acquire_timeout}초 안에 세션을 얻지 못했습니다 (max_size={self.max_size})."
+            )
+        session = None
+        healthy = False
+        try:
+            while session is None:
+                with self._lock:
+                    if self._closed:
+                        raise RuntimeError("SMTP pool is closed")
+                    candidate = self._idle.pop() if self._idle else None
+                if candidate is None:
+                    session = self._open_session()
+                elif self._is_alive(candidate):
+                    session = candidate
+                else:
+                    self._close_session(candidate)
+
+            yield session
+            healthy = True
+        finally:
+            if session is not None:
+                session.last_used = time.monotonic()
+                exhausted = session.messages_sent >= self.max_messages_per_session
+                with self._lock:
+                    keep = healthy and not exhausted and not self._closed
+                    if keep:
+                        self._idle.append(session)
+                if not keep:
+                    self._close_session(session)
+            self._slots.release()
+
+    def sendmail(self, from_addr, to_addrs, message):
+        """
+        풀의 세션으로 메시지 한 통을 발송합니다.
+
+        연결이 끊긴 경우 새 세션으로 한 번 재시도합니다. 수신자 거부 등
+        영구 오류는 그대로 전달되며, 세션은 계속 재사용됩니다.
+        """
+        for attempt in range(2):
+            permanent_error = None
+            try:
+                with self.session() as session:
+                    try:
+                        refused = session.client.sendmail(from_addr, to_addrs, message)
+                    except _PERMANENT_ERRORS as e:
+                        if _closes_session(e):
+                            raise smtplib.SMTPServerDisconnected(str(e)) from e
+                        # 세션 자체는 정상입니다 (smtplib가 RSET 처리).
+                        permanent_error = e
+                    session.messages_sent += 1
+            except _RECONNECTABLE_ERRORS:
+                if attempt == 1:
+                    raise
+                with self._lock:
+                    self._metrics['reconnects'] += 1
+                continue
+
+            if permanent_error is not None:
+                raise permanent_error
+            with self._lock:
+                self._metrics['messages_sent'] += 1
+            return refused
+
+    def closeall(self):
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for session in idle:
+            self._close_session(session)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'max_size': self.max_size,
+                'idle': len(self._idle),
+                **self._metrics,
+            }
+
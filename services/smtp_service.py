@@ -1,21 +1,33 @@
 # services/smtp_service.py
 import os
-import smtplib
 from email.mime.text import MIMEText
 import config
 from .base_email_service import BaseEmailService
+from .smtp_pool import SmtpConnectionPool
 
 class SmtpService(BaseEmailService):
     """
     표준 SMTP(Gmail 등)를 사용하여 이메일을 발송하는 서비스입니다.
+    인증된 SMTP 세션을 풀에 보관해 여러 메일에 재사용합니다.
     """
-    def __init__(self):
+    def __init__(self, pool=None):
         self.smtp_server = config.SMTP_SERVER
         self.smtp_port = config.SMTP_PORT
         self.sender_email = os.getenv('EMAIL_ADDRESS')
         self.sender_password = os.getenv('EMAIL_PASSWORD')
         if not self.sender_email or not self.sender_password:
             raise ValueError("SMTP 서비스에 필요한 EMAIL_ADDRESS 또는 EMAIL_PASSWORD가 설정되지 않았습니다.")
+        self.pool = pool or SmtpConnectionPool(
+            self.smtp_server,
+            self.smtp_port,
+            self.sender_email,
+            self.sender_password,
+            max_size=config.SMTP_POOL_SIZE,
+            max_messages_per_session=config.SMTP_MAX_MESSAGES_PER_SESSION,
+            use_tls=config.SMTP_USE_TLS,
+            timeout=config.SMTP_TIMEOUT,
+            idle_check_seconds=config.SMTP_IDLE_CHECK_SECONDS,
+        )
 
     def send_mail(self, to_email: str, subject: str, body: str) -> bool:
         msg = MIMEText(body, _charset='utf-8')
@@ -24,13 +36,16 @@ class SmtpService(BaseEmailService):
         msg['To'] = to_email
 
         try:
-            # 매번 새로운 연결을 생성합니다. (단순 구현)
-            # 대량 발송 시 성능 최적화가 필요할 수 있습니다.
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.sender_email, self.sender_password)
-                server.sendmail(self.sender_email, to_email, msg.as_string())
+            self.pool.sendmail(self.sender_email, to_email, msg.as_string())
             return True
         except Exception as e:
             print(f"오류: [SmtpService] {to_email}에게 이메일 발송 실패 - {e}")
             return False
+
+    def default_bulk_concurrency(self) -> int:
+        # 풀의 세션 수만큼 병렬로 보내면 세션 대기 없이 모두 활용됩니다.
+        return self.pool.max_size
+
+    def close(self):
+        """풀에 남아 있는 SMTP 세션을 모두 종료합니다."""
+        self.pool.closeall()
@@ -1,6 +1,6 @@
 import { test } from 'node:test';
 import { strict as assert } from 'node:assert';
-import { ApiError, request } from '../client';
+import { ApiError, clearValidatorCache, request } from '../client';
 
 test('request surfaces structured API errors', async () => {
   const originalFetch = globalThis.fetch;
@@ -58,3 +58,35 @@ test('request returns parsed JSON on success without wrappers', async () => {
     globalThis.fetch = originalFetch;
   }
 });
+
+test('request revalidates cached GETs with If-None-Match and reuses the body on 304', async () => {
+  const payload = { contents: [{ title: 'A' }], next_cursor: null };
+  const originalFetch = globalThis.fetch;
+  const sentValidators: Array<string | null> = [];
+  clearValidatorCache();
+  try {
+    globalThis.fetch = async (_input: RequestInfo | URL, init?: RequestInit) => {
+      const headers = (init?.headers ?? {}) as Record<string, string>;
+      const validator = headers['If-None-Match'] ?? null;
+      sentValidators.push(validator);
+      if (validator === '"v1"') {
+        return new Response(null, { status: 304, headers: { etag: '"v1"' } });
+      }
+      return new Response(JSON.stringify(payload), {
+        status: 200,
+        headers: { 'content-type': 'application/json', etag: '"v1"' },
+      });
+    };
+
+    const first = await request<typeof payload>('GET', '/api/contents/hiatus', { query: { type: 'webtoon' } });
+    const second = await request<typeof payload>('GET', '/api/contents/hiatus', { query: { type: 'webtoon' } });
+    await request('GET', '/api/contents/hiatus', { query: { type: 'webtoon' }, auth: 'token' });
+
+    assert.deepEqual(first, payload);
+    assert.deepEqual(second, payload);
+    assert.deepEqual(sentValidators, [null, '"v1"', null]);
+  } finally {
+    globalThis.fetch = originalFetch;
+    clearValidatorCache();
+  }
+});
@@ -18,6 +18,27 @@ export class ApiError extends Error {
   }
 }
 
+type CachedValidator = { etag: string; data: unknown };
+
+// Public GET responses carrying an ETag are kept here (most recently used last) so repeat
+// requests can revalidate with If-None-Match and reuse the body on 304. Treat cached
+// payloads as read-only: the same object is returned to every caller.
+const VALIDATOR_CACHE_LIMIT = 50;
+const validatorCache = new Map<string, CachedValidator>();
+
+const rememberValidator = (url: string, entry: CachedValidator) => {
+  validatorCache.delete(url);
+  validatorCache.set(url, entry);
+  if (validatorCache.size > VALIDATOR_CACHE_LIMIT) {
+    const oldest = validatorCache.keys().next().value;
+    if (oldest !== undefined) validatorCache.delete(oldest);
+  }
+};
+
+export const clearValidatorCache = () => {
+  validatorCache.clear();
+};
+
 const isJsonResponse = (response: Response) => {
   const contentType = response.headers.get('content-type');
   return contentType ? contentType.includes('application/json') : false;
@@ -86,6 +107,13 @@ export async function request<T>(
     }
   }
 
+  // Only unauthenticated GETs are cached so one user's data can never be served to another.
+  const cacheable = method === 'GET' && !auth;
+  const cached = cacheable ? validatorCache.get(url) : undefined;
+  if (cached) {
+    headers['If-None-Match'] = cached.etag;
+  }
+
   let serializedBody: BodyInit | undefined;
   if (body !== undefined) {
     if (body instanceof FormData || body instanceof Blob) {
@@ -102,12 +130,22 @@ export async function request<T>(
     body: serializedBody,
   });
 
+  if (response.status === 304 && cached) {
+    rememberValidator(url, cached);
+    return cached.data as T;
+  }
+
   if (!response.ok) {
     throw await buildApiError(response);
   }
 
   if (isJsonResponse(response)) {
-    return response.json() as Promise<T>;
+    const data = await response.json();
+    const etag = response.headers.get('etag');
+    if (cacheable && etag) {
+      rememberValidator(url, { etag, data });
+    }
+    return data as T;
   }
 
   // If the response has no body or is not JSON, return null to prevent crashes.
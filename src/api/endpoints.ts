@@ -14,7 +14,8 @@ type MeResponse = { success: true; user: unknown };
 type SubscriptionsResponse = { success: true; data: unknown[] };
 
 type ContentsList = Array<ContentLike>;
-type ContentsWithCursor = { contents: ContentsList; next_cursor: string | null };
+// next_cursor is an opaque keyset token; pass it back as `cursor` (or legacy `last_title`).
+type ContentsWithCursor = { contents: ContentsList; next_cursor: string | null; total?: number };
 
 type OngoingGrouped = Record<string, ContentsList>;
 
@@ -48,22 +49,24 @@ export async function listSubscriptions(auth: AuthInfo): Promise<unknown[]> {
   return data.data;
 }
 
-type ContentsQuery = { type?: string; source?: string };
+// view=card returns only the fields list cards need (projected in SQL); fields= picks them explicitly.
+type ContentsView = 'card' | 'full';
+type ContentsQuery = { type?: string; source?: string; view?: ContentsView; fields?: string };
 type SearchQuery = ContentsQuery & { q: string };
 
 export async function searchContents(query: SearchQuery): Promise<ContentsList> {
-  const { type, source, q } = query;
+  const { type, source, q, view, fields } = query;
   const payload = await request<ContentsList>('GET', '/api/contents/search', {
-    query: { q, type, source },
+    query: { q, type, source, view, fields },
   });
   const normalized = attachNormalizedMeta(payload, type);
   return withContentType(normalized as ContentsList, type);
 }
 
 export async function getOngoing(query: ContentsQuery): Promise<OngoingGrouped | ContentsList> {
-  const { type, source } = query;
+  const { type, source, view, fields } = query;
   const payload = await request<OngoingGrouped | ContentsList>('GET', '/api/contents/ongoing', {
-    query: { type, source },
+    query: { type, source, view, fields },
   });
 
   const normalized = attachNormalizedMeta(payload, type);
@@ -84,7 +87,12 @@ export async function getOngoing(query: ContentsQuery): Promise<OngoingGrouped |
   return grouped;
 }
 
-type HiatusCompletedQuery = ContentsQuery & { last_title?: string };
+type HiatusCompletedQuery = ContentsQuery & {
+  cursor?: string;
+  last_title?: string;
+  per_page?: number;
+  include_total?: boolean;
+};
 
 const withCursorNormalization = async (
   path: string,
@@ -100,6 +108,9 @@ const withCursorNormalization = async (
   return {
     contents: withContentType(contents, query.type),
     next_cursor: (normalized as ContentsWithCursor).next_cursor ?? null,
+    ...(typeof (normalized as ContentsWithCursor).total === 'number'
+      ? { total: (normalized as ContentsWithCursor).total }
+      : {}),
   };
 };
 
@@ -602,7 +602,8 @@ async function fetchAndRenderContent(tabId) {
       if (tabId === 'webtoon' || tabId === 'novel') {
         const day = STATE.filters[tabId].day;
         const source = STATE.filters[tabId].source;
-        query = { type: tabId, source };
+        // 목록 카드에 필요한 필드만 받습니다 (meta 이미지 목록 등 제외)
+        query = { type: tabId, source, view: 'card' };
 
         if (day === 'completed') {
           url = buildUrl('/api/contents/completed', query);
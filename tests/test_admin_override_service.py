@@ -1,5 +1,7 @@
 from datetime import datetime
 
+import pytest
+
 import services.admin_override_service as admin_service
 
 
@@ -30,6 +32,9 @@ class FakeCursor:
             })
             self.db.overrides[key] = row
             self.last_result = [row]
+        elif "pg_notify" in query:
+            self.db.notifications.append(params)
+            self.last_result = []
         else:
             raise NotImplementedError(query)
 
@@ -45,11 +50,19 @@ class FakeCursor:
         pass
 
 
+@pytest.fixture(autouse=True)
+def record_version_bumps(monkeypatch):
+    bumps = []
+    monkeypatch.setattr(admin_service, 'bump_content_data_version', lambda conn, source: bumps.append(source) or len(bumps))
+    return bumps
+
+
 class FakeDB:
     def __init__(self, contents, overrides=None, now=None):
         self.contents = contents
         self.overrides = overrides or {}
         self.now = now
+        self.notifications = []
         self.committed = False
         self.rolled_back = False
 
@@ -60,7 +73,7 @@ class FakeDB:
         self.rolled_back = True
 
 
-def test_scheduled_override_does_not_record_event(monkeypatch):
+def test_scheduled_override_does_not_record_event(monkeypatch, record_version_bumps):
     now = datetime(2025, 12, 17, 12, 0, 0)
     db = FakeDB({('CID', 'SRC'): '연재중'}, now=now)
 
@@ -86,6 +99,9 @@ def test_scheduled_override_does_not_record_event(monkeypatch):
 
     assert db.committed is True
     assert result['event_recorded'] is False
+    assert len(db.notifications) == 1
+    assert db.notifications[0][0] == 'admin_override_changed'
+    assert record_version_bumps == ['SRC']
     assert recorded_events == []
     assert result['new_final_state']['final_status'] == '연재중'
     assert result['new_final_state']['resolved_by'] == 'crawler'
@@ -0,0 +1,72 @@
+import csv
+import io
+import json
+
+from crawlers.base_crawler import ContentCrawler
+from utils.content_hash import compute_content_hash
+
+
+class FakeCursor:
+    def __init__(self, merge_result):
+        self.merge_result = merge_result
+        self.executed = []
+        self.copied_rows = []
+        self.closed = False
+
+    def execute(self, query, params=None):
+        self.executed.append((query, params))
+
+    def copy_expert(self, sql, file):
+        self.copied_rows = list(csv.reader(io.StringIO(file.read())))
+
+    def fetchone(self):
+        return self.merge_result
+
+    def close(self):
+        self.closed = True
+
+
+class DummyCrawler(ContentCrawler):
+    async def fetch_all_data(self):
+        return {}, {}, {}, {}
+
+    def synchronize_database(self, conn, all_content_today, ongoing_today, hiatus_today, finished_today):
+        return 0
+
+
+def test_bulk_upsert_streams_rows_and_reports_counts(monkeypatch):
+    cursor = FakeCursor({"inserted": 1, "updated": 1})
+    monkeypatch.setattr("crawlers.base_crawler.get_cursor", lambda conn: cursor)
+
+    crawler = DummyCrawler("SRC")
+    records = [
+        (1, "webtoon", "제목, 하나", "연재중", {"common": {"authors": ["작가"]}}),
+        ("2", "webtoon", "둘", "완결", {}),
+        ("3", "webtoon", "셋", "휴재", {}),
+    ]
+
+    stats = crawler.bulk_upsert_contents(object(), records)
+
+    assert stats == {"inserted": 1, "updated": 1, "changed": 2, "unchanged": 1}
+    assert [row[0] for row in cursor.copied_rows] == ["1", "2", "3"]
+    assert cursor.copied_rows[0][2] == "제목, 하나"
+    assert json.loads(cursor.copied_rows[0][4]) == {"common": {"authors": ["작가"]}}
+    assert cursor.copied_rows[0][5] == compute_content_hash(
+        "webtoon", "제목, 하나", "연재중", {"common": {"authors": ["작가"]}}
+    )
+    merge_query, merge_params = cursor.executed[-1]
+    assert "ON CONFLICT (content_id, source) DO UPDATE" in merge_query
+    assert "content_hash IS DISTINCT FROM" in merge_query
+    assert merge_params == ("SRC", "SRC")
+    assert cursor.closed is True
+
+
+def test_bulk_upsert_skips_db_when_no_records(monkeypatch):
+    def fail_get_cursor(conn):
+        raise AssertionError("DB should not be touched")
+
+    monkeypatch.setattr("crawlers.base_crawler.get_cursor", fail_get_cursor)
+
+    stats = DummyCrawler("SRC").bulk_upsert_contents(object(), [])
+
+    assert stats == {"inserted": 0, "updated": 0, "changed": 0, "unchanged": 0}
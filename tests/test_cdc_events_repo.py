@@ -0,0 +1,91 @@
+from datetime import datetime
+
+import pytest
+
+from repositories import cdc_events_repo
+from services.cdc_event_service import record_content_completed_events
+
+
+class FakeConnection:
+    encoding = "UTF8"
+
+
+class FakeCursor:
+    """execute_values가 쓰는 mogrify/execute/fetchall만 흉내 내는 커서입니다."""
+
+    def __init__(self, existing):
+        self.connection = FakeConnection()
+        self.existing = set(existing)
+        self.statements = []
+        self._page = []
+        self._returned = []
+
+    def mogrify(self, template, args):
+        self._page.append(args)
+        return repr(args).encode("utf-8")
+
+    def execute(self, query, params=None):
+        self.statements.append(query.decode("utf-8") if isinstance(query, bytes) else query)
+        self._returned = []
+        for content_id, source, event_type, *_ in self._page:
+            key = (content_id, source, event_type)
+            if key not in self.existing:
+                self.existing.add(key)
+                self._returned.append(key)
+        self._page = []
+
+    def fetchall(self):
+        return self._returned
+
+    def close(self):
+        pass
+
+
+def _event(content_id, source="SRC"):
+    return {
+        "content_id": content_id,
+        "source": source,
+        "event_type": "CONTENT_COMPLETED",
+        "final_status": "완결",
+        "final_completed_at": datetime(2025, 1, 1),
+        "resolved_by": "crawler",
+    }
+
+
+def test_insert_events_pages_statements_and_returns_only_new_keys(monkeypatch):
+    cursor = FakeCursor(existing={("B", "SRC", "CONTENT_COMPLETED")})
+    monkeypatch.setattr(cdc_events_repo, "get_cursor", lambda conn: cursor)
+
+    inserted = cdc_events_repo.insert_events(
+        object(), [_event("A"), _event("B"), _event("C"), _event("D"), _event("E")], page_size=2
+    )
+
+    assert len(cursor.statements) == 3
+    for statement in cursor.statements:
+        assert "ON CONFLICT (content_id, source, event_type) DO NOTHING" in statement
+        assert "RETURNING content_id, source, event_type" in statement
+    assert inserted == {(cid, "SRC", "CONTENT_COMPLETED") for cid in ("A", "C", "D", "E")}
+
+
+def test_insert_events_skips_the_database_when_empty(monkeypatch):
+    monkeypatch.setattr(cdc_events_repo, "get_cursor", lambda conn: pytest.fail("cursor opened for an empty batch"))
+
+    assert cdc_events_repo.insert_events(object(), []) == set()
+
+
+def test_record_content_completed_events_returns_new_pairs_across_pages(monkeypatch):
+    cursor = FakeCursor(existing={("2", "SRC", "CONTENT_COMPLETED")})
+    monkeypatch.setattr(cdc_events_repo, "get_cursor", lambda conn: cursor)
+    original_insert = cdc_events_repo.insert_events
+    monkeypatch.setattr(
+        "services.cdc_event_service.insert_events",
+        lambda conn, events: original_insert(conn, events, page_size=1),
+    )
+
+    inserted = record_content_completed_events(
+        object(),
+        [(str(i), "SRC", datetime(2025, 1, 1), "crawler") for i in range(1, 4)],
+    )
+
+    assert len(cursor.statements) == 3
+    assert inserted == {("1", "SRC"), ("3", "SRC")}
@@ -0,0 +1,213 @@
+import asyncio
+import csv
+import io
+import os
+from datetime import datetime
+
+import pytest
+
+import services.cdc_sql_engine as cdc_sql_engine
+from crawlers.base_crawler import ContentCrawler
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.executed = []
+        self.copied_rows = []
+
+    def execute(self, query, params=None):
+        self.executed.append((query, params))
+
+    def copy_expert(self, sql, file):
+        self.copied_rows = list(csv.reader(io.StringIO(file.read())))
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+
+def test_sql_engine_streams_crawl_and_returns_transitions(monkeypatch):
+    now = datetime(2025, 1, 1, 0, 0, 0)
+    cursor = FakeCursor(
+        [{"content_id": "1", "final_completed_at": None, "resolved_by": "crawler", "inserted": True}]
+    )
+    monkeypatch.setattr(cdc_sql_engine, "get_cursor", lambda conn: cursor)
+
+    result = cdc_sql_engine.detect_and_record_completions_sql(object(), "SRC", {1: "완결", "2": "연재중"}, now)
+
+    assert result == [("1", None, "crawler", True)]
+    assert cursor.copied_rows == [["1", "완결"], ["2", "연재중"]]
+    query, params = cursor.executed[-1]
+    assert "ON CONFLICT (content_id, source, event_type) DO NOTHING" in query
+    assert params["source"] == "SRC" and params["now"] == now
+
+
+class FakeDB:
+    def __init__(self):
+        self.committed = False
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        pass
+
+
+class FinishingCrawler(ContentCrawler):
+    async def fetch_all_data(self):
+        return {}, {}, {7: {}}, {7: {}}
+
+    def synchronize_database(self, conn, all_content_today, ongoing_today, hiatus_today, finished_today):
+        return 0
+
+
+def test_run_daily_check_uses_sql_engine_without_loading_snapshot(monkeypatch):
+    class NoSnapshotCursor:
+        def execute(self, query, params=None):
+            raise AssertionError(f"unexpected query: {query}")
+
+        def close(self):
+            pass
+
+    calls = []
+
+    def fake_detect(conn, source, current_status_map, now):
+        calls.append((source, current_status_map))
+        return [("7", None, "crawler", True)]
+
+    monkeypatch.setattr("config.CDC_ENGINE", "sql")
+    monkeypatch.setattr("crawlers.base_crawler.get_cursor", lambda conn: NoSnapshotCursor())
+    monkeypatch.setattr("crawlers.base_crawler.detect_and_record_completions_sql", fake_detect)
+    monkeypatch.setattr(
+        "crawlers.base_crawler.record_due_scheduled_completions",
+        lambda conn, cursor, now: {"due_count": 0, "inserted_count": 0},
+    )
+    monkeypatch.setattr("crawlers.base_crawler.bump_content_data_version", lambda conn, source: 1)
+    monkeypatch.setattr("crawlers.base_crawler.materialize_ongoing_snapshots", lambda conn, source: 0)
+    monkeypatch.setattr("crawlers.base_crawler.refresh_content_status_counts", lambda conn, source: None)
+
+    db = FakeDB()
+    _, newly_completed_items, cdc_info = asyncio.run(FinishingCrawler("SRC").run_daily_check(db))
+
+    assert calls == [("SRC", {"7": "완결"})]
+    assert newly_completed_items == [("7", "SRC", None, "crawler")]
+    assert cdc_info["cdc_engine"] == "sql"
+    assert cdc_info["cdc_events_inserted_items"] == ["7"]
+    assert db.committed is True
+
+
+# --- Python 엔진과 SQL 엔진의 판정 규칙 일치 검사 -------------------------------------
+
+PARITY_NOW = datetime(2025, 1, 10, 12, 0, 0)
+PAST = datetime(2025, 1, 9, 0, 0, 0)
+FUTURE = datetime(2025, 1, 11, 0, 0, 0)
+
+# (content_id, DB의 이전 status, 오늘 크롤 status, override_status, override_completed_at)
+# None: 이전 행 없음(신규) / 오늘 크롤에 없음 / override 없음
+PARITY_CASES = [
+    ("plain-completed", "연재중", "완결", None, None),
+    ("new-row-completed", None, "완결", None, None),
+    ("new-row-ongoing", None, "연재중", None, None),
+    ("already-completed", "완결", "완결", None, None),
+    ("unseen-today", "연재중", None, None, None),
+    ("unseen-previously-completed", "완결", None, None, None),
+    ("override-hiatus-wins", "연재중", "완결", "휴재", None),
+    ("override-ongoing-wins", "완결", "완결", "연재중", None),
+    ("override-completed-now", "연재중", "완결", "완결", None),
+    ("override-completed-now-ongoing", "연재중", "연재중", "완결", None),
+    ("scheduled-future-crawler-completes", "연재중", "완결", "완결", FUTURE),
+    ("scheduled-future-still-ongoing", "연재중", "연재중", "완결", FUTURE),
+    ("scheduled-future-new-row", None, "완결", "완결", FUTURE),
+    ("scheduled-past", "연재중", "연재중", "완결", PAST),
+    ("scheduled-past-crawler-completes", "연재중", "완결", "완결", PAST),
+    ("override-only-no-rows", None, None, "완결", PAST),
+]
+
+
+def _python_transitions(cases, now):
+    from services.final_state_resolver import resolve_completion_transitions
+
+    return resolve_completion_transitions(
+        [case[0] for case in cases],
+        [case[1] for case in cases],
+        [case[2] for case in cases],
+        [case[3] for case in cases],
+        [case[4] for case in cases],
+        now=now,
+    )
+
+
+def _expected_by_final_state(cases, now):
+    """resolve_final_state를 이전/현재 상태에 각각 적용해 비교한 기준 답."""
+    from services.final_state_resolver import resolve_final_state
+
+    expected = []
+    for content_id, previous, current, override_status, override_completed_at in cases:
+        override = (
+            {"override_status": override_status, "override_completed_at": override_completed_at}
+            if override_status is not None
+            else None
+        )
+        before = resolve_final_state(previous, override, now=now)
+        after = resolve_final_state(current if current is not None else previous, override, now=now)
+        if before["final_status"] != "완결" and after["final_status"] == "완결":
+            expected.append((content_id, after["final_completed_at"], after["resolved_by"]))
+    return expected
+
+
+def test_python_resolver_matches_final_state_rules():
+    assert sorted(_python_transitions(PARITY_CASES, PARITY_NOW)) == sorted(
+        _expected_by_final_state(PARITY_CASES, PARITY_NOW)
+    )
+
+
+@pytest.fixture
+def pg_conn():
+    """TEST_DATABASE_URL의 PostgreSQL에 연결합니다. 테이블은 임시 테이블로 가리고 끝나면 롤백합니다."""
+    url = os.environ.get("TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("TEST_DATABASE_URL이 없어 SQL CDC 엔진 일치 검사를 건너뜁니다.")
+    psycopg2 = pytest.importorskip("psycopg2")
+    conn = psycopg2.connect(url)
+    try:
+        cursor = conn.cursor()
+        cursor.execute("CREATE TEMP TABLE contents (content_id TEXT, source TEXT, status TEXT)")
+        cursor.execute(
+            "CREATE TEMP TABLE admin_content_overrides ("
+            "content_id TEXT, source TEXT, override_status TEXT, override_completed_at TIMESTAMP)"
+        )
+        cursor.execute(
+            "CREATE TEMP TABLE cdc_events ("
+            "content_id TEXT, source TEXT, event_type TEXT, final_status TEXT, "
+            "final_completed_at TIMESTAMP, resolved_by TEXT, UNIQUE (content_id, source, event_type))"
+        )
+        cursor.close()
+        yield conn
+    finally:
+        conn.rollback()
+        conn.close()
+
+
+def test_sql_engine_matches_python_resolver(pg_conn):
+    cursor = pg_conn.cursor()
+    for content_id, previous, _, override_status, override_completed_at in PARITY_CASES:
+        if previous is not None:
+            cursor.execute("INSERT INTO contents VALUES (%s, 'SRC', %s)", (content_id, previous))
+        if override_status is not None:
+            cursor.execute(
+                "INSERT INTO admin_content_overrides VALUES (%s, 'SRC', %s, %s)",
+                (content_id, override_status, override_completed_at),
+            )
+    # 다른 source의 행은 판정에 섞이지 않아야 합니다.
+    cursor.execute("INSERT INTO contents VALUES ('plain-completed', 'OTHER', '완결')")
+    cursor.close()
+
+    current_status_map = {case[0]: case[2] for case in PARITY_CASES if case[2] is not None}
+    sql_result = cdc_sql_engine.detect_and_record_completions_sql(pg_conn, "SRC", current_status_map, PARITY_NOW)
+
+    expected = _python_transitions(PARITY_CASES, PARITY_NOW)
+    assert sorted(row[:3] for row in sql_result) == sorted(expected)
+    assert all(row[3] for row in sql_result)
@@ -0,0 +1,19 @@
+from utils.content_hash import compute_content_hash
+
+
+def test_hash_ignores_meta_key_order():
+    first = compute_content_hash("webtoon", "제목", "연재중", {"common": {"a": 1, "b": 2}, "attributes": {}})
+    second = compute_content_hash("webtoon", "제목", "연재중", {"attributes": {}, "common": {"b": 2, "a": 1}})
+
+    assert first == second
+
+
+def test_hash_changes_with_status():
+    ongoing = compute_content_hash("webtoon", "제목", "연재중", {})
+    completed = compute_content_hash("webtoon", "제목", "완결", {})
+
+    assert ongoing != completed
+
+
+def test_hash_treats_missing_meta_as_empty():
+    assert compute_content_hash("webtoon", "제목", "완결", None) == compute_content_hash("webtoon", "제목", "완결", {})
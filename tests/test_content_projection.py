@@ -0,0 +1,80 @@
+import pytest
+
+from app import app as flask_app
+from services.content_projection import (
+    CARD_FIELDS,
+    build_select_list,
+    parse_projection,
+    shape_row,
+)
+from views import contents
+
+
+def test_parse_projection_defaults_and_card():
+    assert parse_projection() == ('full', None)
+    assert parse_projection('full') == ('full', None)
+    assert parse_projection('card') == ('card', CARD_FIELDS)
+
+
+def test_parse_projection_fields_always_keeps_identity_and_normalizes_name():
+    name, fields = parse_projection(None, 'title, thumbnail_url')
+    assert fields == ('content_id', 'source', 'title', 'thumbnail_url')
+    assert name == 'fields:content_id,source,thumbnail_url,title'
+    assert parse_projection(None, 'thumbnail_url,title')[0] == name
+
+
+def test_parse_projection_rejects_unknown_values():
+    with pytest.raises(ValueError):
+        parse_projection('tiny')
+    with pytest.raises(ValueError):
+        parse_projection(None, "title,meta->>'x'")
+
+
+def test_card_select_projects_meta_paths_in_sql():
+    sql = build_select_list(CARD_FIELDS)
+    assert sql.startswith('content_id, title, status, source, ')
+    assert "jsonb_build_object('common', jsonb_build_object('thumbnail_url', meta->'common'->'thumbnail_url', 'authors', meta->'common'->'authors')" in sql
+    assert "'attributes', jsonb_build_object('weekdays', meta->'attributes'->'weekdays')" in sql
+    assert sql.endswith('AS meta')
+
+
+def test_meta_field_selects_whole_meta():
+    _, fields = parse_projection(None, 'meta,thumbnail_url')
+    assert build_select_list(fields) == 'content_id, source, meta'
+
+
+def test_shape_row_only_defaults_meta_when_selected():
+    assert shape_row({'title': 'A'}) == {'title': 'A'}
+    assert shape_row({'title': 'A', 'meta': None}) == {'title': 'A', 'meta': {}}
+
+
+class RecordingCursor:
+    def __init__(self, executed):
+        self.executed = executed
+
+    def execute(self, query, params=None):
+        self.executed.append(query)
+
+    def fetchall(self):
+        return []
+
+    def close(self):
+        pass
+
+
+def test_listing_endpoints_use_projection_and_reject_bad_view(monkeypatch):
+    executed = []
+    monkeypatch.setattr(contents, 'get_db', lambda: object())
+    monkeypatch.setattr(contents, 'get_cursor', lambda conn: RecordingCursor(executed))
+    monkeypatch.setattr(contents, '_data_version_etag', lambda vary_encoding: 'etag')
+    flask_app.config['TESTING'] = True
+    client = flask_app.test_client()
+
+    assert client.get('/api/contents/completed?view=card').status_code == 200
+    assert 'AS meta' in executed[-1]
+    assert client.get('/api/contents/hiatus?fields=title').status_code == 200
+    assert executed[-1].startswith('SELECT content_id, source, title FROM contents')
+
+    bad = client.get('/api/contents/hiatus?view=tiny')
+    assert bad.status_code == 400
+    assert bad.get_json()['error']['code'] == 'INVALID_REQUEST'
@@ -0,0 +1,168 @@
+import json
+
+import pytest
+
+from app import app as flask_app
+from services import contents_cache, ongoing_contents_service
+from services.contents_cache import (
+    ContentsResponseCache,
+    InMemorySharedCache,
+    LocalLRUCache,
+)
+from views import contents
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def versions(monkeypatch):
+    state = {'naver_webtoon': 1, 'kakao_webtoon': 1}
+    loads = []
+
+    def fake_load(conn):
+        loads.append(conn)
+        return dict(state)
+
+    monkeypatch.setattr(contents_cache, 'load_content_data_versions', fake_load)
+    return state, loads
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LocalLRUCache(max_entries=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+
+
+def test_in_memory_shared_cache_expires(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(contents_cache.time, 'monotonic', clock)
+    shared = InMemorySharedCache()
+    shared.set('k', b'v', ex=10)
+    assert shared.get('k') == b'v'
+    clock.now += 11
+    assert shared.get('k') is None
+
+
+def test_generation_bump_invalidates_entry(monkeypatch, versions):
+    versions, _ = versions
+    cache = ContentsResponseCache(version_ttl=0)
+    builds = []
+
+    def build(generation):
+        builds.append(generation)
+        return f"payload-{len(builds)}".encode()
+
+    assert cache.get_or_build(('webtoon', 'naver_webtoon'), 'naver_webtoon', lambda: None, build) == b'payload-1'
+    assert cache.get_or_build(('webtoon', 'naver_webtoon'), 'naver_webtoon', lambda: None, build) == b'payload-1'
+    assert len(builds) == 1
+
+    # 다른 소스의 버전 변경은 영향을 주지 않음
+    versions['kakao_webtoon'] += 1
+    assert cache.get_or_build(('webtoon', 'naver_webtoon'), 'naver_webtoon', lambda: None, build) == b'payload-1'
+
+    versions['naver_webtoon'] += 1
+    assert cache.get_or_build(('webtoon', 'naver_webtoon'), 'naver_webtoon', lambda: None, build) == b'payload-2'
+    assert cache.metrics == {'local_hits': 2, 'shared_hits': 0, 'misses': 2}
+
+
+def test_all_source_generation_tracks_every_source(versions):
+    versions, _ = versions
+    cache = ContentsResponseCache(version_ttl=0)
+    before = cache.generation('all', lambda: None)
+    versions['kakao_webtoon'] += 1
+    assert cache.generation('all', lambda: None) != before
+
+
+def test_versions_are_reused_within_ttl(monkeypatch, versions):
+    _, loads = versions
+    clock = FakeClock()
+    monkeypatch.setattr(contents_cache.time, 'monotonic', clock)
+    cache = ContentsResponseCache(version_ttl=5)
+
+    cache.generation('naver_webtoon', lambda: None)
+    cache.generation('naver_webtoon', lambda: None)
+    assert len(loads) == 1
+
+    clock.now += 6
+    cache.generation('naver_webtoon', lambda: None)
+    assert len(loads) == 2
+
+
+def test_shared_tier_is_used_across_processes(versions):
+    shared = InMemorySharedCache()
+    first = ContentsResponseCache(shared=shared, version_ttl=0)
+    second = ContentsResponseCache(shared=shared, version_ttl=0)
+
+    first.get_or_build(('webtoon', 'all'), 'all', lambda: None, lambda generation: b'built-once')
+    payload = second.get_or_build(
+        ('webtoon', 'all'), 'all', lambda: None, lambda generation: pytest.fail('should not rebuild')
+    )
+
+    assert payload == b'built-once'
+    assert second.metrics['shared_hits'] == 1
+
+
+def test_shared_tier_errors_fall_back_to_build(versions):
+    class BrokenShared:
+        def get(self, key):
+            raise ConnectionError('down')
+
+        def set(self, key, value, ex=None):
+            raise ConnectionError('down')
+
+    cache = ContentsResponseCache(shared=BrokenShared(), version_ttl=0)
+    assert cache.get_or_build(('webtoon', 'all'), 'all', lambda: None, lambda generation: b'ok') == b'ok'
+
+
+class FakeContentsCursor:
+    def __init__(self, rows, executed):
+        self.rows = rows
+        self.executed = executed
+
+    def execute(self, query, params=None):
+        self.executed.append((query, params))
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+
+def test_ongoing_endpoint_serves_cached_bytes(monkeypatch, versions):
+    rows = [
+        {'content_id': '1', 'title': 'A', 'status': '연재중', 'source': 'naver_webtoon',
+         'meta': {'attributes': {'weekdays': ['mon']}}},
+    ]
+    executed = []
+    monkeypatch.setattr(contents, 'get_db', lambda: object())
+    monkeypatch.setattr(ongoing_contents_service, 'get_cursor', lambda conn: FakeContentsCursor(rows, executed))
+    monkeypatch.setattr(ongoing_contents_service, 'fetch_snapshot_body', lambda *args: None)
+    monkeypatch.setattr(contents.config, 'CONTENTS_CACHE_ENABLED', True)
+    contents_cache.reset_contents_cache(ContentsResponseCache(version_ttl=0))
+
+    flask_app.config['TESTING'] = True
+    client = flask_app.test_client()
+    try:
+        first = client.get('/api/contents/ongoing?type=webtoon&source=naver_webtoon', headers={'Accept-Encoding': 'identity'})
+        second = client.get('/api/contents/ongoing?type=webtoon&source=naver_webtoon', headers={'Accept-Encoding': 'identity'})
+    finally:
+        contents_cache.reset_contents_cache()
+
+    assert first.status_code == 200
+    assert first.mimetype == 'application/json'
+    assert json.loads(first.data)['mon'][0]['title'] == 'A'
+    assert second.data == first.data
+    assert len(executed) == 1
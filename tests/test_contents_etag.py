@@ -0,0 +1,97 @@
+import pytest
+
+from app import app as flask_app
+from services import contents_cache, ongoing_contents_service
+from services.contents_cache import ContentsResponseCache
+from views import contents
+
+
+class FakeCursor:
+    def __init__(self, executed):
+        self.executed = executed
+
+    def execute(self, query, params=None):
+        self.executed.append((query, params))
+
+    def fetchall(self):
+        return [{'content_id': '1', 'title': 'A', 'status': '휴재', 'meta': None, 'source': 'naver_webtoon'}]
+
+    def fetchone(self):
+        return None
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def env(monkeypatch):
+    versions = {'naver_webtoon': 1}
+    executed = []
+    monkeypatch.setattr(contents_cache, 'load_content_data_versions', lambda conn: dict(versions))
+    monkeypatch.setattr(contents, 'get_db', lambda: object())
+    monkeypatch.setattr(contents, 'get_cursor', lambda conn: FakeCursor(executed))
+    monkeypatch.setattr(ongoing_contents_service, 'get_cursor', lambda conn: FakeCursor(executed))
+    monkeypatch.setattr(ongoing_contents_service, 'fetch_snapshot_body', lambda *args: None)
+    contents_cache.reset_contents_cache(ContentsResponseCache(version_ttl=0))
+    flask_app.config['TESTING'] = True
+    yield flask_app.test_client(), versions, executed
+    contents_cache.reset_contents_cache()
+
+
+def test_if_none_match_returns_304_without_querying_contents(env):
+    client, versions, executed = env
+    url = '/api/contents/hiatus?type=webtoon&source=naver_webtoon'
+
+    first = client.get(url)
+    assert first.status_code == 200
+    etag = first.headers['ETag']
+    assert not etag.startswith('W/')
+    assert first.headers['Cache-Control'] == 'no-cache'
+    assert len(executed) == 1
+
+    second = client.get(url, headers={'If-None-Match': etag})
+    assert second.status_code == 304
+    assert second.data == b''
+    assert second.headers['ETag'] == etag
+    assert len(executed) == 1
+
+    versions['naver_webtoon'] += 1
+    third = client.get(url, headers={'If-None-Match': etag})
+    assert third.status_code == 200
+    assert third.headers['ETag'] != etag
+    assert len(executed) == 2
+
+
+def test_etag_differs_per_query_and_source_scope(env):
+    client, versions, _ = env
+
+    naver = client.get('/api/contents/completed?source=naver_webtoon').headers['ETag']
+    naver_page = client.get('/api/contents/completed?source=naver_webtoon&last_title=A').headers['ETag']
+    kakao = client.get('/api/contents/completed?source=kakao_webtoon').headers['ETag']
+    assert len({naver, naver_page, kakao}) == 3
+
+    # 다른 소스의 버전 변경은 영향을 주지 않음
+    versions['kakao_webtoon'] = 5
+    assert client.get('/api/contents/completed?source=naver_webtoon').headers['ETag'] == naver
+    assert client.get('/api/contents/completed?source=kakao_webtoon').headers['ETag'] != kakao
+
+
+def test_ongoing_etag_varies_by_content_encoding(env, monkeypatch):
+    client, _, _ = env
+    monkeypatch.setattr(contents, 'supported_encodings', lambda: ('gzip',))
+    url = '/api/contents/ongoing?type=webtoon&source=naver_webtoon'
+
+    gzipped = client.get(url, headers={'Accept-Encoding': 'gzip'})
+    plain = client.get(url, headers={'Accept-Encoding': 'identity'})
+    assert gzipped.headers['ETag'] != plain.headers['ETag']
+
+    revalidated = client.get(url, headers={'Accept-Encoding': 'gzip', 'If-None-Match': gzipped.headers['ETag']})
+    assert revalidated.status_code == 304
+    assert 'Accept-Encoding' in revalidated.headers['Vary']
+
+
+def test_error_responses_do_not_get_etag(env):
+    client, _, _ = env
+    response = client.get('/api/contents/ongoing?day=someday')
+    assert response.status_code == 400
+    assert 'ETag' not in response.headers
@@ -0,0 +1,121 @@
+import pytest
+
+from app import app as flask_app
+from utils.pagination import decode_cursor, encode_cursor
+from views import contents
+
+
+def test_cursor_roundtrip_is_opaque_and_validated():
+    token = encode_cursor(('같은 제목', 'naver_webtoon', '42'))
+    assert token.startswith('c1.')
+    assert '같은' not in token
+    assert decode_cursor(token, 3) == ('같은 제목', 'naver_webtoon', '42')
+
+    assert decode_cursor(None, 3) is None
+    assert decode_cursor('plain title', 3) is None
+    assert decode_cursor('c1.!!!', 3) is None
+    assert decode_cursor(encode_cursor(('a', 'b')), 3) is None
+
+
+class FakeCursor:
+    def __init__(self, rows, executed):
+        self.rows = rows
+        self.executed = executed
+
+    def execute(self, query, params=None):
+        self.executed.append((query, params))
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+
+def _row(title, source, content_id):
+    return {'content_id': content_id, 'title': title, 'status': '완결', 'meta': None, 'source': source}
+
+
+@pytest.fixture
+def client_with_rows(monkeypatch):
+    state = {'rows': [], 'executed': [], 'totals': []}
+    monkeypatch.setattr(contents, 'get_db', lambda: object())
+    monkeypatch.setattr(contents, 'get_cursor', lambda conn: FakeCursor(state['rows'], state['executed']))
+    monkeypatch.setattr(contents, '_data_version_etag', lambda vary_encoding: 'etag')
+
+    def fake_total(conn, content_type, status, source):
+        state['totals'].append((content_type, status, source))
+        return 1234
+
+    monkeypatch.setattr(contents, 'load_status_total', fake_total)
+    flask_app.config['TESTING'] = True
+    return flask_app.test_client(), state
+
+
+def test_next_cursor_encodes_full_key_and_is_used_for_next_page(client_with_rows):
+    client, state = client_with_rows
+    state['rows'] = [_row('A', 'kakao', '1'), _row('A', 'naver', '2'), _row('B', 'naver', '3')]
+
+    first = client.get('/api/contents/completed?per_page=2').get_json()
+    query, params = state['executed'][-1]
+    assert 'ORDER BY title ASC, source ASC, content_id ASC' in query
+    assert params == ('완결', 'webtoon', 3)
+    assert [item['content_id'] for item in first['contents']] == ['1', '2']
+    assert decode_cursor(first['next_cursor'], 3) == ('A', 'naver', '2')
+    assert 'total' not in first
+
+    client.get(f"/api/contents/completed?per_page=2&cursor={first['next_cursor']}")
+    query, params = state['executed'][-1]
+    assert '(title, source, content_id) > (%s, %s, %s)' in query
+    assert params == ('완결', 'webtoon', 'A', 'naver', '2', 3)
+
+
+def test_last_page_has_no_cursor_and_total_comes_from_counter(client_with_rows):
+    client, state = client_with_rows
+    state['rows'] = [_row('A', 'kakao', '1')]
+
+    body = client.get('/api/contents/hiatus?source=kakao&include_total=1').get_json()
+    assert body['next_cursor'] is None
+    assert body['total'] == 1234
+    assert state['totals'] == [('webtoon', '휴재', 'kakao')]
+    assert state['executed'][-1][1] == ('휴재', 'webtoon', 'kakao', 101)
+
+
+def test_legacy_last_title_still_works(client_with_rows):
+    client, state = client_with_rows
+
+    client.get('/api/contents/completed?last_title=B')
+    query, params = state['executed'][-1]
+    assert 'AND title > %s' in query
+    assert params[-2:] == ('B', 101)
+
+    # 구 클라이언트가 next_cursor를 last_title로 되돌려 보내도 keyset으로 처리
+    token = encode_cursor(('B', 'naver', '9'))
+    client.get(f'/api/contents/completed?last_title={token}')
+    assert '(title, source, content_id) > (%s, %s, %s)' in state['executed'][-1][0]
+
+
+def test_page_size_is_clamped_and_validated(client_with_rows, monkeypatch):
+    client, state = client_with_rows
+    monkeypatch.setattr(contents.config, 'CONTENTS_PAGE_SIZE_MAX', 50)
+
+    client.get('/api/contents/completed?per_page=10000')
+    assert state['executed'][-1][1][-1] == 51
+
+    assert client.get('/api/contents/completed?per_page=abc').status_code == 400
+    assert client.get('/api/contents/completed?cursor=garbage').status_code == 400
+
+
+def test_source_filtered_cursor_compares_title_and_content_id(client_with_rows):
+    client, state = client_with_rows
+
+    token = encode_cursor(('A', 'naver', '2'))
+    client.get(f'/api/contents/completed?source=naver&cursor={token}')
+    query, params = state['executed'][-1]
+    assert '(title, content_id) > (%s, %s)' in query
+    assert '(title, source, content_id)' not in query
+    assert params == ('완결', 'webtoon', 'naver', 'A', '2', 101)
+
+    # 다른 source 목록의 커서를 재사용하면 전체 keyset 비교로 처리
+    client.get(f'/api/contents/completed?source=kakao&cursor={token}')
+    assert '(title, source, content_id) > (%s, %s, %s)' in state['executed'][-1][0]
@@ -0,0 +1,237 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+
+import crawlers.http_client as http_client
+from crawlers.http_client import CrawlerHttpClient, parse_retry_after
+from crawlers.rate_limit import TokenBucket
+from crawlers.response_cache import ResponseCache
+
+
+def test_parse_retry_after_seconds_and_invalid():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("not-a-date") is None
+
+
+def test_parse_retry_after_http_date_in_past_is_zero():
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def run_with_server(handler, scenario):
+    async def main():
+        app = web.Application()
+        app.router.add_get("/data", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            return await scenario(f"http://127.0.0.1:{port}/data")
+        finally:
+            await runner.cleanup()
+
+    return asyncio.run(main())
+
+
+def test_get_json_honors_retry_after_on_429(monkeypatch):
+    limiter = TokenBucket(1000)
+    penalties = []
+    original_penalize = limiter.penalize
+
+    def record_penalize(seconds):
+        penalties.append(seconds)
+        original_penalize(seconds)
+
+    limiter.penalize = record_penalize
+    monkeypatch.setattr(http_client, "get_host_limiter", lambda host: limiter)
+
+    calls = []
+
+    async def handler(request):
+        calls.append(request.headers.get("Accept-Encoding"))
+        if len(calls) == 1:
+            return web.Response(status=429, headers={"Retry-After": "0"})
+        return web.json_response({"ok": True, "q": request.query.get("q")})
+
+    async def scenario(url):
+        async with CrawlerHttpClient(headers={"X-Test": "1"}) as client:
+            return await client.get_json(url, params={"q": "x"})
+
+    data = run_with_server(handler, scenario)
+
+    assert data == {"ok": True, "q": "x"}
+    assert len(calls) == 2
+    assert "gzip" in calls[0]
+    assert penalties == [0.0]
+
+
+def test_get_json_raises_after_max_attempts(monkeypatch):
+    monkeypatch.setattr(http_client, "get_host_limiter", lambda host: TokenBucket(1000))
+    monkeypatch.setattr(http_client, "_backoff_seconds", lambda attempt: 0)
+
+    calls = []
+
+    async def handler(request):
+        calls.append(1)
+        return web.Response(status=503)
+
+    async def scenario(url):
+        async with CrawlerHttpClient() as client:
+            try:
+                await client.get_json(url)
+            except Exception as e:
+                return e
+
+    error = run_with_server(handler, scenario)
+
+    assert getattr(error, "status", None) == 503
+    assert len(calls) == http_client.config.CRAWLER_HTTP_MAX_ATTEMPTS
+
+
+def test_conditional_request_reuses_cached_result_on_304(monkeypatch, tmp_path):
+    monkeypatch.setattr(http_client, "get_host_limiter", lambda host: TokenBucket(1000))
+    transform_calls = []
+    seen_validators = []
+
+    async def handler(request):
+        seen_validators.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.json_response({"items": [1, 2]}, headers={"ETag": '"v1"'})
+
+    def transform(data):
+        transform_calls.append(data)
+        return data["items"]
+
+    async def scenario(url):
+        cache = ResponseCache(str(tmp_path))
+        async with CrawlerHttpClient(cache=cache) as client:
+            first = await client.get_json(url, params={"page": 1}, transform=transform)
+            second = await client.get_json(url, params={"page": 1}, transform=transform)
+            return first, second, client.stats
+
+    first, second, stats = run_with_server(handler, scenario)
+
+    assert first == second == [1, 2]
+    assert seen_validators == [None, '"v1"']
+    assert len(transform_calls) == 1
+    assert stats["not_modified"] == 1
+
+
+def test_identical_body_skips_transform_without_validators(monkeypatch, tmp_path):
+    monkeypatch.setattr(http_client, "get_host_limiter", lambda host: TokenBucket(1000))
+    transform_calls = []
+
+    async def handler(request):
+        return web.json_response({"items": ["a"]})
+
+    def transform(data):
+        transform_calls.append(data)
+        return data["items"]
+
+    async def scenario(url):
+        cache = ResponseCache(str(tmp_path))
+        async with CrawlerHttpClient(cache=cache) as client:
+            await client.get_json(url, transform=transform)
+            result = await client.get_json(url, transform=transform)
+            return result, client.stats
+
+    result, stats = run_with_server(handler, scenario)
+
+    assert result == ["a"]
+    assert len(transform_calls) == 1
+    assert stats["unchanged_body"] == 1
+
+
+def test_uncached_304_retries_once_without_validators(monkeypatch, tmp_path):
+    monkeypatch.setattr(http_client, "get_host_limiter", lambda host: TokenBucket(1000))
+    # 조건 없는 재요청은 재시도 횟수와 무관하게 한 번 더 허용됨
+    monkeypatch.setattr(http_client.config, "CRAWLER_HTTP_MAX_ATTEMPTS", 1)
+    seen_validators = []
+
+    async def handler(request):
+        seen_validators.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match"):
+            return web.Response(status=304)
+        return web.json_response({"items": [3]}, headers={"ETag": '"v2"'})
+
+    async def scenario(url):
+        cache = ResponseCache(str(tmp_path))
+        # 검증자만 남고 결과가 없는 (깨진) 캐시 항목
+        cache.store(ResponseCache.make_key(url, None), {"etag": '"v1"'})
+        async with CrawlerHttpClient(cache=cache) as client:
+            return await client.get_json(url)
+
+    assert run_with_server(handler, scenario) == {"items": [3]}
+    assert seen_validators == ['"v1"', None]
+
+
+def test_uncached_304_without_validators_raises_clear_error(monkeypatch):
+    monkeypatch.setattr(http_client, "get_host_limiter", lambda host: TokenBucket(1000))
+
+    async def handler(request):
+        return web.Response(status=304)
+
+    async def scenario(url):
+        async with CrawlerHttpClient() as client:
+            with pytest.raises(http_client.UnexpectedNotModifiedError):
+                await client.get_json(url, headers={"If-None-Match": '"x"'})
+
+    run_with_server(handler, scenario)
+
+
+def test_unchanged_pages_return_cached_normalized_records(monkeypatch, tmp_path):
+    from crawlers.kakaowebtoon_crawler import KakaowebtoonCrawler
+    from crawlers.naver_webtoon_crawler import NaverWebtoonCrawler
+
+    monkeypatch.setattr(http_client, "get_host_limiter", lambda host: TokenBucket(1000))
+    monkeypatch.setenv("KAKAOWEBTOON_WEBID", "webid")
+    monkeypatch.setenv("KAKAOWEBTOON_T_ANO", "t_ano")
+    normalized = []
+
+    def counting(normalize):
+        def wrapper(*args, **kwargs):
+            normalized.append(normalize.__name__)
+            return normalize(*args, **kwargs)
+        return staticmethod(wrapper)
+
+    monkeypatch.setattr(NaverWebtoonCrawler, "_normalize_webtoon", counting(NaverWebtoonCrawler._normalize_webtoon))
+    monkeypatch.setattr(KakaowebtoonCrawler, "_normalize_card", counting(KakaowebtoonCrawler._normalize_card))
+
+    async def handler(request):
+        if request.query.get("kind") == "kakao":
+            if request.headers.get("If-None-Match") == '"k1"':
+                return web.Response(status=304)
+            card = {"id": 7, "content": {"title": "카카오", "authors": [{"name": "작가"}], "lookThroughImage": "k.png"}}
+            return web.json_response(
+                {"data": {"sections": [{"cardGroups": [{"cards": [card]}]}]}}, headers={"ETag": '"k1"'}
+            )
+        return web.json_response(
+            {"titleList": [{"titleId": 1, "titleName": "네이버", "author": "작가", "thumbnailUrl": "n.png"}],
+             "pageInfo": {"totalPages": 1}}
+        )
+
+    async def scenario(url):
+        naver, kakao = NaverWebtoonCrawler(), KakaowebtoonCrawler()
+        async with CrawlerHttpClient(cache=ResponseCache(str(tmp_path))) as client:
+            results = []
+            for _ in range(2):
+                results.append(await naver._fetch_page(client, f"{url}?kind=naver", 1))
+                results.append(await kakao._fetch_from_api(
+                    client, url, params={"kind": "kakao"}, transform=kakao._normalize_completed_page,
+                ))
+            return results, client.stats
+
+    (naver_first, kakao_first, naver_second, kakao_second), stats = run_with_server(handler, scenario)
+
+    # 두 번째 수집은 304(카카오)와 본문 해시 일치(네이버)로 정규화를 건너뜁니다.
+    assert normalized == ["_normalize_webtoon", "_normalize_card"]
+    assert stats["not_modified"] == 1 and stats["unchanged_body"] == 1
+    assert naver_second == naver_first
+    assert naver_first[0][0]["common"] == {"authors": ["작가"], "thumbnail_url": "n.png"}
+    assert kakao_second == kakao_first
+    assert kakao_first[0]["content_title"] == "카카오"
+    assert kakao_first[0]["meta"]["common"]["thumbnail_url"] == "k.png"
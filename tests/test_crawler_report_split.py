@@ -0,0 +1,61 @@
+from repositories.crawler_reports_repo import (
+    REPORT_ITEM_CDC_EVENT_INSERTED,
+    REPORT_ITEM_NEWLY_COMPLETED,
+    split_crawler_report,
+)
+
+
+def test_item_lists_move_to_detail_rows_and_counts_to_columns():
+    report = {
+        "status": "성공",
+        "duration": 12.5,
+        "new_contents": 4,
+        "newly_completed_items": [
+            ("101", "naver_webtoon", "2025-01-01T00:00:00", "override"),
+            ("102", "naver_webtoon", None, "crawler"),
+        ],
+        "cdc_info": {
+            "cdc_mode": "final_state",
+            "newly_completed_count": 2,
+            "cdc_events_inserted_count": 1,
+            "cdc_events_inserted_items": ["102"],
+            "resolved_by_counts": {"override": 1, "crawler": 1},
+        },
+        "sync_stats": {"inserted": 4, "updated": 3, "unchanged": 900},
+        "fetch_stats": {"requests": 40, "not_modified": 30},
+    }
+
+    summary, report_data, items = split_crawler_report(report)
+
+    assert summary == {
+        "duration_seconds": 12.5,
+        "new_contents": 4,
+        "newly_completed_count": 2,
+        "cdc_events_inserted_count": 1,
+        "sync_inserted": 4,
+        "sync_updated": 3,
+        "sync_unchanged": 900,
+        "fetch_requests": 40,
+        "fetch_not_modified": 30,
+    }
+    assert "newly_completed_items" not in report_data
+    assert "cdc_events_inserted_items" not in report_data["cdc_info"]
+    assert report_data["cdc_info"]["resolved_by_counts"] == {"override": 1, "crawler": 1}
+    assert items == [
+        (REPORT_ITEM_NEWLY_COMPLETED, "101", "naver_webtoon", "2025-01-01T00:00:00", "override"),
+        (REPORT_ITEM_NEWLY_COMPLETED, "102", "naver_webtoon", None, "crawler"),
+        (REPORT_ITEM_CDC_EVENT_INSERTED, "102", "naver_webtoon", None, None),
+    ]
+    # 원본 보고서는 변경하지 않습니다.
+    assert "cdc_events_inserted_items" in report["cdc_info"]
+
+
+def test_failure_report_keeps_error_and_leaves_counts_empty():
+    summary, report_data, items = split_crawler_report(
+        {"status": "실패", "error_message": "Traceback ...", "duration": 3.0}
+    )
+
+    assert summary["duration_seconds"] == 3.0
+    assert summary["newly_completed_count"] is None
+    assert report_data["error_message"] == "Traceback ..."
+    assert items == []
@@ -0,0 +1,92 @@
+import pytest
+import psycopg2.extensions
+
+import database
+from database import ConnectionPool, PoolTimeoutError
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = 0
+        self.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+        self.rolled_back = 0
+
+    def get_transaction_status(self):
+        return self.transaction_status
+
+    def rollback(self):
+        self.rolled_back += 1
+        self.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+    def close(self):
+        self.closed = 1
+
+
+def make_pool(min_size=0, max_size=2, timeout=0.05):
+    created = []
+
+    def connect():
+        conn = FakeConnection()
+        created.append(conn)
+        return conn
+
+    pool = ConnectionPool(connect, min_size=min_size, max_size=max_size, timeout=timeout, healthcheck_interval=60)
+    return pool, created
+
+
+def test_pool_reuses_returned_connection():
+    pool, created = make_pool()
+
+    conn = pool.getconn()
+    pool.putconn(conn)
+    again = pool.getconn()
+
+    assert again is conn
+    assert len(created) == 1
+    assert pool.stats()['checkouts'] == 2
+
+
+def test_pool_rolls_back_open_transaction_on_return():
+    pool, _ = make_pool()
+
+    conn = pool.getconn()
+    conn.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_INTRANS
+    pool.putconn(conn)
+
+    assert conn.rolled_back == 1
+    assert pool.stats()['idle'] == 1
+
+
+def test_pool_discards_closed_connection_on_checkout():
+    pool, created = make_pool(min_size=1)
+
+    created[0].closed = 1
+    conn = pool.getconn()
+
+    assert conn is not created[0]
+    assert pool.stats()['discarded'] == 1
+
+
+def test_pool_times_out_when_exhausted():
+    pool, _ = make_pool(max_size=1)
+
+    pool.getconn()
+    with pytest.raises(PoolTimeoutError):
+        pool.getconn()
+
+    stats = pool.stats()
+    assert stats['timeouts'] == 1
+    assert stats['in_use'] == 1
+
+
+def test_pool_is_recreated_after_fork(monkeypatch):
+    monkeypatch.setattr(database, '_create_connection', FakeConnection)
+    monkeypatch.setattr(database, '_pool', None)
+
+    parent_pool = database._get_pool()
+    monkeypatch.setattr(parent_pool, 'pid', parent_pool.pid - 1)
+
+    child_pool = database._get_pool()
+
+    assert child_pool is not parent_pool
+    assert database.get_pool_stats()['pid'] == child_pool.pid
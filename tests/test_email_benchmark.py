@@ -0,0 +1,43 @@
+from benchmarks.email_throughput import main, run_benchmark
+from benchmarks.fake_email_servers import FakeSmtpServer, wait_for
+from services.smtp_pool import SmtpConnectionPool
+
+
+def test_pool_reconnects_when_fake_server_enforces_session_cap():
+    with FakeSmtpServer(max_messages_per_session=3) as server:
+        pool = SmtpConnectionPool(
+            server.host, server.port, "u", "p", max_size=1, max_messages_per_session=100, use_tls=False
+        )
+        for i in range(7):
+            pool.sendmail("from@example.com", f"u{i}@example.com", "Subject: t\r\n\r\nbody")
+        pool.closeall()
+
+        assert wait_for(lambda: len(server.messages) == 7)
+        assert server.connections == 3
+        assert pool.stats()["reconnects"] == 2
+
+
+def test_benchmark_smtp_reuses_sessions_and_reports_metrics():
+    result = run_benchmark(provider="smtp", titles=3, subscribers=20, pool_size=2)
+
+    assert result["messages"] == 60
+    assert result["delivered"] == 60
+    assert result["connections"] <= 2
+    assert result["messages_per_second"] > 0
+    assert result["p99_ms"] >= result["p50_ms"]
+
+
+def test_benchmark_sendgrid_batches_and_counts_injected_failures():
+    result = run_benchmark(provider="sendgrid", titles=2, subscribers=30, failure_rate=1.0)
+
+    assert result["delivered"] == 0
+    assert result["injected_failures"] == 2
+
+
+def test_relative_gates_compare_against_unpooled_baseline_and_connection_cap(capsys):
+    assert main(["--provider", "smtp", "--titles", "2", "--subscribers", "10", "--min-pool-speedup", "0"]) == 0
+    assert '"pool_speedup"' in capsys.readouterr().out
+
+    assert main(["--provider", "smtp", "--titles", "2", "--subscribers", "10", "--pool-size", "1",
+                 "--max-messages-per-session", "1", "--max-connections", "5"]) == 1
+    assert "연결 20개 > 5개" in capsys.readouterr().err
@@ -0,0 +1,89 @@
+import smtplib
+
+from services.base_email_service import BaseEmailService, EmailMessage
+from services.sendgrid_service import SendGridService
+from services.smtp_service import SmtpService
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class FakeSendGridClient:
+    def __init__(self, fail_subjects=()):
+        self.requests = []
+        self.fail_subjects = set(fail_subjects)
+
+    def send(self, mail):
+        payload = mail.get()
+        self.requests.append(payload)
+        return FakeResponse(500 if payload["subject"] in self.fail_subjects else 202)
+
+
+class FakePool:
+    max_size = 3
+
+    def __init__(self):
+        self.sent = []
+
+    def sendmail(self, from_addr, to_addr, message):
+        if to_addr == "bad@example.com":
+            raise smtplib.SMTPRecipientsRefused({to_addr: (550, b"no such user")})
+        self.sent.append(to_addr)
+        return {}
+
+
+def test_sendgrid_send_many_batches_identical_content_into_personalizations(monkeypatch):
+    monkeypatch.setenv("SENDGRID_API_KEY", "key")
+    monkeypatch.setenv("EMAIL_ADDRESS", "noreply@example.com")
+    client = FakeSendGridClient(fail_subjects={"broken"})
+    service = SendGridService(client=client)
+
+    messages = [EmailMessage(f"u{i}@example.com", "same", "body") for i in range(1500)]
+    messages.insert(3, EmailMessage("x@example.com", "broken", "body"))
+
+    results = service.send_many(messages)
+
+    assert len(results) == len(messages)
+    assert [result.message for result in results] == messages
+    assert sorted(len(request["personalizations"]) for request in client.requests) == [1, 500, 1000]
+    assert all(len(p["to"]) == 1 for request in client.requests for p in request["personalizations"])
+    assert results[3].success is False and "500" in results[3].error
+    assert sum(result.success for result in results) == 1500
+
+
+def test_smtp_send_many_reports_per_message_results(monkeypatch):
+    monkeypatch.setenv("EMAIL_ADDRESS", "noreply@example.com")
+    monkeypatch.setenv("EMAIL_PASSWORD", "pw")
+    pool = FakePool()
+    service = SmtpService(pool=pool)
+
+    messages = [
+        EmailMessage("a@example.com", "s", "b"),
+        EmailMessage("bad@example.com", "s", "b"),
+        EmailMessage("c@example.com", "s", "b"),
+    ]
+    results = service.send_many(messages)
+
+    assert [result.success for result in results] == [True, False, True]
+    assert sorted(pool.sent) == ["a@example.com", "c@example.com"]
+
+
+def test_default_send_many_wraps_send_mail():
+    class OnlySendMail(BaseEmailService):
+        def send_mail(self, to_email, subject, body):
+            if to_email == "boom@example.com":
+                raise RuntimeError("boom")
+            return to_email != "false@example.com"
+
+    results = OnlySendMail().send_many(
+        [EmailMessage(to, "s", "b") for to in ("ok@example.com", "false@example.com", "boom@example.com")],
+        max_workers=2,
+    )
+
+    assert [(result.success, result.error) for result in results] == [
+        (True, None),
+        (False, "send_mail returned False"),
+        (False, "boom"),
+    ]
@@ -89,3 +89,43 @@ def test_row_like_override_is_supported():
     assert result["final_status"] == "연재중"
     assert result["resolved_by"] == "crawler"
     assert result["final_completed_at"] is None
+
+
+def test_batch_transitions_match_scalar_resolver():
+    import itertools
+
+    from services.final_state_resolver import resolve_completion_transitions
+
+    now = datetime(2025, 12, 17, 12, 0, 0)
+    statuses = [None, "연재중", "휴재", "완결"]
+    overrides = [
+        None,
+        ("휴재", None),
+        ("완결", None),
+        ("완결", datetime(2025, 12, 1, 0, 0, 0)),
+        ("완결", datetime(2025, 12, 30, 0, 0, 0)),
+    ]
+
+    content_ids, previous, current, override_statuses, override_completed_ats = [], [], [], [], []
+    expected = []
+    for index, (prev, cur, override) in enumerate(itertools.product(statuses, statuses, overrides)):
+        override_row = (
+            {"override_status": override[0], "override_completed_at": override[1]} if override else None
+        )
+        before = resolve_final_state(prev, override_row, now=now)
+        after = resolve_final_state(cur if cur is not None else before["final_status"], override_row, now=now)
+        if before["final_status"] != "완결" and after["final_status"] == "완결":
+            expected.append((index, after["final_completed_at"], after["resolved_by"]))
+
+        content_ids.append(index)
+        previous.append(prev)
+        current.append(cur)
+        override_statuses.append(override[0] if override else None)
+        override_completed_ats.append(override[1] if override else None)
+
+    result = resolve_completion_transitions(
+        content_ids, previous, current, override_statuses, override_completed_ats, now=now
+    )
+
+    assert result == expected
+    assert expected
@@ -0,0 +1,107 @@
+import asyncio
+
+from crawlers.naver_webtoon_crawler import NaverWebtoonCrawler
+
+
+class FakePagedCrawler(NaverWebtoonCrawler):
+    def __init__(self, filled_pages, total_pages=None, failing_page=None):
+        super().__init__()
+        self.filled_pages = filled_pages
+        self.total_pages = total_pages
+        self.failing_page = failing_page
+        self.requested_pages = []
+
+    async def _fetch_page(self, session, base_url, page):
+        self.requested_pages.append(page)
+        await asyncio.sleep(0)
+        if page == self.failing_page:
+            raise RuntimeError("boom")
+        if page > self.filled_pages:
+            return [], self.total_pages
+        return [{'titleId': page * 100 + i} for i in range(3)], self.total_pages
+
+
+def run(crawler, max_pages=150):
+    return asyncio.run(crawler._fetch_paginated_data(None, "https://example.com?x=1", max_pages, "test"))
+
+
+def test_known_total_pages_fetches_exactly_those_pages():
+    crawler = FakePagedCrawler(filled_pages=7, total_pages=7)
+
+    candidates = run(crawler)
+
+    assert len(candidates) == 21
+    assert sorted(crawler.requested_pages) == list(range(1, 8))
+
+
+def test_speculative_probe_stops_at_first_empty_page():
+    crawler = FakePagedCrawler(filled_pages=6)
+
+    candidates = run(crawler)
+
+    assert len(candidates) == 18
+    assert max(crawler.requested_pages) < 6 + 2 * crawler.fetch_concurrency
+
+
+def test_pages_after_a_failed_page_are_discarded():
+    crawler = FakePagedCrawler(filled_pages=10, failing_page=3)
+
+    candidates = run(crawler)
+
+    assert set(candidates) == {100, 101, 102, 200, 201, 202}
+
+
+def test_max_pages_is_respected():
+    crawler = FakePagedCrawler(filled_pages=500)
+
+    candidates = run(crawler, max_pages=12)
+
+    assert max(crawler.requested_pages) == 12
+    assert len(candidates) == 36
+
+
+def test_incremental_mode_stops_after_fully_known_completed_page():
+    crawler = FakePagedCrawler(filled_pages=50, total_pages=50)
+    crawler.crawl_mode = "incremental"
+    crawler.known_completed_ids = {str(200 + i) for i in range(3)}
+
+    candidates = asyncio.run(
+        crawler._fetch_paginated_data(None, "https://example.com?x=1", 150, "test", list_name="finished")
+    )
+
+    assert set(candidates) == {100, 101, 102, 200, 201, 202}
+    assert max(crawler.requested_pages) < 50
+    assert crawler.high_water_mark["finished"] == ["100", "101", "102"]
+
+
+def test_incremental_mode_keeps_going_until_previous_high_water_mark():
+    crawler = FakePagedCrawler(filled_pages=10)
+    crawler.crawl_mode = "incremental"
+    crawler.known_completed_ids = {str(page * 100 + i) for page in range(2, 11) for i in range(3)}
+    crawler.previous_high_water_mark = {"finished": ["400"]}
+
+    candidates = asyncio.run(
+        crawler._fetch_paginated_data(None, "https://example.com?x=1", 150, "test", list_name="finished")
+    )
+
+    assert max(candidates) == 402
+
+
+def test_plan_crawl_forces_full_sweep_when_interval_elapsed(monkeypatch):
+    from datetime import datetime, timedelta
+
+    now = datetime(2025, 1, 10, 0, 0, 0)
+    monkeypatch.setattr("config.CRAWL_MODE", "incremental")
+    monkeypatch.setattr("config.CRAWLER_FULL_SWEEP_INTERVAL_HOURS", 24)
+    state = {"last_full_sweep_at": (now - timedelta(hours=2)).isoformat()}
+    monkeypatch.setattr("crawlers.base_crawler.load_crawler_state", lambda conn, source: state)
+
+    crawler = NaverWebtoonCrawler()
+    crawler._plan_crawl(None, {"1": "완결", "2": "연재중"}, now)
+    assert crawler.crawl_mode == "incremental"
+    assert crawler.known_completed_ids == {"1"}
+
+    state["last_full_sweep_at"] = (now - timedelta(hours=30)).isoformat()
+    crawler._plan_crawl(None, {}, now)
+    assert crawler.crawl_mode == "full"
+    assert crawler._next_crawl_state(now)["last_full_sweep_at"] == now.isoformat()
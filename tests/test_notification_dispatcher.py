@@ -0,0 +1,116 @@
+import threading
+import time
+
+import notification_dispatcher as dispatcher_module
+from notification_dispatcher import NotificationDispatcher, retry_delay_seconds
+from services.base_email_service import BaseEmailService
+
+
+class FakeConn:
+    def __init__(self):
+        self.commits = 0
+        self.rollbacks = 0
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+class RecordingEmailService(BaseEmailService):
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.sent = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def send_mail(self, to_email, subject, body):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(0.01)
+            if to_email in self.failing:
+                raise RuntimeError("smtp down")
+            with self._lock:
+                self.sent.append(to_email)
+            return True
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def test_retry_delay_is_exponential_and_capped():
+    assert retry_delay_seconds(1, max_attempts=5, base=60, cap=600) == 60
+    assert retry_delay_seconds(2, max_attempts=5, base=60, cap=600) == 120
+    assert retry_delay_seconds(4, max_attempts=5, base=60, cap=600) == 480
+    assert retry_delay_seconds(4, max_attempts=5, base=60, cap=300) == 300
+    assert retry_delay_seconds(5, max_attempts=5, base=60, cap=600) is None
+
+
+def test_dispatch_once_sends_with_bounded_concurrency_and_records_results(monkeypatch):
+    claimed = [
+        {"id": i, "email": f"u{i}@example.com", "subject": "s", "body": "b", "attempts": 1}
+        for i in range(1, 11)
+    ]
+    claimed[-1]["attempts"] = 5  # 마지막 시도
+    recorded = {}
+
+    monkeypatch.setattr(dispatcher_module, "claim_outbox_batch", lambda conn, limit, lease: claimed)
+    monkeypatch.setattr(dispatcher_module, "mark_outbox_sent", lambda conn, claims: recorded.setdefault("sent", list(claims)))
+    monkeypatch.setattr(dispatcher_module, "mark_outbox_failed", lambda conn, failures: recorded.setdefault("failed", list(failures)))
+    monkeypatch.setattr(dispatcher_module.config, "NOTIFICATION_MAX_ATTEMPTS", 5)
+    monkeypatch.setattr(dispatcher_module.config, "NOTIFICATION_RETRY_BASE_SECONDS", 60)
+
+    service = RecordingEmailService(failing={"u3@example.com", "u10@example.com"})
+    conn = FakeConn()
+    stats = NotificationDispatcher(conn, service, batch_size=10, concurrency=3, lease_seconds=60).dispatch_once()
+
+    assert stats == {"claimed": 10, "sent": 8, "retried": 1, "failed": 1}
+    assert service.max_active <= 3
+    assert sorted(outbox_id for outbox_id, _ in recorded["sent"]) == [1, 2, 4, 5, 6, 7, 8, 9]
+    failures = {row[0]: row for row in recorded["failed"]}
+    assert failures[3][1:] == (1, "smtp down", 60)
+    assert failures[10][1:] == (5, "smtp down", None)
+    assert conn.commits == 1
+
+
+def test_enqueue_groups_each_users_events_into_one_digest(monkeypatch):
+    events = [
+        {"id": 1, "content_id": "A", "source": "SRC", "final_completed_at": None, "resolved_by": "crawler", "title": "제목"},
+        {"id": 2, "content_id": "B", "source": "SRC", "final_completed_at": None, "resolved_by": "override", "title": None},
+        {"id": 3, "content_id": "C", "source": "SRC", "final_completed_at": None, "resolved_by": "crawler", "title": "구독자 없음"},
+    ]
+    subscribers = [
+        ("A", "SRC", 10, "u10@example.com"),
+        ("B", "SRC", 10, "u10@example.com"),
+        ("B", "SRC", 11, "u11@example.com"),
+    ]
+    captured = {}
+
+    def fake_enqueue(conn, event_ids, messages):
+        captured["event_ids"] = list(event_ids)
+        captured["messages"] = list(messages)
+        return len(captured["messages"])
+
+    monkeypatch.setattr(dispatcher_module, "fetch_unenqueued_events", lambda conn, limit: events)
+    monkeypatch.setattr(
+        "services.notification_service.iter_subscribers_for_contents",
+        lambda conn, keys: iter(subscribers),
+    )
+    monkeypatch.setattr(dispatcher_module, "enqueue_digest_messages", fake_enqueue)
+
+    conn = FakeConn()
+    result = NotificationDispatcher(conn, RecordingEmailService()).enqueue_pending_events()
+
+    assert result == {"events": 3, "messages": 2}
+    assert captured["event_ids"] == [1, 2, 3]
+    by_user = {message[1]: message for message in captured["messages"]}
+    assert by_user[10][0] == [1, 2]
+    assert "2개" in by_user[10][3]
+    assert "'제목'" in by_user[10][4] and "'ID B'" in by_user[10][4]
+    assert by_user[11][0] == [2]
+    assert "'ID B'" in by_user[11][3]
+    assert conn.commits == 1
@@ -0,0 +1,57 @@
+from datetime import datetime
+
+import services.notification_service as notification_service
+from services.notification_service import build_digest_message, plan_completion_digests
+
+
+def test_plan_groups_subscriber_rows_into_one_digest_per_user(monkeypatch):
+    requested = []
+
+    def fake_iter_subscribers(conn, content_keys):
+        requested.extend(content_keys)
+        # 저장소는 user_id 순으로 정렬된 행을 스트리밍합니다.
+        yield from [
+            ("101", "naver_webtoon", 1, "a@example.com"),
+            ("202", "naver_webtoon", 1, "a@example.com"),
+            ("101", "naver_webtoon", 2, "b@example.com"),
+            ("303", "kakao_webtoon", 3, "c@example.com"),
+        ]
+
+    monkeypatch.setattr(notification_service, "iter_subscribers_for_contents", fake_iter_subscribers)
+
+    completed_at = datetime(2025, 1, 1)
+    items = [
+        (101, "naver_webtoon", None, "crawler"),
+        ("202", "naver_webtoon", completed_at, "override"),
+        ("303", "kakao_webtoon", None, "crawler"),
+    ]
+    all_content_today = {101: {"titleName": "첫번째"}, "202": {"title": "두번째"}}
+
+    digests = list(plan_completion_digests(None, items, all_content_today))
+
+    assert requested == [("101", "naver_webtoon"), ("202", "naver_webtoon"), ("303", "kakao_webtoon")]
+    assert [(d["user_id"], d["email"]) for d in digests] == [
+        (1, "a@example.com"),
+        (2, "b@example.com"),
+        (3, "c@example.com"),
+    ]
+    assert [item["title"] for item in digests[0]["items"]] == ["첫번째", "두번째"]
+    assert digests[0]["items"][1]["final_completed_at"] == completed_at
+    assert digests[2]["items"][0]["title"] == "ID 303"
+
+
+def test_digest_message_lists_every_title():
+    single_subject, _ = build_digest_message(
+        [{"title": "A", "final_completed_at": None, "resolved_by": "crawler"}]
+    )
+    assert single_subject == "콘텐츠 완결 알림: 'A'가 완결되었습니다!"
+
+    subject, body = build_digest_message(
+        [
+            {"title": "A", "final_completed_at": None, "resolved_by": "crawler"},
+            {"title": "B", "final_completed_at": datetime(2025, 1, 1), "resolved_by": "override"},
+        ]
+    )
+    assert "2개" in subject
+    assert "- 'A'" in body
+    assert "- 'B' (완결 시점: 2025-01-01 00:00:00)" in body
@@ -0,0 +1,171 @@
+import gzip
+import json
+
+import pytest
+
+from app import app as flask_app
+from services import contents_cache, ongoing_contents_service
+from services.contents_cache import ContentsResponseCache
+from services.ongoing_contents_service import (
+    WEEKDAY_KEYS,
+    build_ongoing_body,
+    materialize_ongoing_snapshots,
+    serialize_body,
+)
+
+
+ROWS = [
+    {'content_id': '1', 'title': 'A', 'status': '연재중', 'source': 'naver_webtoon',
+     'meta': {'attributes': {'weekdays': ['mon', 'thu']}}},
+    {'content_id': '2', 'title': 'B', 'status': '휴재', 'source': 'naver_webtoon', 'meta': None},
+]
+
+
+class FakeCursor:
+    def __init__(self, executed):
+        self.executed = executed
+        self.rows = []
+
+    def execute(self, query, params=None):
+        self.executed.append((query, params))
+        if 'DISTINCT content_type' in query:
+            self.rows = [{'content_type': 'webtoon'}]
+        else:
+            self.rows = [dict(row) for row in ROWS]
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def executed(monkeypatch):
+    executed = []
+    monkeypatch.setattr(ongoing_contents_service, 'get_cursor', lambda conn: FakeCursor(executed))
+    return executed
+
+
+def test_materialize_writes_all_and_per_weekday_snapshots(monkeypatch, executed):
+    written = []
+    monkeypatch.setattr(
+        ongoing_contents_service, 'load_content_data_versions',
+        lambda conn: {'naver_webtoon': 3, 'kakao_webtoon': 2},
+    )
+    monkeypatch.setattr(
+        ongoing_contents_service, 'upsert_snapshots',
+        lambda conn, rows: written.extend(rows) or len(rows),
+    )
+
+    # 2 scopes (source, all) x 2 projections (full, card) x (all + weekdays)
+    assert materialize_ongoing_snapshots(object(), 'naver_webtoon') == 2 * 2 * (1 + len(WEEKDAY_KEYS))
+
+    by_key = {(row[1], row[2], row[3]): row for row in written}
+    _, _, _, _, generation, rank, item_count, body, body_gzip, _ = by_key[('naver_webtoon', 'mon', 'full')]
+    assert (generation, rank, item_count) == ('3', 3, 1)
+    assert json.loads(body)[0]['title'] == 'A'
+    assert gzip.decompress(body_gzip) == body
+
+    all_row = by_key[('all', 'all', 'full')]
+    assert all_row[4] == 'kakao_webtoon:2,naver_webtoon:3'
+    assert all_row[5] == 5
+    assert set(json.loads(all_row[7])) == set(WEEKDAY_KEYS)
+
+    card_queries = [query for query, _ in executed if 'jsonb_build_object' in query]
+    assert len(card_queries) == 2
+    assert ('naver_webtoon', 'mon', 'card') in by_key
+
+
+def test_build_uses_snapshot_only_when_generation_matches(monkeypatch, executed):
+    monkeypatch.setattr(
+        ongoing_contents_service, 'fetch_snapshot_body',
+        lambda conn, content_type, source, weekday, projection, encoding: ('7', b'snapshot-bytes'),
+    )
+
+    assert build_ongoing_body(object(), 'webtoon', 'naver_webtoon', 'mon', 'full', None, 'gzip', '7') == b'snapshot-bytes'
+    assert executed == []
+
+    stale = build_ongoing_body(object(), 'webtoon', 'naver_webtoon', 'mon', 'full', None, 'gzip', '8')
+    assert json.loads(gzip.decompress(stale))[0]['title'] == 'A'
+    assert len(executed) == 1
+
+    # 스냅샷 대상이 아닌 fields= 투영은 항상 DB에서 생성
+    build_ongoing_body(object(), 'webtoon', 'naver_webtoon', 'mon', 'fields:content_id,source,title', ('content_id', 'source', 'title'), 'gzip', '7')
+    assert len(executed) == 2
+
+
+def test_ongoing_endpoint_streams_snapshot_with_content_encoding(monkeypatch):
+    body = serialize_body([{'title': 'A'}])
+    requested = []
+
+    def fake_fetch(conn, content_type, source, weekday, projection, encoding):
+        requested.append((content_type, source, weekday, projection, encoding))
+        return '4', gzip.compress(body, mtime=0) if encoding == 'gzip' else body
+
+    monkeypatch.setattr(ongoing_contents_service, 'fetch_snapshot_body', fake_fetch)
+    monkeypatch.setattr(ongoing_contents_service, 'load_ongoing_contents', lambda *args: pytest.fail('DB scan'))
+    monkeypatch.setattr(contents_cache, 'load_content_data_versions', lambda conn: {'naver_webtoon': 4})
+    monkeypatch.setattr('views.contents.get_db', lambda: object())
+    monkeypatch.setattr('views.contents.supported_encodings', lambda: ('gzip',))
+    contents_cache.reset_contents_cache(ContentsResponseCache(version_ttl=0))
+
+    flask_app.config['TESTING'] = True
+    client = flask_app.test_client()
+    try:
+        compressed = client.get(
+            '/api/contents/ongoing?type=webtoon&source=naver_webtoon&day=mon',
+            headers={'Accept-Encoding': 'gzip, deflate'},
+        )
+        plain = client.get(
+            '/api/contents/ongoing?type=webtoon&source=naver_webtoon&day=mon&view=card',
+            headers={'Accept-Encoding': 'identity'},
+        )
+        invalid = client.get('/api/contents/ongoing?day=someday')
+    finally:
+        contents_cache.reset_contents_cache()
+
+    assert compressed.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in compressed.headers['Vary']
+    assert gzip.decompress(compressed.data) == body
+    assert 'Content-Encoding' not in plain.headers
+    assert plain.data == body
+    assert requested == [
+        ('webtoon', 'naver_webtoon', 'mon', 'full', 'gzip'),
+        ('webtoon', 'naver_webtoon', 'mon', 'card', 'identity'),
+    ]
+    assert invalid.status_code == 400
+
+
+def test_brotli_snapshots_and_negotiation(monkeypatch, executed):
+    brotli = pytest.importorskip('brotli')
+    written = []
+    monkeypatch.setattr(ongoing_contents_service, 'load_content_data_versions', lambda conn: {'naver_webtoon': 3})
+    monkeypatch.setattr(
+        ongoing_contents_service, 'upsert_snapshots',
+        lambda conn, rows: written.extend(rows) or len(rows),
+    )
+
+    assert 'br' in ongoing_contents_service.supported_encodings()
+    materialize_ongoing_snapshots(object(), 'naver_webtoon')
+    by_key = {(row[1], row[2], row[3]): row for row in written}
+    body, body_br = by_key[('naver_webtoon', 'mon', 'full')][7], by_key[('naver_webtoon', 'mon', 'full')][9]
+    assert brotli.decompress(body_br) == body
+
+    # 스냅샷이 없으면 br 응답도 요청 시 DB에서 만들어 압축합니다.
+    monkeypatch.setattr(ongoing_contents_service, 'fetch_snapshot_body', lambda *args: None)
+    monkeypatch.setattr(contents_cache, 'load_content_data_versions', lambda conn: {'naver_webtoon': 3})
+    monkeypatch.setattr('views.contents.get_db', lambda: object())
+    contents_cache.reset_contents_cache(ContentsResponseCache(version_ttl=0))
+
+    flask_app.config['TESTING'] = True
+    try:
+        response = flask_app.test_client().get(
+            '/api/contents/ongoing?type=webtoon&source=naver_webtoon&day=mon',
+            headers={'Accept-Encoding': 'gzip, br'},
+        )
+    finally:
+        contents_cache.reset_contents_cache()
+
+    assert response.headers['Content-Encoding'] == 'br'
+    assert json.loads(brotli.decompress(response.data))[0]['title'] == 'A'
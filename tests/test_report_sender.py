@@ -0,0 +1,109 @@
+import pytest
+
+import report_sender
+
+
+class FakeConn:
+    def __init__(self):
+        self.commits = 0
+        self.closed = False
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class FakeEmailService:
+    def __init__(self, succeed=True):
+        self.succeed = succeed
+        self.sent = []
+
+    def send_mail(self, to_email, subject, body):
+        self.sent.append((to_email, subject, body))
+        return self.succeed
+
+
+def _install(monkeypatch, rows, email_service):
+    state = {"claimed_with": None, "deleted": None, "released": None}
+
+    def fake_claim(conn, token, stale):
+        state["claimed_with"] = token
+        return len(rows)
+
+    def fake_iter(conn, token):
+        assert token == state["claimed_with"]
+        yield from rows
+
+    monkeypatch.setenv("ADMIN_EMAIL", "admin@example.com")
+    monkeypatch.setattr(report_sender, "get_email_service", lambda: email_service)
+    monkeypatch.setattr(report_sender, "create_standalone_connection", FakeConn)
+    monkeypatch.setattr(report_sender, "claim_reports", fake_claim)
+    monkeypatch.setattr(report_sender, "iter_claimed_reports", fake_iter)
+    monkeypatch.setattr(report_sender, "delete_claimed_reports", lambda conn, token: state.update(deleted=token) or len(rows))
+    monkeypatch.setattr(report_sender, "release_claimed_reports", lambda conn, token: state.update(released=token))
+    return state
+
+
+ROWS = [
+    {
+        "crawler_name": "Naver Webtoon",
+        "status": "성공",
+        "duration_seconds": 1.5,
+        "new_contents": 3,
+        "newly_completed_count": 2,
+        "cdc_events_inserted_count": 2,
+        "cdc_info": {"cdc_mode": "final_state"},
+        "error_message": None,
+    },
+    {
+        "crawler_name": "Kakao Webtoon",
+        "status": "실패",
+        "duration_seconds": 0.2,
+        "new_contents": None,
+        "newly_completed_count": None,
+        "cdc_events_inserted_count": None,
+        "cdc_info": None,
+        "error_message": "timeout",
+    },
+]
+
+
+def test_sends_streamed_reports_and_deletes_only_claimed_rows(monkeypatch):
+    email_service = FakeEmailService()
+    state = _install(monkeypatch, ROWS, email_service)
+
+    report_sender.send_consolidated_report()
+
+    (to_email, subject, body), = email_service.sent
+    assert to_email == "admin@example.com"
+    assert subject.startswith("❌ [실패]")
+    assert "총 2개의 작업 결과" in body
+    assert "신규 완결: 2건" in body
+    assert "오류: timeout" in body
+    assert state["deleted"] == state["claimed_with"]
+    assert state["released"] is None
+
+
+def test_send_failure_releases_claim_and_keeps_rows(monkeypatch):
+    state = _install(monkeypatch, ROWS, FakeEmailService(succeed=False))
+
+    with pytest.raises(SystemExit):
+        report_sender.send_consolidated_report()
+
+    assert state["deleted"] is None
+    assert state["released"] == state["claimed_with"]
+
+
+def test_nothing_to_send_skips_email(monkeypatch):
+    email_service = FakeEmailService()
+    state = _install(monkeypatch, [], email_service)
+
+    report_sender.send_consolidated_report()
+
+    assert email_service.sent == []
+    assert state["released"] is None
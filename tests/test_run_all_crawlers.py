@@ -0,0 +1,69 @@
+import os
+import time
+
+import run_all_crawlers
+
+
+class QuickCrawler:
+    pass
+
+
+class HangingCrawler:
+    source_name = "hanging_crawler"
+
+    def __init__(self):
+        # 제한 시간 처리 경로는 이름을 얻으려고 크롤러를 생성하면 안 됩니다.
+        raise AssertionError("crawler should not be instantiated by the parent process")
+
+
+class CrashingCrawler:
+    source_name = "crashing_crawler"
+
+
+class CrashAfterReportCrawler:
+    pass
+
+
+def fake_target(crawler_class, report_saved):
+    if crawler_class.__name__ == "HangingCrawler":
+        time.sleep(60)
+    elif crawler_class.__name__ == "CrashingCrawler":
+        os._exit(1)
+    elif crawler_class.__name__ == "CrashAfterReportCrawler":
+        report_saved.set()
+        os._exit(1)
+
+
+def test_hung_crawler_is_killed_without_affecting_others(monkeypatch):
+    saved_reports = []
+    monkeypatch.setattr(
+        run_all_crawlers, "_save_report", lambda name, report: saved_reports.append((name, report))
+    )
+
+    started = time.monotonic()
+    run_all_crawlers.run_all_in_processes(
+        [QuickCrawler, HangingCrawler], max_workers=2, timeout=3, target=fake_target
+    )
+
+    assert time.monotonic() - started < 30
+    assert len(saved_reports) == 1
+    name, report = saved_reports[0]
+    assert name == "Hanging Crawler"
+    assert report["status"] == "실패"
+
+
+def test_crashed_crawler_gets_failure_report_unless_it_saved_one(monkeypatch):
+    saved_reports = []
+    monkeypatch.setattr(
+        run_all_crawlers, "_save_report", lambda name, report: saved_reports.append((name, report))
+    )
+
+    run_all_crawlers.run_all_in_processes(
+        [QuickCrawler, CrashingCrawler, CrashAfterReportCrawler], max_workers=3, timeout=30, target=fake_target
+    )
+
+    assert len(saved_reports) == 1
+    name, report = saved_reports[0]
+    assert name == "Crashing Crawler"
+    assert report["status"] == "실패"
+    assert "exitcode=1" in report["error_message"]
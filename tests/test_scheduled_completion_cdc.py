@@ -1,6 +1,8 @@
 import asyncio
 from datetime import datetime, timedelta
 
+import pytest
+
 from crawlers.base_crawler import ContentCrawler
 
 
@@ -29,22 +31,23 @@ class FakeCursor:
                 for (cid, src), row in self.db.overrides.items()
                 if src == source
             ]
-        elif "override_completed_at <=" in query:
+        elif "override_completed_at <=" in query and "INSERT INTO cdc_events" in query:
             now = params[1]
-            self.last_result = [
-                {
-                    "content_id": cid,
-                    "source": src,
-                    "override_completed_at": row.get("override_completed_at"),
-                }
+            due = [
+                (cid, src)
                 for (cid, src), row in self.db.overrides.items()
                 if row.get("override_status") == "완결"
+                and row.get("completion_recorded_at") is None
                 and row.get("override_completed_at") is not None
                 and row.get("override_completed_at") <= now
+                and (cid, src) in self.db.contents
             ]
-        elif "SELECT 1 FROM contents WHERE content_id" in query:
-            key = (params[0], params[1])
-            self.last_result = [(1,)] if key in self.db.contents else []
+            pending = [key for key in due if key not in self.db.cdc_events]
+            self.db.cdc_events.update(pending)
+            for key in due:
+                self.db.overrides[key]["completion_recorded_at"] = params[-1]
+            self.db.scanned_overrides.append(len(due))
+            self.last_result = [{"due_count": len(pending), "inserted_count": len(pending)}]
         else:
             raise NotImplementedError(query)
 
@@ -64,6 +67,8 @@ class FakeDB:
     def __init__(self, contents, overrides=None):
         self.contents = contents
         self.overrides = overrides or {}
+        self.cdc_events = set()
+        self.scanned_overrides = []
         self.committed = False
         self.rolled_back = False
 
@@ -74,6 +79,18 @@ class FakeDB:
         self.rolled_back = True
 
 
+@pytest.fixture(autouse=True)
+def record_version_bumps(monkeypatch):
+    bumps = []
+    monkeypatch.setattr(
+        "crawlers.base_crawler.bump_content_data_version",
+        lambda conn, source: bumps.append(source) or len(bumps),
+    )
+    monkeypatch.setattr("crawlers.base_crawler.materialize_ongoing_snapshots", lambda conn, source: 0)
+    monkeypatch.setattr("crawlers.base_crawler.refresh_content_status_counts", lambda conn, source: None)
+    return bumps
+
+
 class DummyCrawler(ContentCrawler):
     async def fetch_all_data(self):
         return set(), set(), set(), {}
@@ -82,7 +99,7 @@ class DummyCrawler(ContentCrawler):
         return 0
 
 
-def test_scheduled_completion_event_is_recorded(monkeypatch):
+def test_scheduled_completion_event_is_recorded(monkeypatch, record_version_bumps):
     now = datetime(2025, 1, 2, 0, 0, 0)
     completed_at = now - timedelta(days=1)
 
@@ -93,25 +110,24 @@ def test_scheduled_completion_event_is_recorded(monkeypatch):
         },
     )
 
-    inserted_events = set()
+    inserted_events = db.cdc_events
 
     monkeypatch.setattr("crawlers.base_crawler.get_cursor", lambda conn: FakeCursor(conn))
     monkeypatch.setattr("utils.time.now_kst_naive", lambda: now)
 
-    def fake_record_content_completed_event(conn, *, content_id, source, final_completed_at, resolved_by):
-        key = (content_id, source)
-        if key in inserted_events:
-            return False
-        inserted_events.add(key)
-        return True
+    def fake_record_content_completed_events(conn, items):
+        newly_inserted = set()
+        for content_id, source, _final_completed_at, _resolved_by in items:
+            key = (content_id, source)
+            if key in inserted_events:
+                continue
+            inserted_events.add(key)
+            newly_inserted.add(key)
+        return newly_inserted
 
     monkeypatch.setattr(
-        "services.cdc_event_service.record_content_completed_event",
-        fake_record_content_completed_event,
-    )
-    monkeypatch.setattr(
-        "crawlers.base_crawler.record_content_completed_event",
-        fake_record_content_completed_event,
+        "crawlers.base_crawler.record_content_completed_events",
+        fake_record_content_completed_events,
     )
 
     crawler = DummyCrawler("SRC")
@@ -122,9 +138,67 @@ def test_scheduled_completion_event_is_recorded(monkeypatch):
     assert cdc_info["cdc_events_inserted_count"] == 1
     assert cdc_info["scheduled_completion_events_inserted_count"] == 1
     assert inserted_events == {("CID", "SRC")}
+    assert record_version_bumps == ["SRC"]
 
     # Re-run to confirm idempotency (no duplicate events)
     _, _, cdc_info_second = asyncio.run(crawler.run_daily_check(db))
     assert cdc_info_second["cdc_events_inserted_count"] == 0
+    assert cdc_info_second["scheduled_completion_due_count"] == 0
     assert cdc_info_second["scheduled_completion_events_inserted_count"] == 0
     assert inserted_events == {("CID", "SRC")}
+    # 처리된 예약은 표시되어 다음 스캔 대상에서 빠집니다.
+    assert db.scanned_overrides == [1, 0]
+    assert db.overrides[("CID", "SRC")]["completion_recorded_at"] is not None
+
+
+class FinishingCrawler(ContentCrawler):
+    async def fetch_all_data(self):
+        finished = {101: {"title": "A"}}
+        ongoing = {102: {"title": "B"}}
+        return ongoing, {}, finished, {**ongoing, **finished}
+
+    def synchronize_database(self, conn, all_content_today, ongoing_today, hiatus_today, finished_today):
+        return 0
+
+
+def test_crawler_completion_is_detected_with_normalized_ids(monkeypatch):
+    db = FakeDB(contents={("101", "SRC"): "연재중", ("102", "SRC"): "연재중", ("103", "SRC"): "완결"})
+    recorded = []
+
+    monkeypatch.setattr("crawlers.base_crawler.get_cursor", lambda conn: FakeCursor(conn))
+
+    def fake_record_content_completed_events(conn, items):
+        recorded.extend(items)
+        return {(content_id, source) for content_id, source, _, _ in items}
+
+    monkeypatch.setattr(
+        "crawlers.base_crawler.record_content_completed_events",
+        fake_record_content_completed_events,
+    )
+
+    _, newly_completed_items, cdc_info = asyncio.run(FinishingCrawler("SRC").run_daily_check(db))
+
+    assert newly_completed_items == [("101", "SRC", None, "crawler")]
+    assert recorded == [("101", "SRC", None, "crawler")]
+    assert cdc_info["resolved_by_counts"] == {"crawler": 1}
+    assert db.committed is True
+
+
+def test_scheduled_completions_are_skipped_in_ticker_mode(monkeypatch):
+    now = datetime(2025, 1, 2, 0, 0, 0)
+    db = FakeDB(
+        contents={("CID", "SRC"): "연재중"},
+        overrides={
+            ("CID", "SRC"): {"override_status": "완결", "override_completed_at": now - timedelta(days=1)}
+        },
+    )
+
+    monkeypatch.setattr("crawlers.base_crawler.get_cursor", lambda conn: FakeCursor(conn))
+    monkeypatch.setattr("crawlers.base_crawler.config.SCHEDULED_COMPLETION_MODE", "ticker")
+    monkeypatch.setattr("utils.time.now_kst_naive", lambda: now)
+
+    _, _, cdc_info = asyncio.run(DummyCrawler("SRC").run_daily_check(db))
+
+    assert cdc_info["scheduled_completion_mode"] == "ticker"
+    assert "scheduled_completion_events_inserted_count" not in cdc_info
+    assert db.cdc_events == set()
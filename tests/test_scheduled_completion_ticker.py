@@ -0,0 +1,114 @@
+from datetime import datetime, timedelta
+
+import scheduled_completion_ticker as ticker_module
+from scheduled_completion_ticker import ScheduledCompletionTicker
+
+
+class FakeCursor:
+    def __init__(self, db):
+        self.db = db
+        self.last_result = []
+
+    def execute(self, query, params=None):
+        if "override_completed_at >" in query:
+            _, now = params
+            self.last_result = [
+                {"content_id": cid, "source": src, "override_completed_at": at}
+                for (cid, src), (status, at) in self.db.overrides.items()
+                if status == "완결" and at is not None and at > now
+            ]
+        elif "WHERE content_id = %s" in query:
+            content_id, source, _ = params
+            status, at = self.db.overrides.get((content_id, source), (None, None))
+            self.last_result = [{"override_completed_at": at}] if status == "완결" else []
+        else:
+            raise NotImplementedError(query)
+
+    def fetchall(self):
+        return self.last_result
+
+    def fetchone(self):
+        return self.last_result[0] if self.last_result else None
+
+    def close(self):
+        pass
+
+
+class FakeDB:
+    def __init__(self, overrides):
+        self.overrides = overrides
+        self.commits = 0
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+
+def _make_ticker(monkeypatch, db, clock):
+    fired = []
+
+    def fake_record_due(conn, cursor, now):
+        due = sorted(
+            key
+            for key, (status, at) in db.overrides.items()
+            if status == "완결" and at is not None and at <= now and key not in fired
+        )
+        fired.extend(due)
+        return {"due_count": len(due), "inserted_count": len(due)}
+
+    monkeypatch.setattr(ticker_module, "get_cursor", lambda conn: FakeCursor(conn))
+    monkeypatch.setattr(ticker_module, "record_due_scheduled_completions", fake_record_due)
+    return ScheduledCompletionTicker(db, now_fn=lambda: clock[0]), fired
+
+
+def test_ticker_fires_in_due_order_and_sleeps_until_next(monkeypatch):
+    now = datetime(2025, 1, 1, 0, 0, 0)
+    clock = [now]
+    db = FakeDB({
+        ("A", "SRC"): ("완결", now + timedelta(minutes=10)),
+        ("B", "SRC"): ("완결", now + timedelta(minutes=5)),
+        ("C", "SRC"): ("휴재", None),
+    })
+    ticker, fired = _make_ticker(monkeypatch, db, clock)
+
+    assert ticker.reload() == 2
+    assert ticker.seconds_until_next(3600) == 300
+    assert ticker.fire_due() == 0
+
+    clock[0] = now + timedelta(minutes=5)
+    assert ticker.fire_due() == 1
+    assert fired == [("B", "SRC")]
+    assert ticker.seconds_until_next(3600) == 300
+
+    clock[0] = now + timedelta(minutes=11)
+    assert ticker.fire_due() == 1
+    assert fired == [("B", "SRC"), ("A", "SRC")]
+    assert ticker.next_due_at() is None
+    assert ticker.seconds_until_next(3600) == 3600
+
+
+def test_ticker_notification_reschedules_and_cancels(monkeypatch):
+    now = datetime(2025, 1, 1, 0, 0, 0)
+    clock = [now]
+    db = FakeDB({("A", "SRC"): ("완결", now + timedelta(hours=1))})
+    ticker, fired = _make_ticker(monkeypatch, db, clock)
+    ticker.reload()
+
+    # 관리자가 예약 시각을 앞당김: 옛 heap 항목은 무시되어야 함
+    db.overrides[("A", "SRC")] = ("완결", now + timedelta(minutes=1))
+    ticker.handle_notification('{"content_id": "A", "source": "SRC"}')
+    assert ticker.next_due_at() == now + timedelta(minutes=1)
+
+    # 새 예약 추가 후 A는 삭제
+    db.overrides[("B", "SRC")] = ("완결", now + timedelta(minutes=2))
+    ticker.handle_notification('{"content_id": "B", "source": "SRC"}')
+    del db.overrides[("A", "SRC")]
+    ticker.handle_notification('{"content_id": "A", "source": "SRC"}')
+    assert ticker.next_due_at() == now + timedelta(minutes=2)
+
+    clock[0] = now + timedelta(hours=2)
+    assert ticker.fire_due() == 1
+    assert fired == [("B", "SRC")]
+    assert ticker.next_due_at() is None
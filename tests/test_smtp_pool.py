@@ -0,0 +1,113 @@
+import smtplib
+import threading
+import time
+
+import pytest
+
+from services.smtp_pool import SmtpConnectionPool
+
+
+class FakeSMTP:
+    instances = []
+    lock = threading.Lock()
+
+    def __init__(self, host, port, timeout=None):
+        self.logged_in = False
+        self.tls = False
+        self.sent = []
+        self.closed = False
+        self.disconnect_next = False
+        with FakeSMTP.lock:
+            FakeSMTP.instances.append(self)
+
+    def starttls(self):
+        self.tls = True
+
+    def login(self, username, password):
+        self.logged_in = True
+
+    def sendmail(self, from_addr, to_addrs, message):
+        if self.disconnect_next:
+            self.disconnect_next = False
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        if to_addrs == "bad@example.com":
+            raise smtplib.SMTPRecipientsRefused({to_addrs: (550, b"no such user")})
+        time.sleep(0.005)
+        self.sent.append(to_addrs)
+        return {}
+
+    def noop(self):
+        return (250, b"OK")
+
+    def quit(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def reset_fake_smtp():
+    FakeSMTP.instances = []
+
+
+def _make_pool(**kwargs):
+    options = {"max_size": 2, "max_messages_per_session": 100, "smtp_factory": FakeSMTP}
+    options.update(kwargs)
+    return SmtpConnectionPool("smtp.example.com", 587, "user", "pw", **options)
+
+
+def test_sessions_are_reused_across_messages():
+    pool = _make_pool()
+    for i in range(10):
+        pool.sendmail("from@example.com", f"u{i}@example.com", "msg")
+
+    assert len(FakeSMTP.instances) == 1
+    session = FakeSMTP.instances[0]
+    assert session.tls and session.logged_in
+    assert len(session.sent) == 10
+    assert pool.stats()["messages_sent"] == 10
+
+
+def test_session_is_recycled_after_message_cap():
+    pool = _make_pool(max_messages_per_session=3)
+    for i in range(7):
+        pool.sendmail("from@example.com", f"u{i}@example.com", "msg")
+
+    assert [len(smtp.sent) for smtp in FakeSMTP.instances] == [3, 3, 1]
+    assert FakeSMTP.instances[0].closed and FakeSMTP.instances[1].closed
+
+
+def test_server_disconnect_reconnects_and_retries_once():
+    pool = _make_pool()
+    pool.sendmail("from@example.com", "a@example.com", "msg")
+    FakeSMTP.instances[0].disconnect_next = True
+
+    pool.sendmail("from@example.com", "b@example.com", "msg")
+
+    assert len(FakeSMTP.instances) == 2
+    assert FakeSMTP.instances[1].sent == ["b@example.com"]
+    assert pool.stats()["reconnects"] == 1
+
+
+def test_recipient_refusal_is_raised_but_session_kept():
+    pool = _make_pool()
+    with pytest.raises(smtplib.SMTPRecipientsRefused):
+        pool.sendmail("from@example.com", "bad@example.com", "msg")
+    pool.sendmail("from@example.com", "ok@example.com", "msg")
+
+    assert len(FakeSMTP.instances) == 1
+
+
+def test_parallel_senders_are_bounded_by_pool_size():
+    pool = _make_pool(max_size=3)
+    threads = [
+        threading.Thread(
+            target=lambda n=n: [pool.sendmail("f", f"u{n}-{i}@example.com", "m") for i in range(5)]
+        )
+        for n in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert 1 <= len(FakeSMTP.instances) <= 3
+    assert sum(len(smtp.sent) for smtp in FakeSMTP.instances) == 40
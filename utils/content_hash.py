@@ -0,0 +1,20 @@
+"""Content fingerprint helpers used to skip no-op writes during sync."""
+
+import hashlib
+import json
+
+
+def compute_content_hash(content_type, title, status, meta) -> str:
+    """Return a stable SHA-256 fingerprint for a ``contents`` row.
+
+    ``meta`` is serialized with sorted keys and compact separators so that
+    logically identical dicts always produce the same hash regardless of key
+    insertion order.
+    """
+    canonical = json.dumps(
+        [content_type, title, status, meta or {}],
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
@@ -0,0 +1,36 @@
+"""Opaque keyset cursors for paginated listing endpoints."""
+
+import base64
+import json
+
+CURSOR_PREFIX = "c1."
+
+
+def encode_cursor(key):
+    """Encode a keyset position (e.g. ``(title, source, content_id)``) as an opaque token."""
+    raw = json.dumps(list(key), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return CURSOR_PREFIX + base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token, size):
+    """Decode a token produced by :func:`encode_cursor`.
+
+    Args:
+        token: Cursor string from the client.
+        size: Expected number of key parts.
+
+    Returns:
+        tuple | None: The key parts, or ``None`` when ``token`` is not a valid cursor
+        (callers may then treat it as a legacy value such as a plain title).
+    """
+    if not token or not token.startswith(CURSOR_PREFIX):
+        return None
+    body = token[len(CURSOR_PREFIX):]
+    try:
+        raw = base64.urlsafe_b64decode(body + "=" * (-len(body) % 4))
+        key = json.loads(raw.decode("utf-8"))
+    except (ValueError, UnicodeDecodeError):
+        return None
+    if not isinstance(key, list) or len(key) != size or not all(isinstance(part, str) for part in key):
+        return None
+    return tuple(key)
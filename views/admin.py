@@ -3,7 +3,9 @@
 from flask import Blueprint, jsonify, request, g
 
 from database import get_db, get_cursor
-from services.admin_override_service import upsert_override_and_record_event
+from repositories.content_versions_repo import bump_content_data_version
+from services.admin_override_service import notify_override_changed, upsert_override_and_record_event
+from services.contents_cache import get_contents_cache
 from utils.auth import admin_required, login_required
 from utils.time import parse_iso_naive_kst
 
@@ -77,6 +79,9 @@ def upsert_content_override():
     if result.get('error') == 'CONTENT_NOT_FOUND':
         return _error_response(404, 'CONTENT_NOT_FOUND', 'Content not found')
 
+    # 이 프로세스는 버전 TTL을 기다리지 않고 바로 새 세대를 보도록 합니다.
+    get_contents_cache().invalidate_versions()
+
     return jsonify(
         {
             'success': True,
@@ -141,7 +146,10 @@ def delete_content_override():
         "DELETE FROM admin_content_overrides WHERE content_id = %s AND source = %s",
         (content_id, source),
     )
+    notify_override_changed(cursor, content_id, source)
+    bump_content_data_version(conn, source)
     conn.commit()
     cursor.close()
+    get_contents_cache().invalidate_versions()
 
     return jsonify({'success': True})
@@ -1,18 +1,88 @@
 # views/contents.py
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, jsonify, request
+import config
 from database import get_db, get_cursor
+from repositories.content_counts_repo import load_status_total
+from services.content_projection import build_select_list, parse_projection, shape_row, with_fields
+from services.contents_cache import get_contents_cache
+from services.ongoing_contents_service import (
+    ALL_DAYS,
+    WEEKDAY_KEYS,
+    build_ongoing_body,
+    encode_body,
+    load_ongoing_contents,
+    select_day,
+    serialize_body,
+    supported_encodings,
+)
+from utils.pagination import decode_cursor, encode_cursor
+import functools
+import hashlib
 import math
 import json
 
 contents_bp = Blueprint('contents', __name__)
 
+
+def _error_response(status_code: int, code: str, message: str):
+    return jsonify({'success': False, 'error': {'code': code, 'message': message}}), status_code
+
+
+def _projection_from_request():
+    """view=card|full, fields=a,b,... 파라미터를 해석합니다 (잘못된 값이면 ValueError)."""
+    return parse_projection(request.args.get('view'), request.args.get('fields'))
+
+
+def _data_version_etag(vary_encoding):
+    """요청 경로·쿼리와 source 범위의 데이터 세대로 강한 ETag를 만듭니다 (contents 테이블은 읽지 않음)."""
+    source = request.args.get('source', 'all')
+    generation = get_contents_cache().generation(source, get_db)
+    parts = [request.path, sorted(request.args.items(multi=True)), generation]
+    if vary_encoding:
+        # 압축 표현마다 바이트가 다르므로 강한 ETag도 달라야 합니다.
+        parts.append(_negotiate_encoding())
+    return hashlib.sha256(json.dumps(parts, ensure_ascii=False).encode('utf-8')).hexdigest()[:32]
+
+
+def data_versioned(vary_encoding=False):
+    """
+    공개 콘텐츠 API에 데이터 버전 기반 ETag를 붙입니다.
+
+    If-None-Match가 현재 ETag와 같으면 뷰를 실행하지 않고(콘텐츠 조회 없이) 304를 반환합니다.
+    데이터 버전은 크롤러 커밋과 관리자 override 변경 시 올라갑니다.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            etag = _data_version_etag(vary_encoding)
+            if request.if_none_match.contains_weak(etag):
+                response = current_app.response_class(status=304)
+            else:
+                response = current_app.make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag)
+            # 브라우저 캐시도 매번 재검증하도록 (재검증 자체는 304로 저렴함)
+            response.headers['Cache-Control'] = 'no-cache'
+            if vary_encoding:
+                response.vary.add('Accept-Encoding')
+            return response
+        return wrapper
+    return decorator
+
+
 @contents_bp.route('/api/contents/search', methods=['GET'])
+@data_versioned()
 def search_contents():
     """전체 DB에서 콘텐츠 제목을 검색하여 결과를 반환합니다."""
     query = request.args.get('q', '').strip()
     content_type = request.args.get('type', 'webtoon')
     source = request.args.get('source', 'all')
+    try:
+        _, fields = _projection_from_request()
+    except ValueError as e:
+        return _error_response(400, 'INVALID_REQUEST', str(e))
 
     if not query:
         return jsonify([])
@@ -20,8 +90,8 @@ def search_contents():
     conn = get_db()
     cursor = get_cursor(conn)
 
-    base_query = """
-        SELECT content_id, title, status, meta, source
+    base_query = f"""
+        SELECT {build_select_list(fields)}
         FROM contents
         WHERE title %% %s AND content_type = %s
     """
@@ -35,138 +105,158 @@ def search_contents():
 
     cursor.execute(base_query, tuple(params))
 
-    results = [
-        {**row, 'meta': row['meta'] or {}}
-        for row in cursor.fetchall()
-    ]
+    results = [shape_row(row) for row in cursor.fetchall()]
     cursor.close()
     return jsonify(results)
 
 
 @contents_bp.route('/api/contents/ongoing', methods=['GET'])
+@data_versioned(vary_encoding=True)
 def get_ongoing_contents():
-    """요일별 연재중인 콘텐츠 목록을 그룹화하여 반환합니다."""
+    """
+    요일별 연재중인 콘텐츠 목록을 그룹화하여 반환합니다.
+
+    day=mon..sun|daily를 주면 해당 요일 목록만 반환하고, view=card나 fields=로 필드를 줄일 수 있습니다.
+    크롤 종료 시 미리 만들어 둔 직렬화·압축 스냅샷을 Accept-Encoding에 맞춰 그대로 내려보냅니다.
+    """
     content_type = request.args.get('type', 'webtoon')
     source = request.args.get('source', 'all')
-
-    conn = get_db()
-    cursor = get_cursor(conn)
-
-    base_query = "SELECT content_id, title, status, meta, source FROM contents WHERE content_type = %s AND (status = '연재중' OR status = '휴재')"
-    params = [content_type]
-
-    if source != 'all':
-        base_query += " AND source = %s"
-        params.append(source)
-
-    cursor.execute(base_query, tuple(params))
-
-    all_contents = [
-        {**row, 'meta': row['meta'] or {}}
-        for row in cursor.fetchall()
-    ]
-    cursor.close()
-
-    # 콘텐츠 타입에 따라 분기
-    if content_type in ['webtoon', 'novel']:
-        # 웹툰/웹소설인 경우, 요일별로 그룹화
-        grouped_by_day = { 'mon': [], 'tue': [], 'wed': [], 'thu': [], 'fri': [], 'sat': [], 'sun': [], 'daily': [] }
-        for content in all_contents:
-            # 변경된 meta 구조에 맞게 'attributes'에서 'weekdays'를 가져옴
-            day_list = content.get('meta', {}).get('attributes', {}).get('weekdays', [])
-            # 만약 weekdays가 없으면 'daily'나 기타로 분류할 수도 있음
-            if not day_list:
-                # Fallback: or check raw meta if needed
-                pass
-
-            for day_eng in day_list:
-                if day_eng in grouped_by_day:
-                    grouped_by_day[day_eng].append(content)
-        return jsonify(grouped_by_day)
+    weekday = request.args.get('day', ALL_DAYS)
+
+    if weekday != ALL_DAYS and weekday not in WEEKDAY_KEYS:
+        return _error_response(400, 'INVALID_REQUEST', 'day must be one of mon..sun, daily')
+    try:
+        projection, fields = _projection_from_request()
+    except ValueError as e:
+        return _error_response(400, 'INVALID_REQUEST', str(e))
+
+    encoding = _negotiate_encoding()
+
+    if config.CONTENTS_CACHE_ENABLED:
+        # 크롤러 커밋 시 올라가는 소스별 데이터 버전으로 무효화되는 응답 캐시
+        payload = get_contents_cache().get_or_build(
+            (content_type, source, weekday, projection, encoding),
+            source,
+            get_db,
+            lambda generation: build_ongoing_body(
+                get_db(), content_type, source, weekday, projection, fields, encoding, generation
+            ),
+        )
     else:
-        # 다른 콘텐츠 타입(OTT, Series)의 경우, 그룹화하지 않고 목록 그대로 반환
-        return jsonify(all_contents)
+        payload = encode_body(
+            serialize_body(select_day(load_ongoing_contents(get_db(), content_type, source, fields), weekday)),
+            encoding,
+            level=config.CONTENTS_DYNAMIC_COMPRESSION_LEVEL,
+        )
+
+    response = current_app.response_class(payload, mimetype='application/json')
+    if encoding != 'identity':
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+def _negotiate_encoding():
+    """클라이언트가 받을 수 있는 encoding 중 서버 선호 순으로 하나를 고릅니다."""
+    for encoding in supported_encodings():
+        if request.accept_encodings[encoding] > 0:
+            return encoding
+    return 'identity'
+
+
+def _page_size_from_request():
+    raw = request.args.get('per_page')
+    if raw is None:
+        return config.CONTENTS_PAGE_SIZE_DEFAULT
+    try:
+        per_page = int(raw)
+    except ValueError:
+        raise ValueError('per_page must be an integer')
+    return max(1, min(per_page, config.CONTENTS_PAGE_SIZE_MAX))
+
+
+def _list_contents_by_status(status):
+    """
+    status별 콘텐츠를 (title, source, content_id) keyset으로 페이지네이션합니다.
 
-@contents_bp.route('/api/contents/hiatus', methods=['GET'])
-def get_hiatus_contents():
-    """[페이지네이션] 휴재중인 콘텐츠 전체 목록을 페이지별로 반환합니다."""
-    last_title = request.args.get('last_title')
-    per_page = 100
+    - cursor: 이전 응답의 next_cursor (불투명 토큰). 제목이 같은 콘텐츠도 건너뛰지 않습니다.
+    - last_title: 구 클라이언트 호환. next_cursor 토큰을 그대로 넘기면 cursor로, 일반 제목이면 예전처럼 title > last_title로 처리합니다.
+    - per_page: 페이지 크기 (기본 CONTENTS_PAGE_SIZE_DEFAULT, 최대 CONTENTS_PAGE_SIZE_MAX)
+    - include_total=1: content_status_counts에서 읽은 전체 개수를 함께 반환합니다.
+    """
     content_type = request.args.get('type', 'webtoon')
     source = request.args.get('source', 'all')
+    cursor_token = request.args.get('cursor')
+    last_title = request.args.get('last_title')
+    include_total = request.args.get('include_total', '').lower() in ('1', 'true', 'yes')
+    try:
+        _, fields = _projection_from_request()
+        per_page = _page_size_from_request()
+    except ValueError as e:
+        return _error_response(400, 'INVALID_REQUEST', str(e))
+
+    after_key = decode_cursor(cursor_token or last_title, 3)
+    if cursor_token and after_key is None:
+        return _error_response(400, 'INVALID_REQUEST', 'cursor is invalid')
 
     conn = get_db()
     cursor = get_cursor(conn)
 
-    query_params = [content_type]
-    where_clause = "WHERE status = '휴재' AND content_type = %s"
+    query_params = [status, content_type]
+    where_clause = "WHERE status = %s AND content_type = %s"
 
     if source != 'all':
         where_clause += " AND source = %s"
         query_params.append(source)
 
-    if last_title:
+    if after_key is not None:
+        after_title, after_source, after_content_id = after_key
+        if source != 'all' and after_source == source:
+            # source가 고정되면 (title, content_id) 비교와 같고, 이 형태여야
+            # (status, content_type, source, title, content_id) 인덱스의 조건으로 그대로 쓰입니다.
+            where_clause += " AND (title, content_id) > (%s, %s)"
+            query_params.extend((after_title, after_content_id))
+        else:
+            where_clause += " AND (title, source, content_id) > (%s, %s, %s)"
+            query_params.extend(after_key)
+    elif last_title:
         where_clause += " AND title > %s"
         query_params.append(last_title)
 
+    # 다음 페이지 존재 여부를 알기 위해 한 건 더 읽습니다. 커서 키(title)는 투영과 무관하게 포함합니다.
     cursor.execute(
-        f"SELECT content_id, title, status, meta, source FROM contents {where_clause} ORDER BY title ASC LIMIT %s",
-        (*query_params, per_page)
+        f"SELECT {build_select_list(with_fields(fields, 'title'))} FROM contents {where_clause} "
+        "ORDER BY title ASC, source ASC, content_id ASC LIMIT %s",
+        (*query_params, per_page + 1)
     )
-
-    results = [
-        {**row, 'meta': row['meta'] or {}}
-        for row in cursor.fetchall()
-    ]
+    rows = cursor.fetchall()
     cursor.close()
 
+    results = [shape_row(row) for row in rows[:per_page]]
+
     next_cursor = None
-    if len(results) == per_page:
-        next_cursor = results[-1]['title']
+    if len(rows) > per_page:
+        last = results[-1]
+        next_cursor = encode_cursor((last['title'], last['source'], last['content_id']))
 
-    return jsonify({
+    body = {
         'contents': results,
         'next_cursor': next_cursor
-    })
-
-@contents_bp.route('/api/contents/completed', methods=['GET'])
-def get_completed_contents():
-    """[페이지네이션] 완결된 콘텐츠 전체 목록을 페이지별로 반환합니다."""
-    last_title = request.args.get('last_title')
-    per_page = 100
-    content_type = request.args.get('type', 'webtoon')
-    source = request.args.get('source', 'all')
-
-    conn = get_db()
-    cursor = get_cursor(conn)
-
-    query_params = [content_type]
-    where_clause = "WHERE status = '완결' AND content_type = %s"
-
-    if source != 'all':
-        where_clause += " AND source = %s"
-        query_params.append(source)
+    }
+    if include_total:
+        body['total'] = load_status_total(conn, content_type, status, source)
+    return jsonify(body)
 
-    if last_title:
-        where_clause += " AND title > %s"
-        query_params.append(last_title)
 
-    cursor.execute(
-        f"SELECT content_id, title, status, meta, source FROM contents {where_clause} ORDER BY title ASC LIMIT %s",
-        (*query_params, per_page)
-    )
-
-    results = [
-        {**row, 'meta': row['meta'] or {}}
-        for row in cursor.fetchall()
-    ]
-    cursor.close()
+@contents_bp.route('/api/contents/hiatus', methods=['GET'])
+@data_versioned()
+def get_hiatus_contents():
+    """[페이지네이션] 휴재중인 콘텐츠 전체 목록을 페이지별로 반환합니다."""
+    return _list_contents_by_status('휴재')
 
-    next_cursor = None
-    if len(results) == per_page:
-        next_cursor = results[-1]['title']
 
-    return jsonify({
-        'contents': results,
-        'next_cursor': next_cursor
-    })
+@contents_bp.route('/api/contents/completed', methods=['GET'])
+@data_versioned()
+def get_completed_contents():
+    """[페이지네이션] 완결된 콘텐츠 전체 목록을 페이지별로 반환합니다."""
+    return _list_contents_by_status('완결')
@@ -1,7 +1,7 @@
 # views/status.py
 
 from flask import Blueprint, jsonify
-from database import get_db, get_cursor
+from database import get_db, get_cursor, get_pool_stats
 
 status_bp = Blueprint('status', __name__)
 
@@ -19,7 +19,8 @@ def get_status():
 
         return jsonify({
             'status': 'ok',
-            'content_count': content_count
+            'content_count': content_count,
+            'db_pool': get_pool_stats(),
         })
     except Exception as e:
         return jsonify({